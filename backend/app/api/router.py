@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.routes import auth, users, movies, cinemas, showtimes, seats, bookings
+from app.api.v1.routes import auth, users, movies, cinemas, showtimes, seats, bookings, listings, reviews, watchlist, promo_codes, admin
 
 api_router = APIRouter(prefix="/api/v1")
 
@@ -10,3 +10,8 @@ api_router.include_router(cinemas.router)
 api_router.include_router(showtimes.router)
 api_router.include_router(seats.router)
 api_router.include_router(bookings.router)
+api_router.include_router(listings.router)
+api_router.include_router(reviews.router)
+api_router.include_router(watchlist.router)
+api_router.include_router(promo_codes.router)
+api_router.include_router(admin.router)
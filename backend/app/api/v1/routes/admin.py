@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from datetime import datetime
+from app.api.v1.dependencies import get_current_admin_user
+from app.models.domain.user import User
+from app.db.session import get_db
+from app.db.slow_query_log import slow_query_log
+from app.services.booking_service import BookingService
+from app.services.outbox_service import outbox_dispatcher
+from app.services.review_service import ReviewService
+from app.services.showtime_service import ShowtimeService
+from app.models.schemas.booking_schema import BookingExpiryResult
+from app.models.schemas.review_schema import RatingRecomputeResult
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/slow-queries")
+def get_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_admin_user)
+):
+    return {
+        "threshold_ms": slow_query_log.threshold * 1000,
+        "explain": slow_query_log.explain,
+        "queries": slow_query_log.recent(limit)
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(current_user: User = Depends(get_current_admin_user)):
+    slow_query_log.clear()
+
+
+@router.post("/showtimes/reconcile-seats")
+def reconcile_available_seats(
+    since: datetime = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    showtime_service = ShowtimeService(db)
+    return showtime_service.reconcile_available_seats(since)
+
+
+@router.post("/reviews/recompute-ratings", response_model=RatingRecomputeResult)
+def recompute_rating_aggregates(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    review_service = ReviewService(db)
+    return review_service.recompute_rating_aggregates()
+
+
+@router.post("/bookings/expire-pending", response_model=BookingExpiryResult)
+def expire_pending_bookings(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    booking_service = BookingService(db)
+    return booking_service.expire_pending_bookings()
+
+
+@router.get("/outbox")
+def get_outbox_backlog(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    return outbox_dispatcher.backlog(db)
+
+
+@router.post("/outbox/dispatch")
+def dispatch_outbox(current_user: User = Depends(get_current_admin_user)):
+    return outbox_dispatcher.run_once()
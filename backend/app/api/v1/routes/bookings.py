@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.services.booking_service import BookingService, TicketService
@@ -6,7 +6,9 @@ from app.api.v1.dependencies import get_current_user, get_current_admin_user
 from app.models.domain.user import User
 from app.models.domain.booking import BookingStatus, PaymentStatus
 from app.models.schemas.booking_schema import (
-    BookingCreate, BookingUpdate, BookingResponse, TicketResponse
+    BookingCreate, BookingUpdate, BookingResponse, TicketResponse,
+    BookingQuoteRequest, BookingQuote, TicketScanRequest, TicketScanBatch,
+    TicketScanResponse, TicketScanBatchResponse, BookingCancellationResult
 )
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
@@ -42,6 +44,26 @@ def get_my_bookings(
     return bookings
 
 
+@router.post("/quote", response_model=BookingQuote)
+def quote_booking(
+    quote_request: BookingQuoteRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    booking_service = BookingService(db)
+    
+    try:
+        return booking_service.quote_booking(
+            quote_request.showtime_id, quote_request.seat_ids,
+            quote_request.promo_code, quote_request.promo_code_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get("/{booking_id}", response_model=BookingResponse)
 def get_booking(
     booking_id: int,
@@ -91,7 +113,14 @@ def update_booking_status(
     current_user: User = Depends(get_current_admin_user)
 ):
     booking_service = BookingService(db)
-    booking = booking_service.update_booking_status(booking_id, booking_status)
+    
+    try:
+        booking = booking_service.update_booking_status(booking_id, booking_status)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     if not booking:
         raise HTTPException(
@@ -111,7 +140,14 @@ def update_payment_status(
     current_user: User = Depends(get_current_admin_user)
 ):
     booking_service = BookingService(db)
-    booking = booking_service.update_payment_status(booking_id, payment_status, stripe_payment_id)
+    
+    try:
+        booking = booking_service.update_payment_status(booking_id, payment_status, stripe_payment_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     
     if not booking:
         raise HTTPException(
@@ -144,7 +180,14 @@ def update_booking(
             detail="Not authorized to update this booking"
         )
     
-    updated_booking = booking_service.update_booking(booking_id, booking_update)
+    try:
+        updated_booking = booking_service.update_booking(booking_id, booking_update)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
     return updated_booking
 
 
@@ -173,6 +216,16 @@ def cancel_booking(
     return cancelled_booking
 
 
+@router.post("/showtime/{showtime_id}/cancel", response_model=BookingCancellationResult)
+def cancel_showtime_bookings(
+    showtime_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    booking_service = BookingService(db)
+    return booking_service.cancel_showtime_bookings(showtime_id)
+
+
 @router.delete("/{booking_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_booking(
     booking_id: int,
@@ -214,6 +267,63 @@ def get_booking_tickets(
     return tickets
 
 
+@router.get("/tickets/{ticket_id}/qr", response_class=Response)
+def get_ticket_qr(
+    ticket_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    ticket_service = TicketService(db)
+    ticket = ticket_service.get_ticket(ticket_id)
+    booking = BookingService(db).get_booking(ticket.booking_id) if ticket else None
+    
+    if not booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+    
+    if booking.user_id != current_user.id and current_user.role.value != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this ticket"
+        )
+    
+    try:
+        image = ticket_service.get_qr_image(ticket, booking)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    
+    return Response(
+        content=image,
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=86400"}
+    )
+
+
+@router.post("/tickets/scan", response_model=TicketScanResponse)
+def scan_ticket(
+    scan: TicketScanRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    ticket_service = TicketService(db)
+    return ticket_service.scan_tickets([(scan.payload, scan.scanned_at)], scan.showtime_id)["results"][0]
+
+
+@router.post("/tickets/scan/batch", response_model=TicketScanBatchResponse)
+def scan_tickets(
+    batch: TicketScanBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    ticket_service = TicketService(db)
+    return ticket_service.scan_tickets([(scan.payload, scan.scanned_at) for scan in batch.scans], batch.showtime_id)
+
+
 @router.put("/tickets/{ticket_id}/mark-used", response_model=TicketResponse)
 def mark_ticket_used(
     ticket_id: int,
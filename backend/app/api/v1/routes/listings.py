@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.orm import Session
+from datetime import date
+import gzip
+from app.db.session import get_db
+from app.services.listings_service import ListingsService
+from app.models.schemas.listing_schema import ListingsResponse
+
+router = APIRouter(prefix="/listings", tags=["listings"])
+
+
+@router.get("", response_model=ListingsResponse)
+def get_listings(
+    request: Request,
+    city: str = Query(..., min_length=1, max_length=100),
+    day: date = Query(..., alias="date"),
+    db: Session = Depends(get_db)
+):
+    listings_service = ListingsService(db)
+    body, etag = listings_service.get_listings_snapshot(city, day).encoded()
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+    else:
+        body = gzip.decompress(body)
+    return Response(content=body, media_type="application/json", headers=headers)
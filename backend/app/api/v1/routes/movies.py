@@ -1,38 +1,94 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
 from app.db.session import get_db
 from app.services.movie_service import MovieService
 from app.api.v1.dependencies import get_current_user, get_current_admin_user
 from app.models.domain.user import User
 from app.models.domain.movie import MovieStatus
-from app.models.schemas.movie_schema import MovieCreate, MovieUpdate, MovieResponse
+from app.models.schemas.movie_schema import (
+    MovieCreate, MovieUpdate, MovieResponse, MovieSuggestion,
+    MovieFilters, MovieBrowseResponse, FacetCount
+)
+from app.core.rate_limiter import get_rate_limit_key, RATE_LIMITS
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
 
+def get_movie_filters(
+    search: Optional[str] = Query(None),
+    cast: Optional[str] = Query(None),
+    status: List[MovieStatus] = Query([]),
+    genre: List[str] = Query([]),
+    language: List[str] = Query([]),
+    age_restriction: List[str] = Query([]),
+    release_date_from: Optional[date] = Query(None),
+    release_date_to: Optional[date] = Query(None),
+    min_rating: Optional[float] = Query(None, ge=0.0, le=10.0),
+    max_rating: Optional[float] = Query(None, ge=0.0, le=10.0)
+) -> MovieFilters:
+    return MovieFilters(
+        search=search,
+        cast=cast,
+        status=status,
+        genre=genre,
+        language=language,
+        age_restriction=age_restriction,
+        release_date_from=release_date_from,
+        release_date_to=release_date_to,
+        min_rating=min_rating,
+        max_rating=max_rating
+    )
+
+
 @router.get("", response_model=list[MovieResponse])
 def get_movies(
-    status: MovieStatus = Query(None),
-    genre: str = Query(None),
-    search: str = Query(None),
+    filters: MovieFilters = Depends(get_movie_filters),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
     movie_service = MovieService(db)
     
-    if search:
-        movies = movie_service.search_movies(search, skip, limit)
-    elif status:
-        movies = movie_service.get_movies_by_status(status, skip, limit)
-    elif genre:
-        movies = movie_service.search_by_genre(genre, skip, limit)
-    else:
-        movies = movie_service.get_active_movies(skip, limit)
+    try:
+        movies, _, _ = movie_service.filter_movies(filters, skip, limit, with_facets=False)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     return movies
 
 
+@router.get("/browse", response_model=MovieBrowseResponse)
+def browse_movies(
+    filters: MovieFilters = Depends(get_movie_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    movie_service = MovieService(db)
+    
+    try:
+        movies, total, facets = movie_service.filter_movies(filters, skip, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return {
+        "total": total,
+        "items": movies,
+        "facets": {
+            field: [{"value": value, "count": count} for value, count in counts]
+            for field, counts in facets.items()
+        }
+    }
+
+
 @router.get("/now-playing", response_model=list[MovieResponse])
 def get_now_playing_movies(
     skip: int = Query(0, ge=0),
@@ -53,6 +109,26 @@ def get_coming_soon_movies(
     return movie_service.get_movies_by_status(MovieStatus.COMING_SOON, skip, limit)
 
 
+@router.get("/genres", response_model=list[FacetCount])
+def get_genres(db: Session = Depends(get_db)):
+    movie_service = MovieService(db)
+    return [{"value": genre, "count": count} for genre, count in movie_service.list_genres()]
+
+
+@router.get("/suggest", response_model=list[MovieSuggestion])
+def suggest_movies(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+    db: Session = Depends(get_db),
+    rate_limit_key: str = Depends(get_rate_limit_key(**RATE_LIMITS["suggest"]))
+):
+    movie_service = MovieService(db)
+    return [
+        {"id": movie_id, "title": title}
+        for movie_id, title in movie_service.suggest_titles(q, limit)
+    ]
+
+
 @router.get("/{movie_id}", response_model=MovieResponse)
 def get_movie(movie_id: int, db: Session = Depends(get_db)):
     movie_service = MovieService(db)
@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from app.db.session import get_db
+from app.services.promo_code_service import PromoCodeService
+from app.api.v1.dependencies import get_current_user, get_current_admin_user
+from app.models.domain.user import User
+from app.models.schemas.promo_code_schema import (
+    PromoCodeCreate, PromoCodeUpdate, PromoCodeResponse, PromoCodeValidate, PromoCodeQuote
+)
+
+router = APIRouter(prefix="/promo-codes", tags=["promo-codes"])
+
+
+@router.get("", response_model=list[PromoCodeResponse])
+def get_promo_codes(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    promo_code_service = PromoCodeService(db)
+    return promo_code_service.get_all_promo_codes(skip, limit)
+
+
+@router.post("/validate", response_model=PromoCodeQuote)
+def validate_promo_code(
+    promo_validate: PromoCodeValidate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    promo_code_service = PromoCodeService(db)
+
+    try:
+        promo, discount_amount = promo_code_service.resolve(promo_validate.amount, promo_validate.code)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return {
+        "promo_code_id": promo.id,
+        "code": promo.code,
+        "discount_type": promo.discount_type,
+        "discount_amount": discount_amount,
+        "total_after_discount": round(promo_validate.amount - discount_amount, 2),
+    }
+
+
+@router.get("/{promo_code_id}", response_model=PromoCodeResponse)
+def get_promo_code(
+    promo_code_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    promo_code_service = PromoCodeService(db)
+    promo = promo_code_service.get_promo_code(promo_code_id)
+
+    if not promo:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Promo code not found"
+        )
+
+    return promo
+
+
+@router.post("", response_model=PromoCodeResponse, status_code=status.HTTP_201_CREATED)
+def create_promo_code(
+    promo_create: PromoCodeCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    promo_code_service = PromoCodeService(db)
+
+    try:
+        promo = promo_code_service.create_promo_code(promo_create)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return promo
+
+
+@router.put("/{promo_code_id}", response_model=PromoCodeResponse)
+def update_promo_code(
+    promo_code_id: int,
+    promo_update: PromoCodeUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    promo_code_service = PromoCodeService(db)
+    promo = promo_code_service.update_promo_code(promo_code_id, promo_update)
+
+    if not promo:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Promo code not found"
+        )
+
+    return promo
+
+
+@router.delete("/{promo_code_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_promo_code(
+    promo_code_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    promo_code_service = PromoCodeService(db)
+
+    if not promo_code_service.delete_promo_code(promo_code_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Promo code not found"
+        )
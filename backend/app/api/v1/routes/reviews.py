@@ -0,0 +1,175 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+from app.db.session import get_db
+from app.services.review_service import ReviewService
+from app.api.v1.dependencies import get_current_user, get_current_admin_user
+from app.models.domain.user import User
+from app.models.schemas.review_schema import (
+    ReviewCreate, ReviewUpdate, ReviewResponse, MovieRatingResponse,
+    ModerationQueueResponse, BulkModerationRequest, BulkModerationResult
+)
+
+router = APIRouter(prefix="/reviews", tags=["reviews"])
+
+
+@router.get("/my-reviews", response_model=list[ReviewResponse])
+def get_my_reviews(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    review_service = ReviewService(db)
+    return review_service.get_user_reviews(current_user.id, skip, limit)
+
+
+@router.get("/pending", response_model=ModerationQueueResponse)
+def get_moderation_queue(
+    after: int = Query(None, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    review_service = ReviewService(db)
+    return review_service.get_moderation_queue(after, limit)
+
+
+@router.post("/moderate", response_model=BulkModerationResult)
+def moderate_reviews(
+    moderation: BulkModerationRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    review_service = ReviewService(db)
+    return review_service.bulk_moderate(moderation.review_ids, moderation.approve)
+
+
+@router.get("/ratings", response_model=list[MovieRatingResponse])
+def get_movie_ratings(
+    movie_ids: List[int] = Query(..., alias="movie_id", max_length=100),
+    db: Session = Depends(get_db)
+):
+    review_service = ReviewService(db)
+    return review_service.get_movie_ratings(list(dict.fromkeys(movie_ids)))
+
+
+@router.get("/movie/{movie_id}", response_model=list[ReviewResponse])
+def get_movie_reviews(
+    movie_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    review_service = ReviewService(db)
+    return review_service.get_movie_reviews(movie_id, skip, limit)
+
+
+@router.get("/movie/{movie_id}/rating", response_model=MovieRatingResponse)
+def get_movie_rating(movie_id: int, db: Session = Depends(get_db)):
+    review_service = ReviewService(db)
+    return review_service.get_movie_rating(movie_id)
+
+
+@router.post("", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
+def create_review(
+    review_create: ReviewCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    review_service = ReviewService(db)
+
+    try:
+        review = review_service.create_review(current_user.id, review_create)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return review
+
+
+@router.put("/{review_id}", response_model=ReviewResponse)
+def update_review(
+    review_id: int,
+    review_update: ReviewUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    review_service = ReviewService(db)
+    review = review_service.get_review(review_id)
+
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+
+    if review.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this review"
+        )
+
+    return review_service.update_review(review_id, review_update)
+
+
+@router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_review(
+    review_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    review_service = ReviewService(db)
+    review = review_service.get_review(review_id)
+
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+
+    if review.user_id != current_user.id and current_user.role.value != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this review"
+        )
+
+    review_service.delete_review(review_id)
+
+
+@router.post("/{review_id}/approve", response_model=ReviewResponse)
+def approve_review(
+    review_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    review_service = ReviewService(db)
+    review = review_service.moderate_review(review_id, True)
+
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+
+    return review
+
+
+@router.post("/{review_id}/reject", response_model=ReviewResponse)
+def reject_review(
+    review_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    review_service = ReviewService(db)
+    review = review_service.moderate_review(review_id, False)
+
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+
+    return review
@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime
-from app.db.session import get_db
-from app.services.showtime_service import ShowtimeService
+from datetime import date
+import json
+from app.db.session import SessionLocal, get_db
+from app.services.showtime_service import ShowtimeService, ShowtimeConflictError, ScheduleImportError
 from app.api.v1.dependencies import get_current_user, get_current_admin_user
 from app.models.domain.user import User
-from app.models.schemas.showtime_schema import ShowtimeCreate, ShowtimeUpdate, ShowtimeResponse
+from app.models.schemas.showtime_schema import (
+    ShowtimeCreate, ShowtimeUpdate, ShowtimeResponse,
+    BulkScheduleCreate, ScheduleImportResult
+)
+from app.utils.schedule_file import parse_schedule_file
 
 router = APIRouter(prefix="/showtimes", tags=["showtimes"])
 
@@ -36,15 +44,48 @@ def get_showtimes(
 @router.get("/movie/{movie_id}/upcoming", response_model=list[ShowtimeResponse])
 def get_upcoming_showtimes(
     movie_id: int,
+    days: int = Query(None, ge=1, le=366),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
     showtime_service = ShowtimeService(db)
-    showtimes = showtime_service.get_upcoming_showtimes(movie_id, skip, limit)
+    showtimes = showtime_service.get_upcoming_showtimes(movie_id, skip, limit, days)
     return showtimes
 
 
+def _stream_showtime_days(start_date: date, end_date: date, city: str, cinema_id: int, movie_id: int):
+    db = SessionLocal()
+    try:
+        showtime_service = ShowtimeService(db)
+        for day in showtime_service.iter_showtime_days(start_date, end_date, city, cinema_id, movie_id):
+            yield json.dumps(day, separators=(",", ":")) + "\n"
+    finally:
+        db.close()
+
+
+@router.get("/window")
+def get_showtime_window(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    city: str = Query(None, min_length=1),
+    cinema_id: int = Query(None),
+    movie_id: int = Query(None)
+):
+    try:
+        ShowtimeService.showtime_window(start_date, end_date, city, cinema_id, movie_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return StreamingResponse(
+        _stream_showtime_days(start_date, end_date, city, cinema_id, movie_id),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/{showtime_id}", response_model=ShowtimeResponse)
 def get_showtime(showtime_id: int, db: Session = Depends(get_db)):
     showtime_service = ShowtimeService(db)
@@ -66,10 +107,72 @@ def create_showtime(
     current_user: User = Depends(get_current_admin_user)
 ):
     showtime_service = ShowtimeService(db)
-    showtime = showtime_service.create_showtime(showtime_create)
+    
+    try:
+        showtime = showtime_service.create_showtime(showtime_create)
+    except ShowtimeConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
     return showtime
 
 
+@router.post("/bulk", response_model=ScheduleImportResult, status_code=status.HTTP_201_CREATED)
+def create_showtimes_bulk(
+    bulk: BulkScheduleCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    showtime_service = ShowtimeService(db)
+    
+    try:
+        rows = showtime_service.generate_schedule(bulk)
+        return showtime_service.import_showtimes(rows, bulk.skip_conflicts, bulk.dry_run)
+    except ScheduleImportError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=jsonable_encoder(e.result)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/import", response_model=ScheduleImportResult, status_code=status.HTTP_201_CREATED)
+async def import_showtimes(
+    file: UploadFile = File(...),
+    skip_conflicts: bool = Query(False),
+    dry_run: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    content = await file.read()
+    showtime_service = ShowtimeService(db)
+    
+    try:
+        rows = await run_in_threadpool(parse_schedule_file, content.decode("utf-8-sig"), file.filename or "")
+        return await run_in_threadpool(showtime_service.import_showtimes, rows, skip_conflicts, dry_run)
+    except ScheduleImportError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=jsonable_encoder(e.result)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.put("/{showtime_id}", response_model=ShowtimeResponse)
 def update_showtime(
     showtime_id: int,
@@ -78,7 +181,19 @@ def update_showtime(
     current_user: User = Depends(get_current_admin_user)
 ):
     showtime_service = ShowtimeService(db)
-    showtime = showtime_service.update_showtime(showtime_id, showtime_update)
+    
+    try:
+        showtime = showtime_service.update_showtime(showtime_id, showtime_update)
+    except ShowtimeConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     if not showtime:
         raise HTTPException(
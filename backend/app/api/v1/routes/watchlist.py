@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+from app.db.session import get_db
+from app.services.watchlist_service import WatchlistService
+from app.api.v1.dependencies import get_current_user
+from app.models.domain.user import User
+from app.models.schemas.watchlist_schema import (
+    WatchlistCreate, WatchlistResponse, WatchlistMembershipResponse
+)
+
+router = APIRouter(prefix="/watchlist", tags=["watchlist"])
+
+
+@router.get("", response_model=list[WatchlistResponse])
+def get_watchlist(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    watchlist_service = WatchlistService(db)
+    return watchlist_service.get_watchlist(current_user.id, skip, limit)
+
+
+@router.get("/contains", response_model=WatchlistMembershipResponse)
+def get_watchlist_membership(
+    movie_ids: List[int] = Query(..., alias="movie_id", max_length=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    watchlist_service = WatchlistService(db)
+    return {"movie_ids": watchlist_service.filter_members(current_user.id, movie_ids)}
+
+
+@router.post("", response_model=WatchlistResponse, status_code=status.HTTP_201_CREATED)
+def add_to_watchlist(
+    watchlist_create: WatchlistCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    watchlist_service = WatchlistService(db)
+
+    try:
+        entry = watchlist_service.add_movie(current_user.id, watchlist_create.movie_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return entry
+
+
+@router.delete("/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_from_watchlist(
+    movie_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    watchlist_service = WatchlistService(db)
+
+    if not watchlist_service.remove_movie(current_user.id, movie_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Movie not in watchlist"
+        )
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import os
 
 
@@ -25,6 +25,72 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     FRONTEND_URL: str = "http://localhost:3000"
     
+    USER_AGENT_CACHE_SIZE: int = 4096
+    METRICS_ENABLED: bool = True
+    QUERY_BUDGET_MODE: str = "log"
+    QUERY_REPEAT_THRESHOLD: int = 5
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_LOG_SIZE: int = 100
+    SLOW_QUERY_EXPLAIN: bool = False
+    
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATE: float = 0.01
+    TRACING_EXPORTER: str = "file"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    
+    SEARCH_BACKEND: str = "auto"
+    MOVIE_CATALOG_CHECK_SECONDS: float = 5.0
+    MOVIE_CATALOG_TTL_SECONDS: float = 600.0
+    
+    DEFAULT_TIMEZONE: str = "UTC"
+    
+    SHOWTIME_CLEANING_BUFFER_MINUTES: int = 15
+    SHOWTIME_IMPORT_BATCH_SIZE: int = 1000
+    SHOWTIME_IMPORT_MAX_ROWS: int = 50000
+    SHOWTIME_WINDOW_MAX_DAYS: int = 366
+    SHOWTIME_WINDOW_BATCH_SIZE: int = 500
+    SHOWTIME_UPCOMING_DAYS: int = 14
+    SCHEDULE_SNAPSHOT_TTL_SECONDS: int = 300
+    SCHEDULE_SNAPSHOT_MAX_ENTRIES: int = 256
+    
+    REVIEW_PRIOR_MEAN: float = 3.0
+    REVIEW_PRIOR_WEIGHT: float = 10.0
+    REVIEW_MOVIE_RATING_SCALE: float = 2.0
+    
+    WATCHLIST_CACHE_TTL_SECONDS: int = 300
+    WATCHLIST_CACHE_MAX_USERS: int = 10000
+    
+    PROMO_CODE_CACHE_TTL_SECONDS: int = 60
+    
+    PRICE_SEAT_MULTIPLIERS: Dict[str, float] = {
+        "standard": 1.0, "gold": 1.25, "platinum": 1.5, "vip": 2.0, "wheelchair": 1.0
+    }
+    PRICE_WEEKDAY_MULTIPLIERS: Dict[int, float] = {1: 0.8, 4: 1.1, 5: 1.1}
+    PRICE_TIME_OF_DAY_MULTIPLIERS: List[Tuple[int, int, float]] = [(0, 12, 0.85), (18, 24, 1.1)]
+    PRICE_TABLE_CACHE_TTL_SECONDS: int = 600
+    PRICE_TABLE_CACHE_MAX_ENTRIES: int = 2048
+    
+    BOOKING_PENDING_TTL_MINUTES: int = 15
+    BOOKING_EXPIRY_ENABLED: bool = True
+    BOOKING_EXPIRY_INTERVAL_SECONDS: float = 60.0
+    BOOKING_EXPIRY_BATCH_SIZE: int = 500
+    
+    OUTBOX_DISPATCH_ENABLED: bool = True
+    OUTBOX_DISPATCH_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_BATCH_SIZE: int = 200
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_BASE_SECONDS: float = 5.0
+    OUTBOX_RETENTION_HOURS: float = 24.0
+    OUTBOX_LOCAL_QUEUE_SIZE: int = 0
+    
+    TICKET_SIGNING_KEY: Optional[str] = None
+    TICKET_QR_WORKERS: int = 2
+    TICKET_QR_SCALE: int = 8
+    TICKET_QR_CACHE_MAX_ENTRIES: int = 4096
+    TICKET_QR_PRERENDER: bool = True
+    TICKET_QR_RENDER_TIMEOUT_SECONDS: float = 10.0
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -2,6 +2,7 @@ import firebase_admin
 from firebase_admin import credentials, auth
 import json
 from app.core.config import settings
+from app.core.tracing import traced
 
 firebase_app = None
 
@@ -34,6 +35,7 @@ def get_firebase_app():
     return firebase_app
 
 
+@traced("firebase.create_user", kind="client")
 def create_firebase_user(email: str, password: str, display_name: str = None):
     try:
         user = auth.create_user(
@@ -49,6 +51,7 @@ def create_firebase_user(email: str, password: str, display_name: str = None):
         raise ValueError(f"Error creating Firebase user: {str(e)}")
 
 
+@traced("firebase.verify_id_token", kind="client")
 def verify_firebase_token(id_token: str):
     try:
         decoded_token = auth.verify_id_token(id_token)
@@ -57,6 +60,7 @@ def verify_firebase_token(id_token: str):
         return None
 
 
+@traced("firebase.get_user_by_email", kind="client")
 def get_firebase_user_by_email(email: str):
     try:
         user = auth.get_user_by_email(email)
@@ -67,6 +71,7 @@ def get_firebase_user_by_email(email: str):
         return None
 
 
+@traced("firebase.generate_password_reset_link", kind="client")
 def send_password_reset_email(email: str):
     try:
         reset_link = auth.generate_password_reset_link(email)
@@ -75,6 +80,7 @@ def send_password_reset_email(email: str):
         raise ValueError(f"Error generating password reset link: {str(e)}")
 
 
+@traced("firebase.generate_email_verification_link", kind="client")
 def send_email_verification(uid: str):
     try:
         verification_link = auth.generate_email_verification_link(uid)
@@ -0,0 +1,248 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import threading
+
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _ThreadShards:
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._lock = threading.Lock()
+
+    def local(self) -> dict:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = {}
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def shards(self) -> List[dict]:
+        with self._lock:
+            return [shard.copy() for shard in self._shards]
+
+    def clear(self):
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = _ThreadShards()
+
+    def inc(self, *labelvalues, amount: float = 1):
+        values = self._values.local()
+        values[labelvalues] = values.get(labelvalues, 0) + amount
+
+    def collect(self) -> Dict[tuple, float]:
+        merged: Dict[tuple, float] = {}
+        for shard in self._values.shards():
+            for labels, value in shard.items():
+                merged[labels] = merged.get(labels, 0) + value
+        return merged
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for labels, value in sorted(self.collect().items()):
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+    def clear(self):
+        self._values.clear()
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = _ThreadShards()
+
+    def observe(self, value: float, *labelvalues):
+        values = self._values.local()
+        series = values.get(labelvalues)
+        if series is None:
+            series = [0] * (len(self.buckets) + 3)
+            values[labelvalues] = series
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def collect(self) -> Dict[tuple, List[float]]:
+        merged: Dict[tuple, List[float]] = {}
+        for shard in self._values.shards():
+            for labels, series in shard.items():
+                series = list(series)
+                if labels in merged:
+                    merged[labels] = [a + b for a, b in zip(merged[labels], series)]
+                else:
+                    merged[labels] = series
+        return merged
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        bucket_names = self.labelnames + ("le",)
+        for labels, series in sorted(self.collect().items()):
+            cumulative = 0
+            for upper, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    _format_labels(bucket_names, labels + (_format_value(float(upper)),)),
+                    cumulative,
+                )
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labels), series[-2]
+            yield f"{self.name}_count", _format_labels(self.labelnames, labels), series[-1]
+
+    def clear(self):
+        self._values.clear()
+
+
+class CallbackMetric:
+    def __init__(self, name: str, documentation: str, type: str, labelnames: Sequence[str],
+                 callback: Callable[[], Iterable[Tuple[tuple, float]]]):
+        self.name = name
+        self.documentation = documentation
+        self.type = type
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for labels, value in self.callback():
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+    def clear(self):
+        pass
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._caches: Dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+        self.register_callback(
+            "cache_hits_total", "Cache hits per in-process cache", "counter", ["cache"],
+            lambda: self._cache_samples("hits")
+        )
+        self.register_callback(
+            "cache_misses_total", "Cache misses per in-process cache", "counter", ["cache"],
+            lambda: self._cache_samples("misses")
+        )
+        self.register_callback(
+            "cache_hit_ratio", "Cache hit ratio per in-process cache", "gauge", ["cache"],
+            lambda: self._cache_samples("hit_rate")
+        )
+        self.register_callback(
+            "cache_entries", "Entries held per in-process cache", "gauge", ["cache"],
+            lambda: self._cache_samples("size")
+        )
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_callback(self, name: str, documentation: str, type: str, labelnames: Sequence[str],
+                          callback: Callable[[], Iterable[Tuple[tuple, float]]]) -> CallbackMetric:
+        return self._register(CallbackMetric(name, documentation, type, labelnames, callback))
+
+    def register_cache(self, name: str, stats: Callable[[], dict]):
+        with self._lock:
+            self._caches[name] = stats
+
+    def _cache_samples(self, key: str) -> Iterable[Tuple[tuple, float]]:
+        with self._lock:
+            caches = list(self._caches.items())
+        for name, stats in caches:
+            value = stats().get(key)
+            if value is not None:
+                yield (name,), value
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template",
+    ["method", "route"]
+)
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request", "SQL statements executed per HTTP request",
+    ["route"], buckets=DEFAULT_COUNT_BUCKETS
+)
+DB_QUERY_DURATION_PER_REQUEST = registry.histogram(
+    "db_query_duration_per_request_seconds", "Total SQL time spent per HTTP request",
+    ["route"]
+)
+RATE_LIMIT_REJECTIONS = registry.counter(
+    "rate_limit_rejections_total", "Requests rejected by the rate limiter", ["route"]
+)
+SPAM_BLOCKS = registry.counter(
+    "spam_blocks_total", "Requests blocked by spam/bot detection"
+)
+
+
+def route_template(scope: dict) -> Optional[str]:
+    route = scope.get("route")
+    return getattr(route, "path", None)
@@ -0,0 +1,49 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+import time
+from .metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    DB_QUERIES_PER_REQUEST,
+    DB_QUERY_DURATION_PER_REQUEST,
+    route_template,
+)
+from app.db.query_counter import start_query_stats, current_query_stats, check_query_budget
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        query_stats = start_query_stats()
+        start_time = time.perf_counter()
+
+        response = await call_next(request)
+
+        elapsed = time.perf_counter() - start_time
+        check_query_budget(route_template(request.scope) or request.url.path, query_stats)
+        response.headers["Server-Timing"] = f"{query_stats.server_timing()}, total;dur={elapsed * 1000:.2f}"
+        return response
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    EXCLUDED_PATHS = ["/metrics"]
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in self.EXCLUDED_PATHS:
+            return await call_next(request)
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start_time
+            route = route_template(request.scope) or "unmatched"
+            HTTP_REQUESTS.inc(request.method, route, str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, request.method, route)
+            query_stats = current_query_stats()
+            if query_stats is not None:
+                DB_QUERIES_PER_REQUEST.observe(query_stats.count, route)
+                DB_QUERY_DURATION_PER_REQUEST.observe(query_stats.duration, route)
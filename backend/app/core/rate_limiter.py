@@ -3,6 +3,7 @@ from typing import Callable, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict
 import threading
+from app.core.metrics import RATE_LIMIT_REJECTIONS, route_template
 
 
 class ThrottleManager:
@@ -55,14 +56,16 @@ throttle_manager = ThrottleManager()
 def get_rate_limit_key(calls: int, period: int):
     async def check_rate_limit(request: Request):
         identifier = request.client.host if request.client else "unknown"
+        scope = route_template(request.scope) or request.url.path
         
         is_throttled = throttle_manager.is_throttled(
-            identifier=identifier,
+            identifier=f"{scope}:{identifier}",
             limit=calls,
             window_seconds=period
         )
         
         if is_throttled:
+            RATE_LIMIT_REJECTIONS.inc(scope)
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded: {calls} requests per {period} seconds"
@@ -78,6 +81,7 @@ RATE_LIMITS = {
     "auth_login": {"calls": 10, "period": 900},
     "auth_verify": {"calls": 10, "period": 300},
     "search": {"calls": 30, "period": 60},
+    "suggest": {"calls": 600, "period": 60},
     "bookings": {"calls": 20, "period": 60},
     "public": {"calls": 100, "period": 60},
 }
@@ -3,14 +3,17 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 import jwt
 from .config import settings
+from .tracing import traced
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+@traced("security.hash_password")
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@traced("security.verify_password")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
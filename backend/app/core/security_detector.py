@@ -1,9 +1,28 @@
 from datetime import datetime, timedelta
 from collections import defaultdict
+from enum import Enum
+from functools import lru_cache
 import re
-from typing import Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from fastapi import Request
 from user_agents import parse
+from app.core.config import settings
+from app.core.metrics import registry
+
+
+class UserAgentVerdict(str, Enum):
+    BROWSER = "browser"
+    BOT = "bot"
+    SUSPICIOUS = "suspicious"
+
+
+class UserAgentInfo(NamedTuple):
+    verdict: UserAgentVerdict
+    family: str
+
+    @property
+    def is_bot(self) -> bool:
+        return self.verdict != UserAgentVerdict.BROWSER
 
 
 class BotDetector:
@@ -19,31 +38,103 @@ class BotDetector:
     ]
     
     @staticmethod
-    def is_bot(user_agent: str) -> bool:
+    def classify(user_agent: str) -> UserAgentInfo:
         if not user_agent:
-            return True
+            return UserAgentInfo(UserAgentVerdict.BOT, "unknown")
         
         ua_lower = user_agent.lower()
         
-        for keyword in BotDetector.BOT_KEYWORDS:
-            if keyword in ua_lower:
-                return True
-        
         for suspicious in BotDetector.SUSPICIOUS_USER_AGENTS:
             if suspicious in ua_lower:
-                return True
+                return UserAgentInfo(UserAgentVerdict.SUSPICIOUS, suspicious)
         
+        family = "unknown"
         try:
             parsed_ua = parse(user_agent)
+            family = parsed_ua.browser.family
             if parsed_ua.is_bot:
-                return True
+                return UserAgentInfo(UserAgentVerdict.BOT, family)
         except:
             pass
         
-        return False
+        for keyword in BotDetector.BOT_KEYWORDS:
+            if keyword in ua_lower:
+                return UserAgentInfo(UserAgentVerdict.BOT, family)
+        
+        return UserAgentInfo(UserAgentVerdict.BROWSER, family)
+    
+    @staticmethod
+    def is_bot(user_agent: str) -> bool:
+        return user_agent_classifier.classify(user_agent).is_bot
+
+
+class UserAgentClassifier:
+    def __init__(self, maxsize: int = 4096, max_length: int = 512):
+        self.max_length = max_length
+        self._classify = lru_cache(maxsize=maxsize)(BotDetector.classify)
+    
+    def classify(self, user_agent: Optional[str]) -> UserAgentInfo:
+        user_agent = (user_agent or "")[:self.max_length]
+        return self._classify(user_agent)
+    
+    def classify_request(self, request: Request) -> UserAgentInfo:
+        info = getattr(request.state, "user_agent_info", None)
+        if info is None:
+            info = self.classify(request.headers.get("user-agent", ""))
+            request.state.user_agent_info = info
+        return info
+    
+    def stats(self) -> dict:
+        info = self._classify.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+    
+    def clear(self):
+        self._classify.cache_clear()
+
+
+user_agent_classifier = UserAgentClassifier(maxsize=settings.USER_AGENT_CACHE_SIZE)
+registry.register_cache("user_agent", user_agent_classifier.stats)
 
 
 class SpamDetector:
+    SQL_INJECTION_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r"('.*?or.*?')",
+            r"(union.*?select)",
+            r"(select.*?from)",
+            r"(insert.*?into)",
+            r"(delete.*?from)",
+            r"(drop.*?table)",
+            r"(update.*?set)",
+            r"(declare.*?)",
+            r"(execute.*?)",
+        )
+    ]
+    XSS_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r"<script[^>]*>",
+            r"javascript:",
+            r"on\w+\s*=",
+            r"<iframe",
+            r"<img[^>]*on",
+        )
+    ]
+    PATH_TRAVERSAL_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r"\.\./",
+            r"\.\.\\",
+            r"%2e%2e/",
+            r"%2e%2e\\",
+        )
+    ]
+    
     def __init__(self):
         self.request_history = defaultdict(list)
         self.spam_scores = defaultdict(float)
@@ -96,8 +187,7 @@ class SpamDetector:
         elif len(requests_last_hour) > 200:
             spam_score += 15.0
         
-        user_agent = request.headers.get("user-agent", "")
-        if BotDetector.is_bot(user_agent):
+        if user_agent_classifier.classify_request(request).is_bot:
             spam_score += 25.0
         
         if self._has_sql_injection_attempt(request):
@@ -117,59 +207,32 @@ class SpamDetector:
         
         return spam_score >= 60.0, spam_score
     
-    @staticmethod
-    def _has_sql_injection_attempt(request: Request) -> bool:
-        sql_patterns = [
-            r"('.*?or.*?')",
-            r"(union.*?select)",
-            r"(select.*?from)",
-            r"(insert.*?into)",
-            r"(delete.*?from)",
-            r"(drop.*?table)",
-            r"(update.*?set)",
-            r"(declare.*?)",
-            r"(execute.*?)",
-        ]
-        
-        query_string = request.url.query
-        for pattern in sql_patterns:
-            if re.search(pattern, query_string, re.IGNORECASE):
-                return True
-        
-        return False
+    @classmethod
+    def _has_sql_injection_attempt(cls, request: Request) -> bool:
+        return cls._matches(cls.SQL_INJECTION_PATTERNS, request.url.query)
     
-    @staticmethod
-    def _has_xss_attempt(request: Request) -> bool:
-        xss_patterns = [
-            r"<script[^>]*>",
-            r"javascript:",
-            r"on\w+\s*=",
-            r"<iframe",
-            r"<img[^>]*on",
-        ]
-        
-        query_string = request.url.query
-        for pattern in xss_patterns:
-            if re.search(pattern, query_string, re.IGNORECASE):
-                return True
-        
-        return False
+    @classmethod
+    def _has_xss_attempt(cls, request: Request) -> bool:
+        return cls._matches(cls.XSS_PATTERNS, request.url.query)
+    
+    @classmethod
+    def _has_path_traversal_attempt(cls, request: Request) -> bool:
+        return cls._matches(cls.PATH_TRAVERSAL_PATTERNS, request.url.path)
     
     @staticmethod
-    def _has_path_traversal_attempt(request: Request) -> bool:
-        path_traversal_patterns = [
-            r"\.\./",
-            r"\.\.\\",
-            r"%2e%2e/",
-            r"%2e%2e\\",
-        ]
-        
-        url_path = request.url.path
-        for pattern in path_traversal_patterns:
-            if re.search(pattern, url_path, re.IGNORECASE):
-                return True
-        
-        return False
+    def _matches(patterns: List[re.Pattern], text: str) -> bool:
+        return any(pattern.search(text) for pattern in patterns)
+    
+    @classmethod
+    def scan_text(cls, text: Optional[str]) -> List[str]:
+        if not text:
+            return []
+        flags = []
+        if cls._matches(cls.SQL_INJECTION_PATTERNS, text):
+            flags.append("sql_injection")
+        if cls._matches(cls.XSS_PATTERNS, text):
+            flags.append("xss")
+        return flags
 
 
 spam_detector = SpamDetector()
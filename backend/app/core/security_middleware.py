@@ -2,8 +2,9 @@ from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 import time
-from .security_detector import spam_detector, BotDetector
+from .security_detector import spam_detector, user_agent_classifier
 from .rate_limiter import RATE_LIMITS
+from .metrics import SPAM_BLOCKS
 import logging
 
 
@@ -11,7 +12,7 @@ logger = logging.getLogger(__name__)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/.well-known"]
+    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/metrics", "/.well-known"]
     
     async def dispatch(self, request: Request, call_next):
         response = await call_next(request)
@@ -30,7 +31,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 
 class SpamDetectionMiddleware(BaseHTTPMiddleware):
-    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/.well-known", "/favicon.ico"]
+    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/metrics", "/.well-known", "/favicon.ico"]
     
     async def dispatch(self, request: Request, call_next):
         if any(request.url.path.startswith(path) for path in self.EXCLUDED_PATHS):
@@ -39,6 +40,7 @@ class SpamDetectionMiddleware(BaseHTTPMiddleware):
         is_spam, spam_score = spam_detector.detect_spam(request)
         
         if is_spam:
+            SPAM_BLOCKS.inc()
             client_ip = request.client.host if request.client else "unknown"
             logger.warning(
                 f"Spam/Bot detected from {client_ip}. Spam score: {spam_score}. "
@@ -74,7 +76,7 @@ class RequestTimeoutMiddleware(BaseHTTPMiddleware):
 
 class RequestValidationMiddleware(BaseHTTPMiddleware):
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024
-    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/.well-known", "/favicon.ico"]
+    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/metrics", "/.well-known", "/favicon.ico"]
     
     async def dispatch(self, request: Request, call_next):
         if any(request.url.path.startswith(path) for path in self.EXCLUDED_PATHS):
@@ -93,7 +95,7 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
                     pass
         
         user_agent = request.headers.get("user-agent", "")
-        if not user_agent or BotDetector.is_bot(user_agent):
+        if not user_agent or user_agent_classifier.classify_request(request).is_bot:
             if not any(request.url.path.startswith(path) for path in ["/api/v1/auth", "/health"]):
                 if not user_agent:
                     logger.warning(f"Request without user-agent from {request.client.host}")
@@ -103,7 +105,7 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
 
 
 class IPWhitelistMiddleware(BaseHTTPMiddleware):
-    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/.well-known", "/favicon.ico"]
+    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/metrics", "/.well-known", "/favicon.ico"]
     
     def __init__(self, app, whitelist: list = None):
         super().__init__(app)
@@ -0,0 +1,265 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, List, Optional
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "attributes",
+                 "start_ns", "end_ns", "status")
+
+    def __init__(self, trace_id: str, name: str, parent_id: Optional[str] = None, kind: str = "internal"):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = {}
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.status = "ok"
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def end(self):
+        self.end_ns = time.time_ns()
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6 if self.end_ns else None,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class FileSpanExporter:
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self.lock:
+            with open(self.path, "a") as f:
+                f.write(lines)
+
+
+class OTLPSpanExporter:
+    KIND_CODES = {"internal": 1, "server": 2, "client": 3}
+
+    def __init__(self, endpoint: str, service_name: str):
+        self.endpoint = endpoint
+        self.service_name = service_name
+
+    @staticmethod
+    def _attribute(key: str, value) -> dict:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    def _span(self, span: Span) -> dict:
+        data = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self.KIND_CODES.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [self._attribute(k, v) for k, v in span.attributes.items()],
+            "status": {"code": 2 if span.status == "error" else 1},
+        }
+        if span.parent_id:
+            data["parentSpanId"] = span.parent_id
+        return data
+
+    def export(self, spans: List[Span]):
+        import httpx
+
+        body = {
+            "resourceSpans": [{
+                "resource": {"attributes": [self._attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "app.core.tracing"},
+                    "spans": [self._span(span) for span in spans],
+                }],
+            }]
+        }
+        httpx.post(self.endpoint, json=body, timeout=5.0)
+
+
+class BatchSpanProcessor:
+    def __init__(self, exporter, max_queue_size: int = 2048, batch_size: int = 256, interval: float = 2.0):
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span):
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self) -> List[Span]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self):
+        batch = self._drain()
+        while batch:
+            try:
+                self.exporter.export(batch)
+            except Exception as e:
+                logger.warning(f"Span export failed: {e}")
+            batch = self._drain()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    def __init__(self, processor: Optional[BatchSpanProcessor] = None, sample_rate: float = 0.0):
+        self.processor = processor
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    @contextmanager
+    def start_trace(self, name: str, traceparent: Optional[str] = None, kind: str = "server"):
+        if not self.enabled:
+            yield None
+            return
+
+        parent_id = None
+        match = TRACEPARENT_PATTERN.match(traceparent or "")
+        if match:
+            trace_id, parent_id, flags = match.groups()
+            sampled = int(flags, 16) & 1 == 1
+        else:
+            trace_id = os.urandom(16).hex()
+            sampled = random.random() < self.sample_rate
+
+        if not sampled:
+            yield None
+            return
+
+        with self._span(Span(trace_id, name, parent_id, kind)) as span:
+            yield span
+
+    @contextmanager
+    def start_span(self, name: str, kind: str = "internal"):
+        parent = _current_span.get()
+        if parent is None:
+            yield None
+            return
+
+        with self._span(Span(parent.trace_id, name, parent.span_id, kind)) as span:
+            yield span
+
+    @contextmanager
+    def _span(self, span: Span):
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.status = "error"
+            span.set_attribute("exception.type", type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self.processor.on_end(span)
+
+
+def _build_tracer() -> Tracer:
+    if not settings.TRACING_ENABLED:
+        return Tracer()
+
+    if settings.TRACING_EXPORTER == "otlp":
+        exporter = OTLPSpanExporter(settings.TRACING_OTLP_ENDPOINT, settings.PROJECT_NAME)
+    else:
+        exporter = FileSpanExporter(settings.TRACING_FILE_PATH)
+    return Tracer(BatchSpanProcessor(exporter), settings.TRACING_SAMPLE_RATE)
+
+
+tracer = _build_tracer()
+
+
+def traced(name: str, kind: str = "internal") -> Callable:
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with tracer.start_span(name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _traced_method(layer: str, func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if _current_span.get() is None:
+            return func(self, *args, **kwargs)
+        with tracer.start_span(f"{layer}.{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+def traced_class(layer: str) -> Callable:
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, _traced_method(layer, value))
+        return cls
+    return decorator
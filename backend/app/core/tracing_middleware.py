@@ -0,0 +1,25 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from .metrics import route_template
+from .tracing import tracer
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    EXCLUDED_PATHS = ["/docs", "/openapi.json", "/redoc", "/health", "/metrics", "/favicon.ico"]
+
+    async def dispatch(self, request: Request, call_next):
+        if any(request.url.path.startswith(path) for path in self.EXCLUDED_PATHS):
+            return await call_next(request)
+
+        with tracer.start_trace(request.method, request.headers.get("traceparent")) as span:
+            response = await call_next(request)
+
+            if span is not None:
+                route = route_template(request.scope) or "unmatched"
+                span.name = f"{request.method} {route}"
+                span.set_attribute("http.method", request.method)
+                span.set_attribute("http.route", route)
+                span.set_attribute("http.status_code", response.status_code)
+                response.headers["traceparent"] = span.traceparent()
+
+            return response
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, field_validator, ValidationInfo
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import re
 
 
@@ -78,6 +79,16 @@ class URLValidator:
         return url
 
 
+class TimezoneValidator:
+    @staticmethod
+    def validate_timezone(name: str) -> str:
+        try:
+            ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {name}")
+        return name
+
+
 class FieldValidators:
     @staticmethod
     def validate_positive_number(value: float) -> float:
@@ -0,0 +1,142 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import logging
+import time
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+QUERY_BUDGETS = {
+    "default": 20,
+    "/api/v1/bookings": 10,
+    "/api/v1/bookings/my-bookings": 5,
+    "/api/v1/bookings/quote": 4,
+    "/api/v1/bookings/showtime/{showtime_id}/cancel": 8,
+    "/api/v1/bookings/tickets/scan": 4,
+    "/api/v1/bookings/tickets/scan/batch": 4,
+    "/api/v1/listings": 3,
+    "/api/v1/movies": 5,
+    "/api/v1/reviews/moderate": 10,
+    "/api/v1/reviews/pending": 5,
+    "/api/v1/showtimes": 5,
+    "/api/v1/showtimes/bulk": 100,
+    "/api/v1/showtimes/import": 100,
+    "/api/v1/watchlist/contains": 2,
+}
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryStats:
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        return sorted(
+            ((statement, count) for statement, count in self.statements.items() if count >= threshold),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> QueryStats:
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def get_query_budget(route: str) -> int:
+    return QUERY_BUDGETS.get(route, QUERY_BUDGETS["default"])
+
+
+def check_query_budget(route: str, stats: QueryStats):
+    if not settings.DEBUG or settings.QUERY_BUDGET_MODE == "off":
+        return
+
+    for statement, count in stats.repeated_statements(settings.QUERY_REPEAT_THRESHOLD):
+        logger.warning(f"Possible N+1 on {route}: statement executed {count} times: {statement[:200]}")
+
+    budget = get_query_budget(route)
+    if stats.count > budget:
+        message = f"{route} executed {stats.count} queries (budget {budget})"
+        if settings.QUERY_BUDGET_MODE == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+@contextmanager
+def count_queries():
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    with count_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        statements = "\n".join(f"  {count}x {statement}" for statement, count in stats.statements.items())
+        raise AssertionError(f"Expected at most {limit} queries, got {stats.count}:\n{statements}")
+
+
+@contextmanager
+def assert_num_queries(expected: int):
+    with count_queries() as stats:
+        yield stats
+    if stats.count != expected:
+        statements = "\n".join(f"  {count}x {statement}" for statement, count in stats.statements.items())
+        raise AssertionError(f"Expected {expected} queries, got {stats.count}:\n{statements}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+        stats.statements[statement] = stats.statements.get(statement, 0) + 1
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def install_query_counter(engine: Engine):
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -1,7 +1,12 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
+from app.core.metrics import registry
+from app.db.query_counter import install_query_counter
+from app.db.slow_query_log import install_slow_query_log
 from app.models.domain.base import Base
+from app.repositories.movie_repository import init_movie_credits
+from app.repositories.movie_search_repository import init_search_index
 
 engine = create_engine(
     settings.DATABASE_URL,
@@ -12,6 +17,32 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+
+install_query_counter(engine)
+install_slow_query_log(engine)
+
+
+def _pool_samples():
+    pool = engine.pool
+    for state in ("size", "checkedin", "checkedout", "overflow"):
+        stat = getattr(pool, state, None)
+        if callable(stat):
+            yield (state,), stat()
+
+
+registry.register_callback(
+    "db_pool_connections", "SQLAlchemy connection pool state", "gauge", ["state"], _pool_samples
+)
+
+
 def get_db() -> Session:
     db = SessionLocal()
     try:
@@ -20,5 +51,26 @@ def get_db() -> Session:
         db.close()
 
 
+def _add_missing_columns():
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN "
+                    f"{preparer.format_column(column)} {column.type.compile(dialect=engine.dialect)}"
+                )
+
+
 def init_db():
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    init_movie_credits(engine)
+    init_search_index(engine)
@@ -0,0 +1,145 @@
+from collections import deque
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import logging
+import os
+import sys
+import threading
+import time
+from app.core.config import settings
+from app.core.metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERIES = registry.counter("db_slow_queries_total", "SQL statements slower than SLOW_QUERY_THRESHOLD_MS")
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+    "mysql": "EXPLAIN ",
+}
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CALLER_PACKAGES = [
+    os.path.join(_APP_ROOT, "repositories"),
+    os.path.join(_APP_ROOT, "services"),
+]
+
+
+def _redact_value(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (Decimal, datetime, date, dt_time)):
+        return str(value)
+    if isinstance(value, str):
+        return f"<redacted str len={len(value)}>"
+    return f"<redacted {type(value).__name__}>"
+
+
+def redact_parameters(parameters, executemany: bool = False):
+    if executemany and parameters:
+        return {"rows": len(parameters), "first": redact_parameters(parameters[0])}
+    if isinstance(parameters, dict):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+def _find_caller() -> Optional[str]:
+    frame = sys._getframe(2)
+    for package in _CALLER_PACKAGES:
+        current = frame
+        while current is not None:
+            if current.f_code.co_filename.startswith(package):
+                module = os.path.splitext(os.path.relpath(current.f_code.co_filename, _APP_ROOT))[0]
+                return f"app.{module.replace(os.sep, '.')}:{current.f_code.co_qualname}:{current.f_lineno}"
+            current = current.f_back
+    return None
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float, maxsize: int = 100, explain: bool = False):
+        self.threshold = threshold_ms / 1000.0
+        self.explain = explain
+        self.records = deque(maxlen=maxsize)
+        self.lock = threading.Lock()
+
+    def _explain(self, conn, statement: str, parameters) -> Optional[List[str]]:
+        prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if not prefix or not statement.lstrip().upper().startswith("SELECT"):
+            return None
+
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters or ())
+            return [" | ".join(str(column) for column in row) for row in cursor.fetchall()]
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+        finally:
+            cursor.close()
+
+    def record(self, conn, statement: str, parameters, executemany: bool, elapsed: float):
+        SLOW_QUERIES.inc()
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "duration_ms": round(elapsed * 1000, 3),
+            "statement": statement,
+            "parameters": redact_parameters(parameters, executemany),
+            "caller": _find_caller(),
+            "plan": None,
+        }
+        if self.explain and not executemany:
+            entry["plan"] = self._explain(conn, statement, parameters)
+
+        logger.warning(
+            f"Slow query ({entry['duration_ms']} ms) from {entry['caller']}: {statement[:200]}"
+        )
+        with self.lock:
+            self.records.append(entry)
+
+    def recent(self, limit: int = 50) -> List[dict]:
+        with self.lock:
+            records = list(self.records)
+        return list(reversed(records))[:limit]
+
+    def clear(self):
+        with self.lock:
+            self.records.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    maxsize=settings.SLOW_QUERY_LOG_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("slow_query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    if elapsed >= slow_query_log.threshold:
+        slow_query_log.record(conn, statement, parameters, executemany, elapsed)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("slow_query_start_time"):
+        conn.info["slow_query_start_time"].pop()
+
+
+def install_slow_query_log(engine: Engine):
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -1,7 +1,8 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from app.db.session import init_db, SessionLocal
 from app.core.config import settings
 from app.core.firebase import init_firebase
@@ -17,6 +18,11 @@ from app.core.security_middleware import (
     RequestValidationMiddleware
 )
 from app.core.exception_handler import validation_exception_handler, generic_exception_handler
+from app.core.metrics import registry as metrics_registry
+from app.core.metrics_middleware import MetricsMiddleware, QueryCounterMiddleware
+from app.core.tracing_middleware import TracingMiddleware
+from app.services.booking_expiry_service import booking_expiry_worker
+from app.services.outbox_service import outbox_dispatcher
 import logging
 
 
@@ -58,11 +64,30 @@ def init_admin_user():
         db.close()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.BOOKING_EXPIRY_ENABLED:
+        booking_expiry_worker.start()
+    if settings.OUTBOX_DISPATCH_ENABLED:
+        outbox_dispatcher.start()
+    try:
+        yield
+    finally:
+        booking_expiry_worker.stop()
+        if settings.OUTBOX_DISPATCH_ENABLED:
+            outbox_dispatcher.stop()
+            try:
+                outbox_dispatcher.run_once()
+            except Exception as e:
+                logger.warning(f"Final outbox dispatch failed: {e}")
+
+
 def create_app():
     app = FastAPI(
         title=settings.PROJECT_NAME,
         version=settings.PROJECT_VERSION,
-        description="CineVerse - Movie Ticketing System API"
+        description="CineVerse - Movie Ticketing System API",
+        lifespan=lifespan
     )
     
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -81,6 +106,13 @@ def create_app():
     app.add_middleware(RequestTimeoutMiddleware)
     app.add_middleware(SpamDetectionMiddleware)
     
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+    app.add_middleware(QueryCounterMiddleware)
+    
+    if settings.TRACING_ENABLED:
+        app.add_middleware(TracingMiddleware)
+    
     init_firebase()
     init_db()
     init_admin_user()
@@ -95,6 +127,14 @@ def create_app():
     def health_check():
         return {"status": "healthy"}
     
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        def metrics():
+            return PlainTextResponse(
+                metrics_registry.render(),
+                media_type="text/plain; version=0.0.4; charset=utf-8"
+            )
+    
     return app
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum as SQLEnum, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Enum as SQLEnum, Boolean, Index
 from enum import Enum
 from datetime import datetime
 from .base import BaseModel
@@ -33,6 +33,10 @@ class Booking(BaseModel):
     stripe_payment_id = Column(String(255), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
 
+    __table_args__ = (
+        Index("ix_bookings_status_booking_date", "status", "booking_date"),
+    )
+
 
 class Ticket(BaseModel):
     __tablename__ = "tickets"
@@ -44,3 +48,4 @@ class Ticket(BaseModel):
     price = Column(Float, nullable=False)
     qr_code = Column(String(500), nullable=True)
     is_used = Column(Boolean, default=False, nullable=False)
+    used_at = Column(DateTime, nullable=True)
@@ -11,6 +11,7 @@ class Cinema(BaseModel):
     location = Column(Text, nullable=True)
     phone = Column(String(20), nullable=True)
     email = Column(String(255), nullable=True)
+    timezone = Column(String(64), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
 
 
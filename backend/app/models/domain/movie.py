@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Enum as SQLEnum, Boolean, Date
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Enum as SQLEnum, Boolean, Date, ForeignKey, Index
 from enum import Enum
-from .base import BaseModel
+from .base import Base, BaseModel
 
 
 class MovieStatus(str, Enum):
@@ -26,3 +26,27 @@ class Movie(BaseModel):
     rating = Column(Float, default=0.0, nullable=False)
     status = Column(SQLEnum(MovieStatus), default=MovieStatus.NOW_PLAYING, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+
+
+class MovieGenre(Base):
+    __tablename__ = "movie_genres"
+
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    genre = Column(String(100), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_movie_genres_genre_movie_id", "genre", "movie_id"),
+    )
+
+
+class MovieCastMember(Base):
+    __tablename__ = "movie_cast"
+
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    name = Column(String(255), nullable=False)
+    name_key = Column(String(255), nullable=False)
+
+    __table_args__ = (
+        Index("ix_movie_cast_name_key_movie_id", "name_key", "movie_id"),
+    )
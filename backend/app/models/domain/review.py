@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float, Text, Boolean
-from .base import BaseModel
+from sqlalchemy import Column, Integer, String, Float, Text, Boolean, DateTime, Index
+from datetime import datetime
+from .base import Base, BaseModel
 
 
 class Review(BaseModel):
@@ -12,3 +13,18 @@ class Review(BaseModel):
     comment = Column(Text, nullable=True)
     is_approved = Column(Boolean, default=False, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+
+    __table_args__ = (
+        Index("ix_reviews_movie_id_user_id", "movie_id", "user_id", unique=True),
+        Index("ix_reviews_is_approved_is_active_id", "is_approved", "is_active", "id"),
+    )
+
+
+class MovieRatingAggregate(Base):
+    __tablename__ = "movie_rating_aggregates"
+
+    movie_id = Column(Integer, primary_key=True)
+    review_count = Column(Integer, default=0, nullable=False)
+    rating_sum = Column(Float, default=0.0, nullable=False)
+    bayesian_rating = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, String, Float, Boolean
+from sqlalchemy import Column, Integer, DateTime, String, Float, Boolean, Index
 from .base import BaseModel
 
 
@@ -14,3 +14,9 @@ class Showtime(BaseModel):
     base_price = Column(Float, nullable=False)
     available_seats = Column(Integer, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+
+    __table_args__ = (
+        Index("ix_showtimes_cinema_id_start_time", "cinema_id", "start_time"),
+        Index("ix_showtimes_screen_id_start_time", "screen_id", "start_time"),
+        Index("ix_showtimes_movie_id_start_time", "movie_id", "start_time"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Boolean
+from sqlalchemy import Column, Integer, Boolean, Index
 from .base import BaseModel
 
 
@@ -9,3 +9,7 @@ class Watchlist(BaseModel):
     user_id = Column(Integer, nullable=False, index=True)
     movie_id = Column(Integer, nullable=False, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
+
+    __table_args__ = (
+        Index("ix_watchlist_user_id_movie_id", "user_id", "movie_id", unique=True),
+    )
@@ -18,6 +18,15 @@ class PaymentStatus(str, Enum):
     REFUNDED = "refunded"
 
 
+class ScanResult(str, Enum):
+    ADMITTED = "admitted"
+    ALREADY_USED = "already_used"
+    REVOKED = "revoked"
+    INVALID = "invalid"
+    WRONG_SHOWTIME = "wrong_showtime"
+    DUPLICATE = "duplicate"
+
+
 class TicketBase(BaseModel):
     booking_id: int
     seat_id: int
@@ -26,19 +35,49 @@ class TicketBase(BaseModel):
 
 
 class TicketCreate(TicketBase):
-    pass
+    booking_id: Optional[int] = None
+    price: Optional[float] = Field(None, gt=0)
 
 
 class TicketResponse(TicketBase):
     id: int
     qr_code: Optional[str] = None
     is_used: bool
+    used_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class TicketScan(BaseModel):
+    payload: str = Field(..., min_length=1, max_length=100)
+    scanned_at: Optional[datetime] = None
+
+
+class TicketScanRequest(TicketScan):
+    showtime_id: Optional[int] = None
+
+
+class TicketScanBatch(BaseModel):
+    showtime_id: Optional[int] = None
+    scans: List[TicketScan] = Field(..., min_length=1, max_length=1000)
+
+
+class TicketScanResponse(BaseModel):
+    payload: str
+    result: ScanResult
+    ticket_id: Optional[int] = None
+    seat_id: Optional[int] = None
+    used_at: Optional[datetime] = None
+
+
+class TicketScanBatchResponse(BaseModel):
+    admitted: int
+    rejected: int
+    results: List[TicketScanResponse]
+
+
 class BookingBase(BaseModel):
     showtime_id: int
     total_price: float = Field(..., gt=0)
@@ -46,9 +85,33 @@ class BookingBase(BaseModel):
 
 
 class BookingCreate(BookingBase):
+    total_price: Optional[float] = Field(None, gt=0)
+    promo_code: Optional[str] = Field(None, min_length=1, max_length=50)
     tickets: List[TicketCreate]
 
 
+class BookingQuoteRequest(BaseModel):
+    showtime_id: int
+    seat_ids: List[int] = Field(..., min_length=1, max_length=50)
+    promo_code: Optional[str] = Field(None, min_length=1, max_length=50)
+    promo_code_id: Optional[int] = None
+
+
+class TicketQuote(BaseModel):
+    seat_id: int
+    seat_category: str
+    price: float
+
+
+class BookingQuote(BaseModel):
+    showtime_id: int
+    tickets: List[TicketQuote]
+    subtotal: float
+    discount_amount: float
+    total: float
+    promo_code_id: Optional[int] = None
+
+
 class BookingUpdate(BaseModel):
     status: Optional[BookingStatus] = None
     payment_status: Optional[PaymentStatus] = None
@@ -70,3 +133,14 @@ class BookingResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class BookingCancellationResult(BaseModel):
+    cancelled: int
+    seats_released: int
+    showtimes_affected: int
+
+
+class BookingExpiryResult(BookingCancellationResult):
+    batches: int
+    cutoff: datetime
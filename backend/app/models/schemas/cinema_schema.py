@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, field_validator
 from typing import Optional
 from datetime import datetime
+from app.core.validators import TimezoneValidator
 
 
 class CinemaBase(BaseModel):
@@ -9,6 +10,12 @@ class CinemaBase(BaseModel):
     location: Optional[str] = None
     phone: Optional[str] = None
     email: Optional[EmailStr] = None
+    timezone: Optional[str] = Field(None, max_length=64)
+    
+    @field_validator('timezone')
+    @classmethod
+    def validate_timezone(cls, v):
+        return TimezoneValidator.validate_timezone(v) if v else v
 
 
 class CinemaCreate(CinemaBase):
@@ -21,6 +28,12 @@ class CinemaUpdate(BaseModel):
     location: Optional[str] = None
     phone: Optional[str] = None
     email: Optional[EmailStr] = None
+    timezone: Optional[str] = Field(None, max_length=64)
+    
+    @field_validator('timezone')
+    @classmethod
+    def validate_timezone(cls, v):
+        return TimezoneValidator.validate_timezone(v) if v else v
 
 
 class CinemaResponse(CinemaBase):
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import date, datetime
+
+
+class ListingShowtime(BaseModel):
+    id: int
+    screen_id: int
+    screen_number: Optional[int] = None
+    screen_type: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    base_price: float
+    available_seats: int
+
+
+class ListingCinema(BaseModel):
+    id: int
+    name: str
+    location: Optional[str] = None
+    showtimes: List[ListingShowtime]
+
+
+class ListingMovie(BaseModel):
+    id: int
+    title: str
+    poster_url: Optional[str] = None
+    duration: int
+    genre: Optional[str] = None
+    language: Optional[str] = None
+    age_restriction: Optional[str] = None
+    rating: float
+    cinemas: List[ListingCinema]
+
+
+class ListingsResponse(BaseModel):
+    city: str
+    date: date
+    movies: List[ListingMovie]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Optional, List, Dict
 from datetime import date, datetime
 from enum import Enum
 from app.core.validators import URLValidator, FieldValidators
@@ -86,3 +86,32 @@ class MovieResponse(MovieBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class MovieSuggestion(BaseModel):
+    id: int
+    title: str
+
+
+class MovieFilters(BaseModel):
+    search: Optional[str] = None
+    cast: Optional[str] = None
+    status: List[MovieStatus] = []
+    genre: List[str] = []
+    language: List[str] = []
+    age_restriction: List[str] = []
+    release_date_from: Optional[date] = None
+    release_date_to: Optional[date] = None
+    min_rating: Optional[float] = Field(None, ge=0.0, le=10.0)
+    max_rating: Optional[float] = Field(None, ge=0.0, le=10.0)
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class MovieBrowseResponse(BaseModel):
+    total: int
+    items: List[MovieResponse]
+    facets: Dict[str, List[FacetCount]]
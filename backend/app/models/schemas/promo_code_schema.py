@@ -39,3 +39,16 @@ class PromoCodeResponse(PromoCodeBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class PromoCodeValidate(BaseModel):
+    code: str = Field(..., min_length=1, max_length=50)
+    amount: float = Field(..., gt=0)
+
+
+class PromoCodeQuote(BaseModel):
+    promo_code_id: int
+    code: str
+    discount_type: DiscountType
+    discount_amount: float
+    total_after_discount: float
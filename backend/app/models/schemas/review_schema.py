@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from app.core.validators import FieldValidators
 
@@ -44,3 +44,44 @@ class ReviewResponse(ReviewBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ModerationQueueItem(ReviewResponse):
+    flags: List[str] = []
+
+
+class ModerationQueueResponse(BaseModel):
+    items: List[ModerationQueueItem]
+    next_cursor: Optional[int] = None
+
+
+class BulkModerationRequest(BaseModel):
+    review_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    approve: bool
+
+
+class BulkModerationResult(BaseModel):
+    requested: int
+    updated: int
+    movies_affected: int
+
+
+class MovieRatingResponse(BaseModel):
+    movie_id: int
+    review_count: int
+    average_rating: Optional[float] = None
+    bayesian_rating: float
+
+
+class RatingCorrection(BaseModel):
+    movie_id: int
+    stored_count: int
+    stored_sum: float
+    expected_count: int
+    expected_sum: float
+
+
+class RatingRecomputeResult(BaseModel):
+    checked: int
+    corrected: int
+    corrections: List[RatingCorrection]
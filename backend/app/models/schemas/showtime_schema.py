@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Optional
-from datetime import datetime
+from typing import Optional, List
+from datetime import date, datetime, time
 
 
 class ShowtimeBase(BaseModel):
@@ -31,3 +31,38 @@ class ShowtimeResponse(ShowtimeBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ShowtimeImportRow(BaseModel):
+    movie_id: int
+    screen_id: int
+    start_time: datetime
+    base_price: float = Field(..., gt=0)
+
+
+class BulkScheduleCreate(BaseModel):
+    movie_id: int
+    screen_ids: List[int] = Field(..., min_length=1)
+    start_date: date
+    end_date: date
+    slots: List[time] = Field(..., min_length=1)
+    weekdays: Optional[List[int]] = None
+    base_price: float = Field(..., gt=0)
+    skip_conflicts: bool = False
+    dry_run: bool = False
+
+
+class ScheduleRejection(BaseModel):
+    row: int
+    screen_id: int
+    start_time: datetime
+    reason: str
+
+
+class ScheduleImportResult(BaseModel):
+    requested: int
+    created: int
+    rejected: List[ScheduleRejection]
+    dry_run: bool
+    elapsed_ms: float
+    rows_per_second: float
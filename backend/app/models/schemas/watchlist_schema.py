@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import List
 from datetime import datetime
 
 
@@ -18,3 +19,7 @@ class WatchlistResponse(WatchlistBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class WatchlistMembershipResponse(BaseModel):
+    movie_ids: List[int]
@@ -1,9 +1,11 @@
 from sqlalchemy.orm import Session
 from typing import TypeVar, Generic, List, Optional, Type
+from app.core.tracing import traced_class
 
 T = TypeVar("T")
 
 
+@traced_class("repository")
 class BaseRepository(Generic[T]):
     def __init__(self, model: Type[T], db: Session):
         self.model = model
@@ -15,6 +17,21 @@ class BaseRepository(Generic[T]):
         self.db.refresh(obj)
         return obj
 
+    def add(self, obj: T) -> T:
+        self.db.add(obj)
+        self.db.flush()
+        return obj
+
+    def remove(self, obj: T):
+        self.db.delete(obj)
+        self.db.flush()
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
     def get_by_id(self, id: int) -> Optional[T]:
         return self.db.query(self.model).filter(self.model.id == id).first()
 
@@ -1,9 +1,13 @@
+from sqlalchemy import bindparam, case, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.models.domain.booking import Booking, Ticket, BookingStatus
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from app.models.domain.booking import Booking, Ticket, BookingStatus, PaymentStatus
 from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
 
 
+@traced_class("repository")
 class BookingRepository(BaseRepository[Booking]):
     def __init__(self, db: Session):
         super().__init__(Booking, db)
@@ -23,6 +27,52 @@ class BookingRepository(BaseRepository[Booking]):
             Booking.status == status
         ).offset(skip).limit(limit).all()
 
+    def get_expired_pending(self, cutoff: datetime, limit: int) -> List[int]:
+        return [booking_id for (booking_id,) in self.db.query(Booking.id).filter(
+            Booking.status == BookingStatus.PENDING,
+            Booking.booking_date < cutoff,
+            Booking.payment_status != PaymentStatus.SUCCESS
+        ).order_by(Booking.booking_date).limit(limit).with_for_update(skip_locked=True)]
+
+    def mark_cancelled_many(self, booking_ids: List[int]) -> List[Tuple[int, int, Optional[int]]]:
+        if not booking_ids:
+            return []
+        table = Booking.__table__
+        return self._mark_cancelled(table.c.id.in_(booking_ids), table.c.status != BookingStatus.CANCELLED)
+
+    def mark_expired_many(self, booking_ids: List[int]) -> List[Tuple[int, int, Optional[int]]]:
+        if not booking_ids:
+            return []
+        table = Booking.__table__
+        return self._mark_cancelled(
+            table.c.id.in_(booking_ids),
+            table.c.status == BookingStatus.PENDING,
+            table.c.payment_status != PaymentStatus.SUCCESS
+        )
+
+    def mark_showtime_cancelled(self, showtime_id: int) -> List[Tuple[int, int, Optional[int]]]:
+        table = Booking.__table__
+        return self._mark_cancelled(table.c.showtime_id == showtime_id, table.c.status != BookingStatus.CANCELLED)
+
+    def _mark_cancelled(self, *conditions) -> List[Tuple[int, int, Optional[int]]]:
+        table = Booking.__table__
+        statement = update(table).where(*conditions).values(
+            status=BookingStatus.CANCELLED
+        ).returning(table.c.id, table.c.showtime_id, table.c.promo_code_id)
+        return [tuple(row) for row in self.db.execute(statement)]
+
+    def set_payment_status(self, booking_id: int, values: dict) -> bool:
+        return self.db.query(Booking).filter(
+            Booking.id == booking_id,
+            Booking.status != BookingStatus.CANCELLED
+        ).update(values) > 0
+
+    def delete_many(self, booking_ids: List[int]) -> int:
+        if not booking_ids:
+            return 0
+        self.db.query(Ticket).filter(Ticket.booking_id.in_(booking_ids)).delete(synchronize_session=False)
+        return self.db.query(Booking).filter(Booking.id.in_(booking_ids)).delete(synchronize_session=False)
+
     def get_user_bookings_by_status(self, user_id: int, status: BookingStatus) -> List[Booking]:
         return self.db.query(Booking).filter(
             Booking.user_id == user_id,
@@ -30,6 +80,7 @@ class BookingRepository(BaseRepository[Booking]):
         ).all()
 
 
+@traced_class("repository")
 class TicketRepository(BaseRepository[Ticket]):
     def __init__(self, db: Session):
         super().__init__(Ticket, db)
@@ -37,5 +88,72 @@ class TicketRepository(BaseRepository[Ticket]):
     def get_by_booking(self, booking_id: int) -> List[Ticket]:
         return self.db.query(Ticket).filter(Ticket.booking_id == booking_id).all()
 
+    def add_all(self, tickets: List[Ticket]) -> List[Ticket]:
+        self.db.add_all(tickets)
+        self.db.flush()
+        return tickets
+
     def get_by_seat(self, seat_id: int) -> Optional[Ticket]:
         return self.db.query(Ticket).filter(Ticket.seat_id == seat_id).first()
+
+    def get_unissued(self, booking_id: int) -> List[Tuple[int, int]]:
+        return self.db.query(Ticket.id, Ticket.seat_id).filter(
+            Ticket.booking_id == booking_id,
+            Ticket.qr_code.is_(None)
+        ).all()
+
+    def set_qr_codes(self, qr_codes: Dict[int, str]):
+        if not qr_codes:
+            return
+        table = Ticket.__table__
+        statement = update(table).where(
+            table.c.id == bindparam("b_id"),
+            table.c.qr_code.is_(None)
+        ).values(qr_code=bindparam("b_qr_code"))
+        self.db.execute(statement, [
+            {"b_id": ticket_id, "b_qr_code": qr_code} for ticket_id, qr_code in qr_codes.items()
+        ])
+
+    def get_by_bookings(self, booking_ids: List[int]) -> List[Tuple[int, int, Optional[str]]]:
+        if not booking_ids:
+            return []
+        return self.db.query(Ticket.booking_id, Ticket.seat_id, Ticket.qr_code).filter(
+            Ticket.booking_id.in_(booking_ids)
+        ).all()
+
+    def clear_qr_codes(self, booking_ids: List[int]) -> int:
+        if not booking_ids:
+            return 0
+        return self.db.query(Ticket).filter(
+            Ticket.booking_id.in_(booking_ids),
+            Ticket.qr_code.isnot(None)
+        ).update({"qr_code": None}, synchronize_session=False)
+
+    def mark_used(self, scans: Dict[int, Tuple[str, datetime]]) -> List[int]:
+        if not scans:
+            return []
+        table = Ticket.__table__
+        if len(scans) == 1:
+            used_at = next(iter(scans.values()))[1]
+        else:
+            used_at = case({ticket_id: scanned_at for ticket_id, (_, scanned_at) in scans.items()}, value=table.c.id)
+        statement = update(table).where(
+            table.c.id.in_(list(scans)),
+            table.c.qr_code.in_([qr_code for qr_code, _ in scans.values()]),
+            table.c.is_used == False
+        ).values(is_used=True, used_at=used_at).returning(table.c.id)
+        return [ticket_id for (ticket_id,) in self.db.execute(statement)]
+
+    def mark_used_by_id(self, ticket_id: int, used_at: datetime) -> bool:
+        return self.db.query(Ticket).filter(
+            Ticket.id == ticket_id,
+            Ticket.is_used == False
+        ).update({"is_used": True, "used_at": used_at}, synchronize_session=False) == 1
+
+    def get_scan_states(self, ticket_ids: List[int]) -> Dict[int, Tuple[Optional[str], bool, Optional[datetime]]]:
+        return {
+            ticket_id: (qr_code, is_used, used_at)
+            for ticket_id, qr_code, is_used, used_at in self.db.query(
+                Ticket.id, Ticket.qr_code, Ticket.is_used, Ticket.used_at
+            ).filter(Ticket.id.in_(ticket_ids))
+        }
@@ -2,8 +2,10 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.domain.cinema import Cinema, Screen
 from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
 
 
+@traced_class("repository")
 class CinemaRepository(BaseRepository[Cinema]):
     def __init__(self, db: Session):
         super().__init__(Cinema, db)
@@ -15,6 +17,7 @@ class CinemaRepository(BaseRepository[Cinema]):
         return self.db.query(Cinema).filter(Cinema.is_active == True).offset(skip).limit(limit).all()
 
 
+@traced_class("repository")
 class ScreenRepository(BaseRepository[Screen]):
     def __init__(self, db: Session):
         super().__init__(Screen, db)
@@ -27,3 +30,6 @@ class ScreenRepository(BaseRepository[Screen]):
             Screen.cinema_id == cinema_id,
             Screen.is_active == True
         ).offset(skip).limit(limit).all()
+
+    def get_active_by_ids(self, ids: List[int]) -> List[Screen]:
+        return self.db.query(Screen).filter(Screen.id.in_(ids), Screen.is_active == True).all()
@@ -1,9 +1,68 @@
+from sqlalchemy import exists, func, insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from app.models.domain.movie import Movie, MovieStatus
+from typing import Dict, Optional, List, Tuple
+import logging
+from app.models.domain.movie import Movie, MovieStatus, MovieGenre, MovieCastMember
 from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
+from app.utils.credits import cast_key, split_cast, split_genres
 
 
+logger = logging.getLogger(__name__)
+
+CREDITS_BACKFILL_BATCH_SIZE = 1000
+
+
+def genre_rows(movie_id: int, genre: Optional[str]) -> List[dict]:
+    return [{"movie_id": movie_id, "genre": value} for value in split_genres(genre)]
+
+
+def cast_rows(movie_id: int, cast: Optional[str]) -> List[dict]:
+    return [
+        {"movie_id": movie_id, "position": position, "name": name, "name_key": cast_key(name)}
+        for position, name in enumerate(split_cast(cast))
+    ]
+
+
+def init_movie_credits(engine: Engine):
+    with Session(engine) as db:
+        stale = db.query(MovieGenre).filter(
+            ~exists().where(Movie.id == MovieGenre.movie_id, Movie.is_active == True)
+        ).delete(synchronize_session=False)
+        orphaned = db.query(MovieCastMember).filter(
+            ~exists().where(Movie.id == MovieCastMember.movie_id)
+        ).delete(synchronize_session=False)
+
+        genres = [
+            row
+            for movie_id, genre in db.query(Movie.id, Movie.genre).filter(
+                Movie.is_active == True,
+                ~exists().where(MovieGenre.movie_id == Movie.id)
+            )
+            for row in genre_rows(movie_id, genre)
+        ]
+        cast = [
+            row
+            for movie_id, names in db.query(Movie.id, Movie.cast).filter(
+                ~exists().where(MovieCastMember.movie_id == Movie.id)
+            )
+            for row in cast_rows(movie_id, names)
+        ]
+
+        for start in range(0, len(genres), CREDITS_BACKFILL_BATCH_SIZE):
+            db.execute(insert(MovieGenre), genres[start:start + CREDITS_BACKFILL_BATCH_SIZE])
+        for start in range(0, len(cast), CREDITS_BACKFILL_BATCH_SIZE):
+            db.execute(insert(MovieCastMember), cast[start:start + CREDITS_BACKFILL_BATCH_SIZE])
+        db.commit()
+
+    if genres or cast:
+        logger.info(f"Backfilled {len(genres)} genre and {len(cast)} cast rows")
+    if stale or orphaned:
+        logger.info(f"Removed {stale} genre rows of inactive movies and {orphaned} orphaned cast rows")
+
+
+@traced_class("repository")
 class MovieRepository(BaseRepository[Movie]):
     def __init__(self, db: Session):
         super().__init__(Movie, db)
@@ -14,11 +73,59 @@ class MovieRepository(BaseRepository[Movie]):
     def get_by_status(self, status: MovieStatus, skip: int = 0, limit: int = 100) -> List[Movie]:
         return self.db.query(Movie).filter(Movie.status == status).offset(skip).limit(limit).all()
 
-    def search_by_genre(self, genre: str, skip: int = 0, limit: int = 100) -> List[Movie]:
-        return self.db.query(Movie).filter(Movie.genre.ilike(f"%{genre}%")).offset(skip).limit(limit).all()
+    def get_ids_by_cast_member(self, name: str) -> List[int]:
+        rows = self.db.query(MovieCastMember.movie_id).filter(MovieCastMember.name_key == cast_key(name)).all()
+        return [row[0] for row in rows]
+
+    def list_genres(self) -> List[Tuple[str, int]]:
+        return (
+            self.db.query(MovieGenre.genre, func.count(MovieGenre.movie_id))
+            .group_by(MovieGenre.genre)
+            .order_by(MovieGenre.genre)
+            .all()
+        )
+
+    def replace_credits(self, movie: Movie):
+        genres = genre_rows(movie.id, movie.genre) if movie.is_active else []
+        cast = cast_rows(movie.id, movie.cast)
+        self.db.query(MovieGenre).filter(MovieGenre.movie_id == movie.id).delete(synchronize_session=False)
+        self.db.query(MovieCastMember).filter(MovieCastMember.movie_id == movie.id).delete(synchronize_session=False)
+        if genres:
+            self.db.execute(insert(MovieGenre), genres)
+        if cast:
+            self.db.execute(insert(MovieCastMember), cast)
+
+    def delete_credits(self, movie_id: int):
+        self.db.query(MovieGenre).filter(MovieGenre.movie_id == movie_id).delete(synchronize_session=False)
+        self.db.query(MovieCastMember).filter(MovieCastMember.movie_id == movie_id).delete(synchronize_session=False)
 
     def search_by_title(self, title: str, skip: int = 0, limit: int = 100) -> List[Movie]:
         return self.db.query(Movie).filter(Movie.title.ilike(f"%{title}%")).offset(skip).limit(limit).all()
 
     def get_active_movies(self, skip: int = 0, limit: int = 100) -> List[Movie]:
         return self.db.query(Movie).filter(Movie.is_active == True).offset(skip).limit(limit).all()
+
+    def get_catalog_version(self) -> Tuple:
+        return tuple(self.db.query(func.count(Movie.id), func.max(Movie.updated_at)).one())
+
+    def get_catalog_entries(self) -> List[Tuple]:
+        return self.db.query(
+            Movie.id, Movie.title, Movie.rating, Movie.language,
+            Movie.status, Movie.age_restriction, Movie.release_date
+        ).filter(Movie.is_active == True).all()
+
+    def get_catalog_genres(self) -> Dict[int, List[str]]:
+        genres: Dict[int, List[str]] = {}
+        for movie_id, genre in self.db.query(MovieGenre.movie_id, MovieGenre.genre):
+            genres.setdefault(movie_id, []).append(genre)
+        return genres
+
+    def get_durations(self, ids: List[int]) -> dict:
+        rows = self.db.query(Movie.id, Movie.duration).filter(Movie.id.in_(ids), Movie.is_active == True).all()
+        return {movie_id: duration for movie_id, duration in rows}
+
+    def get_by_ids(self, ids: List[int]) -> List[Movie]:
+        if not ids:
+            return []
+        movies = {movie.id: movie for movie in self.db.query(Movie).filter(Movie.id.in_(ids)).all()}
+        return [movies[movie_id] for movie_id in ids if movie_id in movies]
@@ -0,0 +1,212 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from typing import List
+import logging
+import threading
+from app.core.config import settings
+from app.core.tracing import traced_class
+from app.models.domain.movie import Movie
+from app.utils.search_index import InvertedIndex, tokenize
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELD_WEIGHTS = {
+    "title": 10.0,
+    "cast": 4.0,
+    "director": 4.0,
+    "genre": 3.0,
+    "synopsis": 1.0,
+}
+
+POSTGRES_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(movies.title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(movies.\"cast\", '') || ' ' || coalesce(movies.director, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(movies.genre, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(movies.synopsis, '')), 'D')"
+)
+
+MAX_CANDIDATE_IDS = 10000
+
+_sqlite_fts_available = None
+_memory_index = InvertedIndex(SEARCH_FIELD_WEIGHTS)
+_memory_index_loaded = False
+_memory_index_lock = threading.Lock()
+
+
+def _movie_fields(movie: Movie) -> dict:
+    return {
+        "title": movie.title or "",
+        "cast": movie.cast or "",
+        "director": movie.director or "",
+        "genre": movie.genre or "",
+        "synopsis": movie.synopsis or "",
+    }
+
+
+def init_search_index(engine: Engine):
+    global _sqlite_fts_available
+
+    if settings.SEARCH_BACKEND == "memory":
+        return
+
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                conn.exec_driver_sql(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5("
+                    "title, cast_names, director, genre, synopsis, "
+                    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+                )
+                indexed = conn.exec_driver_sql("SELECT count(*) FROM movies_fts").scalar()
+                expected = conn.exec_driver_sql("SELECT count(*) FROM movies").scalar()
+                if indexed != expected:
+                    if indexed:
+                        logger.warning(f"Rebuilding movies_fts: {indexed} rows indexed for {expected} movies")
+                        conn.exec_driver_sql("DELETE FROM movies_fts")
+                    conn.exec_driver_sql(
+                        "INSERT INTO movies_fts(rowid, title, cast_names, director, genre, synopsis) "
+                        "SELECT id, title, \"cast\", director, genre, synopsis FROM movies"
+                    )
+                _sqlite_fts_available = True
+            elif dialect == "postgresql":
+                conn.exec_driver_sql(
+                    f"CREATE INDEX IF NOT EXISTS ix_movies_search_document ON movies USING GIN (({POSTGRES_SEARCH_DOCUMENT}))"
+                )
+    except Exception as e:
+        if dialect == "sqlite":
+            _sqlite_fts_available = False
+        logger.warning(f"Full-text search index unavailable, using in-memory index: {e}")
+
+
+class SqliteFtsSearch:
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        return " ".join(f'"{token}"*' for token in tokenize(query))
+
+    def search_ids(self, query: str, skip: int = 0, limit: int = 100) -> List[int]:
+        match = self._match_expression(query)
+        if not match:
+            return []
+        rows = self.db.execute(
+            text(
+                "SELECT movies.id FROM movies_fts JOIN movies ON movies.id = movies_fts.rowid "
+                "WHERE movies_fts MATCH :match AND movies.is_active = 1 "
+                "ORDER BY bm25(movies_fts, :w_title, :w_cast, :w_director, :w_genre, :w_synopsis), movies.id "
+                "LIMIT :limit OFFSET :skip"
+            ),
+            {
+                "match": match,
+                "limit": limit,
+                "skip": skip,
+                **{f"w_{field}": weight for field, weight in SEARCH_FIELD_WEIGHTS.items()},
+            }
+        )
+        return [row[0] for row in rows]
+
+    def index_movie(self, movie: Movie):
+        fields = _movie_fields(movie)
+        self.db.execute(text("DELETE FROM movies_fts WHERE rowid = :id"), {"id": movie.id})
+        self.db.execute(
+            text(
+                "INSERT INTO movies_fts(rowid, title, cast_names, director, genre, synopsis) "
+                "VALUES (:id, :title, :cast, :director, :genre, :synopsis)"
+            ),
+            {"id": movie.id, **fields}
+        )
+
+    def remove_movie(self, movie_id: int):
+        self.db.execute(text("DELETE FROM movies_fts WHERE rowid = :id"), {"id": movie_id})
+
+
+class PostgresFtsSearch:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search_ids(self, query: str, skip: int = 0, limit: int = 100) -> List[int]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        rows = self.db.execute(
+            text(
+                f"SELECT movies.id FROM movies, to_tsquery('english', :tsquery) AS query "
+                f"WHERE ({POSTGRES_SEARCH_DOCUMENT}) @@ query AND movies.is_active "
+                f"ORDER BY ts_rank({POSTGRES_SEARCH_DOCUMENT}, query) DESC, movies.id "
+                f"LIMIT :limit OFFSET :skip"
+            ),
+            {"tsquery": " & ".join(f"{token}:*" for token in tokens), "limit": limit, "skip": skip}
+        )
+        return [row[0] for row in rows]
+
+    def index_movie(self, movie: Movie):
+        pass
+
+    def remove_movie(self, movie_id: int):
+        pass
+
+
+class InMemorySearch:
+    def __init__(self, db: Session):
+        self.db = db
+        self._ensure_loaded()
+
+    def _ensure_loaded(self):
+        global _memory_index_loaded
+        if _memory_index_loaded:
+            return
+        with _memory_index_lock:
+            if _memory_index_loaded:
+                return
+            for movie in self.db.query(Movie).filter(Movie.is_active == True).yield_per(500):
+                _memory_index.add(movie.id, _movie_fields(movie))
+            _memory_index_loaded = True
+
+    def search_ids(self, query: str, skip: int = 0, limit: int = 100) -> List[int]:
+        return [movie_id for movie_id, _ in _memory_index.search(query)[skip:skip + limit]]
+
+    def index_movie(self, movie: Movie):
+        if movie.is_active:
+            _memory_index.add(movie.id, _movie_fields(movie))
+        else:
+            _memory_index.remove(movie.id)
+
+    def remove_movie(self, movie_id: int):
+        _memory_index.remove(movie_id)
+
+
+@traced_class("repository")
+class MovieSearchRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.backend = self._select_backend(db)
+
+    @staticmethod
+    def _select_backend(db: Session):
+        if settings.SEARCH_BACKEND != "memory":
+            dialect = db.get_bind().dialect.name
+            if dialect == "sqlite" and _sqlite_fts_available:
+                return SqliteFtsSearch(db)
+            if dialect == "postgresql":
+                return PostgresFtsSearch(db)
+        return InMemorySearch(db)
+
+    def search(self, query: str, skip: int = 0, limit: int = 100) -> List[Movie]:
+        ids = self.backend.search_ids(query, skip, limit)
+        if not ids:
+            return []
+        movies = {movie.id: movie for movie in self.db.query(Movie).filter(Movie.id.in_(ids)).all()}
+        return [movies[movie_id] for movie_id in ids if movie_id in movies]
+
+    def search_all_ids(self, query: str) -> List[int]:
+        return self.backend.search_ids(query, 0, MAX_CANDIDATE_IDS)
+
+    def index_movie(self, movie: Movie):
+        self.backend.index_movie(movie)
+
+    def remove_movie(self, movie_id: int):
+        self.backend.remove_movie(movie_id)
@@ -0,0 +1,78 @@
+from sqlalchemy import bindparam, func, insert, update
+from sqlalchemy.orm import Session
+from typing import Dict, List, Tuple
+from datetime import datetime, timedelta
+import json
+from app.models.domain.outbox import OutboxEvent
+from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
+
+
+@traced_class("repository")
+class OutboxRepository(BaseRepository[OutboxEvent]):
+    def __init__(self, db: Session):
+        super().__init__(OutboxEvent, db)
+
+    def add_events(self, events: List[Tuple[str, int, dict]]):
+        if not events:
+            return
+        now = datetime.utcnow()
+        self.db.execute(insert(OutboxEvent), [
+            {
+                "event_type": event_type,
+                "aggregate_id": aggregate_id,
+                "payload": json.dumps(payload, default=str),
+                "created_at": now,
+                "available_at": now,
+                "attempts": 0,
+            }
+            for event_type, aggregate_id, payload in events
+        ])
+
+    def claim_batch(self, now: datetime, limit: int, max_attempts: int) -> List[OutboxEvent]:
+        return self.db.query(OutboxEvent).filter(
+            OutboxEvent.dispatched_at.is_(None),
+            OutboxEvent.available_at <= now,
+            OutboxEvent.attempts < max_attempts
+        ).order_by(OutboxEvent.id).limit(limit).with_for_update(skip_locked=True).all()
+
+    def mark_dispatched(self, event_ids: List[int], now: datetime) -> int:
+        if not event_ids:
+            return 0
+        return self.db.query(OutboxEvent).filter(OutboxEvent.id.in_(event_ids)).update(
+            {"dispatched_at": now, "attempts": OutboxEvent.attempts + 1}, synchronize_session=False
+        )
+
+    def mark_failed(self, failures: Dict[int, Tuple[int, str]], now: datetime, retry_base_seconds: float):
+        if not failures:
+            return
+        table = OutboxEvent.__table__
+        self.db.execute(
+            update(table).where(table.c.id == bindparam("b_id")).values(
+                attempts=bindparam("b_attempts"),
+                available_at=bindparam("b_available_at"),
+                last_error=bindparam("b_error")
+            ),
+            [
+                {
+                    "b_id": event_id,
+                    "b_attempts": attempts + 1,
+                    "b_available_at": now + timedelta(seconds=retry_base_seconds * 2 ** attempts),
+                    "b_error": error[:500],
+                }
+                for event_id, (attempts, error) in failures.items()
+            ]
+        )
+
+    def purge_dispatched(self, before: datetime) -> int:
+        return self.db.query(OutboxEvent).filter(
+            OutboxEvent.dispatched_at.isnot(None),
+            OutboxEvent.dispatched_at < before
+        ).delete(synchronize_session=False)
+
+    def get_backlog(self, max_attempts: int) -> Dict[str, int]:
+        pending, dead = self.db.query(
+            func.count(OutboxEvent.id).filter(OutboxEvent.attempts < max_attempts),
+            func.count(OutboxEvent.id).filter(OutboxEvent.attempts >= max_attempts)
+        ).filter(OutboxEvent.dispatched_at.is_(None)).one()
+        return {"pending": pending, "dead": dead}
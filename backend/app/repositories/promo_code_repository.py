@@ -0,0 +1,59 @@
+from sqlalchemy import bindparam, case, or_, update
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from datetime import datetime
+from app.models.domain.promo_code import PromoCode
+from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
+
+
+@traced_class("repository")
+class PromoCodeRepository(BaseRepository[PromoCode]):
+    def __init__(self, db: Session):
+        super().__init__(PromoCode, db)
+
+    def get_by_code(self, code: str) -> Optional[PromoCode]:
+        return self.db.query(PromoCode).filter(PromoCode.code == code).first()
+
+    def get_redeemable(self, now: datetime) -> List[PromoCode]:
+        return self.db.query(PromoCode).filter(
+            PromoCode.is_active == True,
+            PromoCode.valid_until >= now,
+            or_(PromoCode.max_usage.is_(None), PromoCode.usage_count < PromoCode.max_usage)
+        ).all()
+
+    def redeem(self, promo_code_id: int, now: datetime) -> bool:
+        return bool(self.db.query(PromoCode).filter(
+            PromoCode.id == promo_code_id,
+            PromoCode.is_active == True,
+            PromoCode.valid_from <= now,
+            PromoCode.valid_until >= now,
+            or_(PromoCode.max_usage.is_(None), PromoCode.usage_count < PromoCode.max_usage)
+        ).update(
+            {"usage_count": PromoCode.usage_count + 1}, synchronize_session=False
+        ))
+
+    def release(self, promo_code_id: int) -> bool:
+        return bool(self.db.query(PromoCode).filter(
+            PromoCode.id == promo_code_id,
+            PromoCode.usage_count > 0
+        ).update(
+            {"usage_count": PromoCode.usage_count - 1}, synchronize_session=False
+        ))
+
+    def release_many(self, counts: Dict[int, int]) -> bool:
+        if not counts:
+            return False
+        table = PromoCode.__table__
+        statement = update(table).where(
+            table.c.id == bindparam("b_id"),
+            table.c.usage_count > 0
+        ).values(
+            usage_count=case(
+                (table.c.usage_count > bindparam("b_count"), table.c.usage_count - bindparam("b_count")),
+                else_=0
+            )
+        )
+        return self.db.execute(statement, [
+            {"b_id": promo_code_id, "b_count": count} for promo_code_id, count in counts.items()
+        ]).rowcount > 0
@@ -0,0 +1,137 @@
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from app.models.domain.movie import Movie
+from app.models.domain.review import Review, MovieRatingAggregate
+from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
+
+
+@traced_class("repository")
+class ReviewRepository(BaseRepository[Review]):
+    def __init__(self, db: Session):
+        super().__init__(Review, db)
+
+    def get_by_movie(self, movie_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+        return self.db.query(Review).filter(
+            Review.movie_id == movie_id,
+            Review.is_approved == True,
+            Review.is_active == True
+        ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
+
+    def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+        return self.db.query(Review).filter(
+            Review.user_id == user_id
+        ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
+
+    def get_by_user_and_movie(self, user_id: int, movie_id: int) -> Optional[Review]:
+        return self.db.query(Review).filter(
+            Review.user_id == user_id,
+            Review.movie_id == movie_id
+        ).first()
+
+    def get_rating_totals(self) -> Dict[int, Tuple[int, float]]:
+        rows = self.db.query(
+            Review.movie_id, func.count(Review.id), func.sum(Review.rating)
+        ).filter(
+            Review.is_approved == True,
+            Review.is_active == True
+        ).group_by(Review.movie_id).all()
+        return {movie_id: (count, total or 0.0) for movie_id, count, total in rows}
+
+    def get_rating_aggregate(self, movie_id: int) -> Optional[MovieRatingAggregate]:
+        return self.db.query(MovieRatingAggregate).filter(
+            MovieRatingAggregate.movie_id == movie_id
+        ).first()
+
+    def get_rating_aggregates(self, movie_ids: Optional[List[int]] = None) -> List[MovieRatingAggregate]:
+        query = self.db.query(MovieRatingAggregate)
+        if movie_ids is not None:
+            query = query.filter(MovieRatingAggregate.movie_id.in_(movie_ids))
+        return query.all()
+
+    def get_pending(self, after_id: Optional[int] = None, limit: int = 50) -> List[Review]:
+        query = self.db.query(Review).filter(
+            Review.is_approved == False,
+            Review.is_active == True
+        )
+        if after_id is not None:
+            query = query.filter(Review.id > after_id)
+        return query.order_by(Review.id).limit(limit).all()
+
+    def get_moderation_rows(self, review_ids: List[int]) -> List[Tuple[int, int, float, bool, bool]]:
+        return self.db.query(
+            Review.id, Review.movie_id, Review.rating, Review.is_approved, Review.is_active
+        ).filter(Review.id.in_(review_ids)).with_for_update().all()
+
+    def set_moderation(self, review_ids: List[int], approved: bool) -> int:
+        if not review_ids:
+            return 0
+        return self.db.query(Review).filter(Review.id.in_(review_ids)).update(
+            {"is_approved": approved, "is_active": approved}, synchronize_session=False
+        )
+
+    def apply_rating_deltas(self, deltas: Dict[int, Tuple[int, float]], prior_mean: float,
+                            prior_weight: float) -> List[int]:
+        deltas = {movie_id: delta for movie_id, delta in deltas.items() if delta[0] or delta[1]}
+        if not deltas:
+            return []
+
+        table = MovieRatingAggregate.__table__
+        statement = update(table).where(table.c.movie_id == bindparam("b_movie_id")).values(
+            review_count=table.c.review_count + bindparam("b_count"),
+            rating_sum=table.c.rating_sum + bindparam("b_sum"),
+            bayesian_rating=(prior_weight * prior_mean + table.c.rating_sum + bindparam("b_sum"))
+                            / (prior_weight + table.c.review_count + bindparam("b_count"))
+        )
+        existing = {
+            movie_id for (movie_id,) in self.db.query(MovieRatingAggregate.movie_id).filter(
+                MovieRatingAggregate.movie_id.in_(list(deltas))
+            )
+        }
+        params = {
+            movie_id: {"b_movie_id": movie_id, "b_count": count, "b_sum": total}
+            for movie_id, (count, total) in deltas.items()
+        }
+        updates = [params[movie_id] for movie_id in deltas if movie_id in existing]
+        if updates:
+            self.db.execute(statement, updates)
+
+        missing = [movie_id for movie_id in deltas if movie_id not in existing]
+        if not missing:
+            return list(deltas)
+        try:
+            with self.db.begin_nested():
+                self.db.execute(insert(table), [
+                    {
+                        "movie_id": movie_id,
+                        "review_count": deltas[movie_id][0],
+                        "rating_sum": deltas[movie_id][1],
+                        "bayesian_rating": (prior_weight * prior_mean + deltas[movie_id][1])
+                                           / (prior_weight + deltas[movie_id][0]),
+                    }
+                    for movie_id in missing
+                ])
+        except IntegrityError:
+            self.db.execute(statement, [params[movie_id] for movie_id in missing])
+        return list(deltas)
+
+    def save_rating_aggregates(self, updates: List[dict], inserts: List[dict]):
+        if updates:
+            self.db.execute(update(MovieRatingAggregate), updates)
+        if inserts:
+            self.db.execute(insert(MovieRatingAggregate), inserts)
+
+    def sync_movie_ratings(self, movie_ids: List[int], scale: float):
+        if not movie_ids:
+            return
+        movies = Movie.__table__
+        aggregates = MovieRatingAggregate.__table__
+        self.db.execute(
+            update(movies).where(movies.c.id.in_(movie_ids)).values(
+                rating=select(aggregates.c.bayesian_rating * scale).where(
+                    aggregates.c.movie_id == movies.c.id
+                ).scalar_subquery()
+            )
+        )
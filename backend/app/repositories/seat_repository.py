@@ -1,9 +1,11 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.models.domain.seat import Seat, SeatStatus, SeatCategory
 from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
 
 
+@traced_class("repository")
 class SeatRepository(BaseRepository[Seat]):
     def __init__(self, db: Session):
         super().__init__(Seat, db)
@@ -35,3 +37,19 @@ class SeatRepository(BaseRepository[Seat]):
             Seat.screen_id == screen_id,
             Seat.category == category
         ).all()
+
+    def get_pricing_rows(self, screen_id: int) -> List[Tuple[int, str]]:
+        return [
+            (seat_id, category.value)
+            for seat_id, category in self.db.query(Seat.id, Seat.category).filter(
+                Seat.screen_id == screen_id,
+                Seat.is_active == True
+            )
+        ]
+
+    def set_status(self, seat_ids: List[int], status: SeatStatus) -> int:
+        if not seat_ids:
+            return 0
+        return self.db.query(Seat).filter(Seat.id.in_(seat_ids)).update(
+            {"status": status}, synchronize_session=False
+        )
@@ -1,10 +1,15 @@
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from app.models.domain.booking import Booking, BookingStatus, Ticket
+from app.models.domain.cinema import Cinema, Screen
 from app.models.domain.showtime import Showtime
 from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
 
 
+@traced_class("repository")
 class ShowtimeRepository(BaseRepository[Showtime]):
     def __init__(self, db: Session):
         super().__init__(Showtime, db)
@@ -24,16 +29,126 @@ class ShowtimeRepository(BaseRepository[Showtime]):
             Showtime.screen_id == screen_id
         ).offset(skip).limit(limit).all()
 
-    def get_upcoming_showtimes(self, movie_id: int, skip: int = 0, limit: int = 100) -> List[Showtime]:
-        return self.db.query(Showtime).filter(
+    def get_upcoming_showtimes(self, movie_id: int, start: datetime, end: datetime,
+                               batch_size: int = 100) -> Iterator[Tuple[Showtime, Optional[str]]]:
+        return self.db.query(Showtime, Cinema.timezone).join(
+            Cinema, Cinema.id == Showtime.cinema_id
+        ).filter(
             Showtime.movie_id == movie_id,
-            Showtime.start_time >= datetime.utcnow()
-        ).offset(skip).limit(limit).all()
+            Showtime.is_active == True,
+            Showtime.start_time >= start,
+            Showtime.start_time < end
+        ).order_by(Showtime.start_time, Showtime.id).yield_per(batch_size)
 
-    def get_showtimes_by_date_range(self, movie_id: int, cinema_id: int, 
-                                    start_date: datetime, end_date: datetime) -> List[Showtime]:
-        return self.db.query(Showtime).filter(
-            Showtime.movie_id == movie_id,
-            Showtime.cinema_id == cinema_id,
-            Showtime.start_time.between(start_date, end_date)
+    def get_showtimes_by_date_range(self, start_date: datetime, end_date: datetime,
+                                    movie_id: Optional[int] = None,
+                                    cinema_id: Optional[int] = None) -> List[Showtime]:
+        query = self.db.query(Showtime).filter(Showtime.start_time.between(start_date, end_date))
+        if movie_id is not None:
+            query = query.filter(Showtime.movie_id == movie_id)
+        if cinema_id is not None:
+            query = query.filter(Showtime.cinema_id == cinema_id)
+        return query.order_by(Showtime.start_time).all()
+
+    def iter_window(self, start: datetime, end: datetime, city: Optional[str] = None,
+                    cinema_id: Optional[int] = None, movie_id: Optional[int] = None,
+                    batch_size: int = 500) -> Iterator[Tuple]:
+        query = self.db.query(
+            Showtime.id, Showtime.movie_id, Showtime.cinema_id, Showtime.screen_id,
+            Showtime.start_time, Showtime.end_time, Showtime.base_price, Showtime.available_seats,
+            Cinema.timezone
+        ).join(
+            Cinema, Cinema.id == Showtime.cinema_id
+        ).filter(
+            Cinema.is_active == True,
+            Showtime.is_active == True,
+            Showtime.start_time >= start,
+            Showtime.start_time < end
+        )
+        if city:
+            query = query.filter(Cinema.city == city)
+        if cinema_id is not None:
+            query = query.filter(Showtime.cinema_id == cinema_id)
+        if movie_id is not None:
+            query = query.filter(Showtime.movie_id == movie_id)
+        return query.order_by(Showtime.start_time, Showtime.id).yield_per(batch_size)
+
+    def get_listing_rows(self, city: str, start: datetime, end: datetime) -> List[Tuple]:
+        return self.db.query(
+            Showtime, Cinema.name, Cinema.location, Screen.screen_number, Screen.screen_type
+        ).join(
+            Cinema, Cinema.id == Showtime.cinema_id
+        ).outerjoin(
+            Screen, Screen.id == Showtime.screen_id
+        ).filter(
+            Cinema.city == city,
+            Cinema.is_active == True,
+            Showtime.is_active == True,
+            Showtime.start_time >= start,
+            Showtime.start_time < end
+        ).order_by(Showtime.movie_id, Showtime.cinema_id, Showtime.start_time).all()
+
+    def get_screen_intervals(self, screen_ids: List[int], start: datetime, end: datetime) -> List[Tuple]:
+        return self.db.query(
+            Showtime.id, Showtime.screen_id, Showtime.start_time, Showtime.end_time
+        ).filter(
+            Showtime.screen_id.in_(screen_ids),
+            Showtime.is_active == True,
+            Showtime.start_time < end,
+            Showtime.end_time > start
         ).all()
+
+    def lock_screens(self, screen_ids: List[int]):
+        self.db.query(Screen.id).filter(Screen.id.in_(screen_ids)).with_for_update().all()
+
+    def bulk_create(self, rows: List[dict], batch_size: int = 1000) -> int:
+        for start in range(0, len(rows), batch_size):
+            self.db.execute(insert(Showtime), rows[start:start + batch_size])
+        return len(rows)
+
+    def reserve_seats(self, showtime_id: int, count: int) -> Optional[int]:
+        reserved = self.db.query(Showtime).filter(
+            Showtime.id == showtime_id,
+            Showtime.is_active == True,
+            Showtime.available_seats >= count
+        ).update(
+            {"available_seats": Showtime.available_seats - count}, synchronize_session=False
+        )
+        if not reserved:
+            return None
+        return self.db.query(Showtime.available_seats).filter(Showtime.id == showtime_id).scalar()
+
+    def release_seats_many(self, counts: Dict[int, int]) -> Dict[int, int]:
+        if not counts:
+            return {}
+        table = Showtime.__table__
+        self.db.execute(
+            update(table).where(table.c.id == bindparam("b_id")).values(
+                available_seats=table.c.available_seats + bindparam("b_count")
+            ),
+            [{"b_id": showtime_id, "b_count": count} for showtime_id, count in counts.items()]
+        )
+        return dict(self.db.query(Showtime.id, Showtime.available_seats).filter(Showtime.id.in_(list(counts))).all())
+
+    def get_seat_drift(self, since: datetime) -> List[Tuple[int, int, int]]:
+        booked = select(func.count(Ticket.id)).join(
+            Booking, Booking.id == Ticket.booking_id
+        ).where(
+            Booking.showtime_id == Showtime.id,
+            Booking.status != BookingStatus.CANCELLED,
+            Booking.is_active == True
+        ).correlate(Showtime).scalar_subquery()
+        capacity = select(Screen.total_seats).where(
+            Screen.id == Showtime.screen_id
+        ).correlate(Showtime).scalar_subquery()
+        expected = capacity - booked
+
+        return self.db.query(Showtime.id, Showtime.available_seats, expected).filter(
+            Showtime.is_active == True,
+            Showtime.start_time >= since,
+            Showtime.available_seats != expected
+        ).all()
+
+    def set_available_seats(self, counts: List[dict]):
+        if counts:
+            self.db.execute(update(Showtime), counts)
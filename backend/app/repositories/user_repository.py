@@ -2,8 +2,10 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from app.models.domain.user import User
 from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
 
 
+@traced_class("repository")
 class UserRepository(BaseRepository[User]):
     def __init__(self, db: Session):
         super().__init__(User, db)
@@ -0,0 +1,33 @@
+from sqlalchemy.orm import Session
+from typing import List, Set
+from app.models.domain.watchlist import Watchlist
+from app.repositories.base import BaseRepository
+from app.core.tracing import traced_class
+
+
+@traced_class("repository")
+class WatchlistRepository(BaseRepository[Watchlist]):
+    def __init__(self, db: Session):
+        super().__init__(Watchlist, db)
+
+    def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Watchlist]:
+        return self.db.query(Watchlist).filter(
+            Watchlist.user_id == user_id,
+            Watchlist.is_active == True
+        ).order_by(Watchlist.created_at.desc()).offset(skip).limit(limit).all()
+
+    def get_movie_ids(self, user_id: int) -> Set[int]:
+        return {
+            movie_id for (movie_id,) in self.db.query(Watchlist.movie_id).filter(
+                Watchlist.user_id == user_id,
+                Watchlist.is_active == True
+            )
+        }
+
+    def remove(self, user_id: int, movie_id: int) -> bool:
+        removed = self.db.query(Watchlist).filter(
+            Watchlist.user_id == user_id,
+            Watchlist.movie_id == movie_id
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return bool(removed)
@@ -0,0 +1,62 @@
+from typing import Optional
+import logging
+import threading
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.booking_service import BookingService
+
+logger = logging.getLogger(__name__)
+
+
+class BookingExpiryWorker:
+    def __init__(self, interval: float = 60.0, batch_size: int = 500):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.runs = 0
+        self.expired = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> dict:
+        db = SessionLocal()
+        try:
+            result = BookingService(db).expire_pending_bookings(batch_size=self.batch_size)
+        finally:
+            db.close()
+        self.runs += 1
+        self.expired += result["cancelled"]
+        if result["cancelled"]:
+            logger.info(
+                f"Expired {result['cancelled']} pending bookings booked before {result['cutoff'].isoformat()}, "
+                f"releasing {result['seats_released']} seats"
+            )
+        return result
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"Booking expiry run failed: {e}")
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="booking-expiry", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {"runs": self.runs, "expired": self.expired}
+
+
+booking_expiry_worker = BookingExpiryWorker(
+    interval=settings.BOOKING_EXPIRY_INTERVAL_SECONDS,
+    batch_size=settings.BOOKING_EXPIRY_BATCH_SIZE,
+)
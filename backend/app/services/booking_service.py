@@ -1,39 +1,112 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
+from app.core.config import settings
+from app.core.metrics import registry
 from app.models.domain.booking import Booking, Ticket, BookingStatus, PaymentStatus
 from app.models.schemas.booking_schema import BookingCreate, BookingUpdate
 from app.repositories.booking_repository import BookingRepository, TicketRepository
+from app.repositories.outbox_repository import OutboxRepository
+from app.repositories.seat_repository import SeatRepository
+from app.repositories.showtime_repository import ShowtimeRepository
+from app.services.listings_service import ListingsService
+from app.services.outbox_service import OutboxMessage, outbox_dispatcher
+from app.services.pricing_service import PricingService
+from app.services.promo_code_service import PromoCodeService, promo_codes
 from app.services.seat_service import SeatService
 from app.models.domain.seat import SeatStatus
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from app.core.tracing import traced_class
+from app.utils.qr_images import QRImageCache
+from app.utils.ticket_tokens import TicketSigner, derive_key
 
 
+ISSUED_STATUSES = (BookingStatus.CONFIRMED, BookingStatus.COMPLETED)
+
+ticket_signer = TicketSigner(derive_key(settings.TICKET_SIGNING_KEY or settings.SECRET_KEY))
+ticket_qr_images = QRImageCache(
+    workers=settings.TICKET_QR_WORKERS,
+    max_entries=settings.TICKET_QR_CACHE_MAX_ENTRIES,
+    scale=settings.TICKET_QR_SCALE,
+)
+registry.register_cache("ticket_qr_images", ticket_qr_images.stats)
+
+
+def prerender_ticket_images(messages: List[OutboxMessage]):
+    if settings.TICKET_QR_PRERENDER:
+        for message in messages:
+            ticket_qr_images.prerender(message.payload["qr_codes"])
+
+
+outbox_dispatcher.register("booking.confirmed", prerender_ticket_images)
+
+
+@traced_class("service")
 class BookingService:
     def __init__(self, db: Session):
         self.repository = BookingRepository(db)
         self.ticket_repository = TicketRepository(db)
         self.seat_service = SeatService(db)
+        self.seat_repository = SeatRepository(db)
+        self.showtime_repository = ShowtimeRepository(db)
+        self.listings_service = ListingsService(db)
+        self.promo_code_service = PromoCodeService(db)
+        self.pricing_service = PricingService(db)
+        self.ticket_service = TicketService(db)
+        self.outbox = OutboxRepository(db)
 
     def create_booking(self, user_id: int, booking_create: BookingCreate) -> Booking:
-        booking = Booking(
-            user_id=user_id,
-            showtime_id=booking_create.showtime_id,
-            total_price=booking_create.total_price,
-            promo_code_id=booking_create.promo_code_id
+        seat_ids = [ticket_data.seat_id for ticket_data in booking_create.tickets]
+        quote = self.pricing_service.quote(
+            booking_create.showtime_id, seat_ids, booking_create.promo_code, booking_create.promo_code_id
         )
-        created_booking = self.repository.create(booking)
-        
-        for ticket_data in booking_create.tickets:
-            ticket = Ticket(
-                booking_id=created_booking.id,
-                seat_id=ticket_data.seat_id,
-                ticket_category=ticket_data.ticket_category,
-                price=ticket_data.price
-            )
-            self.ticket_repository.create(ticket)
-            self.seat_service.update_seat_status(ticket_data.seat_id, SeatStatus.BOOKED)
-        
-        return created_booking
+        if booking_create.total_price is not None and abs(booking_create.total_price - quote["total"]) > 0.005:
+            raise ValueError(f"Price has changed to {quote['total']:.2f}; please request a new quote")
+        promo = quote["promo"]
+
+        try:
+            available_seats = self.showtime_repository.reserve_seats(booking_create.showtime_id, len(seat_ids))
+            if available_seats is None:
+                raise ValueError("Showtime not found or not enough seats available")
+            if promo:
+                self.promo_code_service.redeem(promo)
+
+            booking = self.repository.add(Booking(
+                user_id=user_id,
+                showtime_id=booking_create.showtime_id,
+                total_price=quote["total"],
+                promo_code_id=quote["promo_code_id"],
+                discount_amount=quote["discount_amount"]
+            ))
+            self.ticket_repository.add_all([
+                Ticket(
+                    booking_id=booking.id,
+                    seat_id=ticket_data.seat_id,
+                    ticket_category=ticket_data.ticket_category,
+                    price=line["price"]
+                )
+                for ticket_data, line in zip(booking_create.tickets, quote["tickets"])
+            ])
+            self.seat_repository.set_status(seat_ids, SeatStatus.BOOKED)
+            self.outbox.add_events([("booking.created", booking.id, {
+                "user_id": user_id,
+                "showtime_id": booking_create.showtime_id,
+                "seat_ids": seat_ids,
+                "total_price": quote["total"],
+                "promo_code_id": quote["promo_code_id"],
+            })])
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+
+        self.listings_service.patch_available_seats(booking_create.showtime_id, available_seats)
+        outbox_dispatcher.notify()
+        return booking
+
+    def quote_booking(self, showtime_id: int, seat_ids: List[int], promo_code: Optional[str] = None,
+                      promo_code_id: Optional[int] = None) -> dict:
+        return self.pricing_service.quote(showtime_id, seat_ids, promo_code, promo_code_id)
 
     def get_booking(self, booking_id: int) -> Optional[Booking]:
         return self.repository.get_by_id(booking_id)
@@ -51,38 +124,155 @@ class BookingService:
         return self.repository.get_by_status(status, skip, limit)
 
     def update_booking_status(self, booking_id: int, status: BookingStatus) -> Optional[Booking]:
+        booking = self.get_booking(booking_id)
+        if not booking:
+            return None
+        if status == BookingStatus.CANCELLED:
+            return self.cancel_booking(booking_id)
+        if booking.status == BookingStatus.CANCELLED:
+            raise ValueError("Cancelled bookings cannot be reopened")
+        if status in ISSUED_STATUSES:
+            return self._issue_tickets(booking, status)
         return self.repository.update(booking_id, {"status": status})
 
+    def _issue_tickets(self, booking: Booking, status: BookingStatus) -> Booking:
+        try:
+            changed = booking.status != status
+            booking.status = status
+            qr_codes = self.ticket_service.issue_tickets(booking)
+            if changed or qr_codes:
+                self.outbox.add_events([(f"booking.{status.value}", booking.id, {
+                    "user_id": booking.user_id,
+                    "showtime_id": booking.showtime_id,
+                    "qr_codes": qr_codes,
+                })])
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+
+        outbox_dispatcher.notify()
+        return booking
+
     def update_payment_status(self, booking_id: int, payment_status: PaymentStatus, 
                             stripe_payment_id: str = None) -> Optional[Booking]:
+        booking = self.get_booking(booking_id)
+        if not booking:
+            return None
         update_data = {"payment_status": payment_status}
         if stripe_payment_id:
             update_data["stripe_payment_id"] = stripe_payment_id
-        return self.repository.update(booking_id, update_data)
+        if not self.repository.set_payment_status(booking_id, update_data):
+            self.repository.rollback()
+            raise ValueError("Cancelled bookings cannot take payment updates")
+        self.repository.commit()
+        return booking
 
     def update_booking(self, booking_id: int, booking_update: BookingUpdate) -> Optional[Booking]:
         update_data = booking_update.model_dump(exclude_unset=True)
+        status = update_data.pop("status", None)
+        if status is not None:
+            if not self.update_booking_status(booking_id, status):
+                return None
         if update_data:
             return self.repository.update(booking_id, update_data)
         return self.get_booking(booking_id)
 
     def cancel_booking(self, booking_id: int) -> Optional[Booking]:
         booking = self.get_booking(booking_id)
-        if booking:
-            tickets = self.ticket_repository.get_by_booking(booking_id)
-            for ticket in tickets:
-                self.seat_service.update_seat_status(ticket.seat_id, SeatStatus.AVAILABLE)
-            
-            return self.repository.update(booking_id, {"status": BookingStatus.CANCELLED})
-        return None
+        if not booking:
+            return None
+        self.cancel_bookings([booking_id])
+        return booking
+
+    def _release_cancelled(self, cancelled: List[Tuple[int, int, Optional[int]]]) -> dict:
+        cancelled_ids = [booking_id for booking_id, _, _ in cancelled]
+        showtimes = {booking_id: showtime_id for booking_id, showtime_id, _ in cancelled}
+        tickets = self.ticket_repository.get_by_bookings(cancelled_ids)
+        seat_ids = [seat_id for _, seat_id, _ in tickets]
+        self.seat_repository.set_status(seat_ids, SeatStatus.AVAILABLE)
+        self.ticket_repository.clear_qr_codes(cancelled_ids)
+        seat_counts = Counter(booking_id for booking_id, _, _ in tickets)
+        self.outbox.add_events([
+            ("booking.cancelled", booking_id, {
+                "showtime_id": showtime_id,
+                "seats_released": seat_counts[booking_id],
+                "promo_code_id": promo_code_id,
+            })
+            for booking_id, showtime_id, promo_code_id in cancelled
+        ])
+        return {
+            "cancelled": len(cancelled_ids),
+            "seats_released": len(seat_ids),
+            "qr_codes": [qr_code for _, _, qr_code in tickets if qr_code],
+            "available_seats": self.showtime_repository.release_seats_many(
+                Counter(showtimes[booking_id] for booking_id, _, _ in tickets)
+            ),
+            "promo_released": self.promo_code_service.release_many(
+                Counter(promo_code_id for _, _, promo_code_id in cancelled if promo_code_id)
+            ),
+        }
+
+    def _after_release(self, released: dict) -> dict:
+        if released["cancelled"]:
+            outbox_dispatcher.notify()
+        ticket_qr_images.discard(released["qr_codes"])
+        for showtime_id, available in released["available_seats"].items():
+            self.listings_service.patch_available_seats(showtime_id, available)
+        if released["promo_released"]:
+            promo_codes.invalidate()
+        return {
+            "cancelled": released["cancelled"],
+            "seats_released": released["seats_released"],
+            "showtimes_affected": len(released["available_seats"]),
+        }
+
+    def _cancel(self, mark: Callable[[], List[Tuple[int, int, Optional[int]]]]) -> dict:
+        try:
+            released = self._release_cancelled(mark())
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        return self._after_release(released)
+
+    def cancel_bookings(self, booking_ids: List[int]) -> dict:
+        return self._cancel(lambda: self.repository.mark_cancelled_many(booking_ids))
+
+    def cancel_showtime_bookings(self, showtime_id: int) -> dict:
+        return self._cancel(lambda: self.repository.mark_showtime_cancelled(showtime_id))
+
+    def expire_pending_bookings(self, now: Optional[datetime] = None, batch_size: Optional[int] = None) -> dict:
+        cutoff = (now or datetime.utcnow()) - timedelta(minutes=settings.BOOKING_PENDING_TTL_MINUTES)
+        batch_size = batch_size or settings.BOOKING_EXPIRY_BATCH_SIZE
+        result = {"cancelled": 0, "seats_released": 0, "showtimes_affected": 0, "batches": 0}
+        while True:
+            booking_ids = self.repository.get_expired_pending(cutoff, batch_size)
+            if not booking_ids:
+                self.repository.rollback()
+                break
+            batch = self._cancel(lambda: self.repository.mark_expired_many(booking_ids))
+            result["batches"] += 1
+            for key in ("cancelled", "seats_released", "showtimes_affected"):
+                result[key] += batch[key]
+            if len(booking_ids) < batch_size:
+                break
+        result["cutoff"] = cutoff
+        return result
 
     def delete_booking(self, booking_id: int) -> bool:
-        booking = self.get_booking(booking_id)
-        if booking:
-            self.cancel_booking(booking_id)
-        return self.repository.delete(booking_id)
+        try:
+            released = self._release_cancelled(self.repository.mark_cancelled_many([booking_id]))
+            deleted = self.repository.delete_many([booking_id])
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        self._after_release(released)
+        return deleted > 0
 
 
+@traced_class("service")
 class TicketService:
     def __init__(self, db: Session):
         self.repository = TicketRepository(db)
@@ -93,8 +283,93 @@ class TicketService:
     def get_booking_tickets(self, booking_id: int) -> List[Ticket]:
         return self.repository.get_by_booking(booking_id)
 
+    def issue_tickets(self, booking: Booking) -> List[str]:
+        qr_codes = {
+            ticket_id: ticket_signer.sign(ticket_id, booking.showtime_id, seat_id)
+            for ticket_id, seat_id in self.repository.get_unissued(booking.id)
+        }
+        self.repository.set_qr_codes(qr_codes)
+        return list(qr_codes.values())
+
+    def get_qr_image(self, ticket: Ticket, booking: Booking) -> bytes:
+        if ticket.qr_code is None:
+            if booking.status not in ISSUED_STATUSES:
+                raise ValueError("Tickets are issued once the booking is confirmed")
+            try:
+                self.issue_tickets(booking)
+                self.repository.commit()
+            except Exception:
+                self.repository.rollback()
+                raise
+        return ticket_qr_images.render(ticket.qr_code, settings.TICKET_QR_RENDER_TIMEOUT_SECONDS)
+
     def mark_ticket_used(self, ticket_id: int) -> Optional[Ticket]:
-        return self.repository.update(ticket_id, {"is_used": True})
+        try:
+            self.repository.mark_used_by_id(ticket_id, datetime.utcnow())
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        return self.get_ticket(ticket_id)
+
+    @staticmethod
+    def _scan_time(scanned_at: Optional[datetime], now: datetime) -> datetime:
+        if scanned_at is None:
+            return now
+        if scanned_at.tzinfo is not None:
+            scanned_at = scanned_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return min(scanned_at, now)
+
+    def scan_tickets(self, scans: List[Tuple[str, Optional[datetime]]],
+                     showtime_id: Optional[int] = None) -> dict:
+        now = datetime.utcnow()
+        results = []
+        claimed: Dict[int, Tuple[str, datetime]] = {}
+        for payload, scanned_at in scans:
+            result = {"payload": payload, "result": None, "ticket_id": None, "seat_id": None, "used_at": None}
+            results.append(result)
+            claims = ticket_signer.verify(payload)
+            if claims is None:
+                result["result"] = "invalid"
+                continue
+            result["ticket_id"] = claims.ticket_id
+            result["seat_id"] = claims.seat_id
+            if showtime_id is not None and claims.showtime_id != showtime_id:
+                result["result"] = "wrong_showtime"
+            elif claims.ticket_id in claimed:
+                result["result"] = "duplicate"
+            else:
+                claimed[claims.ticket_id] = (payload, self._scan_time(scanned_at, now))
+
+        try:
+            admitted = set(self.repository.mark_used(claimed))
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+
+        rejected = [ticket_id for ticket_id in claimed if ticket_id not in admitted]
+        states = self.repository.get_scan_states(rejected) if rejected else {}
+        for result in results:
+            if result["result"] is not None:
+                continue
+            ticket_id = result["ticket_id"]
+            if ticket_id in admitted:
+                result["result"] = "admitted"
+                result["used_at"] = claimed[ticket_id][1]
+                continue
+            qr_code, is_used, used_at = states.get(ticket_id, (None, False, None))
+            if qr_code != result["payload"]:
+                result["result"] = "revoked"
+            else:
+                result["result"] = "already_used"
+                result["used_at"] = used_at
+
+        return {
+            "admitted": len(admitted),
+            "rejected": len(results) - len(admitted),
+            "results": results,
+        }
 
     def get_all_tickets(self, skip: int = 0, limit: int = 100) -> List[Ticket]:
         return self.repository.get_all(skip, limit)
@@ -3,8 +3,11 @@ from typing import Optional, List
 from app.models.domain.cinema import Cinema, Screen
 from app.models.schemas.cinema_schema import CinemaCreate, CinemaUpdate, ScreenCreate, ScreenUpdate
 from app.repositories.cinema_repository import CinemaRepository, ScreenRepository
+from app.services.listings_service import schedule_snapshots
+from app.core.tracing import traced_class
 
 
+@traced_class("service")
 class CinemaService:
     def __init__(self, db: Session):
         self.repository = CinemaRepository(db)
@@ -15,7 +18,8 @@ class CinemaService:
             city=cinema_create.city,
             location=cinema_create.location,
             phone=cinema_create.phone,
-            email=cinema_create.email
+            email=cinema_create.email,
+            timezone=cinema_create.timezone
         )
         return self.repository.create(cinema)
 
@@ -34,13 +38,19 @@ class CinemaService:
     def update_cinema(self, cinema_id: int, cinema_update: CinemaUpdate) -> Optional[Cinema]:
         update_data = cinema_update.model_dump(exclude_unset=True)
         if update_data:
-            return self.repository.update(cinema_id, update_data)
+            cinema = self.repository.update(cinema_id, update_data)
+            schedule_snapshots.clear()
+            return cinema
         return self.get_cinema(cinema_id)
 
     def delete_cinema(self, cinema_id: int) -> bool:
-        return self.repository.delete(cinema_id)
+        deleted = self.repository.delete(cinema_id)
+        if deleted:
+            schedule_snapshots.clear()
+        return deleted
 
 
+@traced_class("service")
 class ScreenService:
     def __init__(self, db: Session):
         self.repository = ScreenRepository(db)
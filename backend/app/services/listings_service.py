@@ -0,0 +1,94 @@
+from sqlalchemy.orm import Session
+from datetime import date, datetime, time, timedelta
+from typing import Iterable
+from app.core.config import settings
+from app.core.metrics import registry
+from app.repositories.cinema_repository import CinemaRepository
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.showtime_repository import ShowtimeRepository
+from app.core.tracing import traced_class
+from app.utils.schedule_snapshot import ScheduleSnapshot, ScheduleSnapshotStore
+
+
+schedule_snapshots = ScheduleSnapshotStore(
+    ttl_seconds=settings.SCHEDULE_SNAPSHOT_TTL_SECONDS,
+    max_entries=settings.SCHEDULE_SNAPSHOT_MAX_ENTRIES,
+)
+registry.register_cache("schedule_snapshots", schedule_snapshots.stats)
+
+
+@traced_class("service")
+class ListingsService:
+    def __init__(self, db: Session):
+        self.showtime_repository = ShowtimeRepository(db)
+        self.movie_repository = MovieRepository(db)
+        self.cinema_repository = CinemaRepository(db)
+
+    def get_listings(self, city: str, day: date) -> dict:
+        start = datetime.combine(day, time.min)
+        rows = self.showtime_repository.get_listing_rows(city, start, start + timedelta(days=1))
+
+        cinemas_by_movie = {}
+        for showtime, cinema_name, cinema_location, screen_number, screen_type in rows:
+            cinemas = cinemas_by_movie.setdefault(showtime.movie_id, {})
+            cinema = cinemas.get(showtime.cinema_id)
+            if cinema is None:
+                cinema = cinemas[showtime.cinema_id] = {
+                    "id": showtime.cinema_id,
+                    "name": cinema_name,
+                    "location": cinema_location,
+                    "showtimes": [],
+                }
+            cinema["showtimes"].append({
+                "id": showtime.id,
+                "screen_id": showtime.screen_id,
+                "screen_number": screen_number,
+                "screen_type": screen_type,
+                "start_time": showtime.start_time.isoformat(),
+                "end_time": showtime.end_time.isoformat(),
+                "base_price": showtime.base_price,
+                "available_seats": showtime.available_seats,
+            })
+
+        movies = [
+            {
+                "id": movie.id,
+                "title": movie.title,
+                "poster_url": movie.poster_url,
+                "duration": movie.duration,
+                "genre": movie.genre,
+                "language": movie.language,
+                "age_restriction": movie.age_restriction,
+                "rating": movie.rating,
+                "cinemas": list(cinemas_by_movie[movie.id].values()),
+            }
+            for movie in self.movie_repository.get_by_ids(list(cinemas_by_movie))
+            if movie.is_active
+        ]
+        movies.sort(key=lambda movie: movie["title"])
+
+        return {"city": city, "date": day.isoformat(), "movies": movies}
+
+    def get_listings_snapshot(self, city: str, day: date) -> ScheduleSnapshot:
+        snapshot = schedule_snapshots.get(city, day)
+        if snapshot is None:
+            snapshot = self.rebuild_snapshot(city, day)
+        return snapshot
+
+    def rebuild_snapshot(self, city: str, day: date) -> ScheduleSnapshot:
+        generation = schedule_snapshots.generation()
+        snapshot = ScheduleSnapshot(self.get_listings(city, day))
+        snapshot.encoded()
+        schedule_snapshots.put(city, day, snapshot, generation)
+        return snapshot
+
+    def refresh_showtime_days(self, cinema_id: int, days: Iterable[date]):
+        cinema = self.cinema_repository.get_by_id(cinema_id)
+        if not cinema:
+            return
+        for day in set(days):
+            schedule_snapshots.invalidate(cinema.city, day)
+            self.rebuild_snapshot(cinema.city, day)
+
+    def patch_available_seats(self, showtime_id: int, available_seats: int) -> bool:
+        return schedule_snapshots.patch_available_seats(showtime_id, available_seats)
@@ -1,13 +1,87 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict
+import logging
+import threading
+import time
+from app.core.config import settings
+from app.db.session import SessionLocal
 from app.models.domain.movie import Movie, MovieStatus
-from app.models.schemas.movie_schema import MovieCreate, MovieUpdate
+from app.models.schemas.movie_schema import MovieCreate, MovieUpdate, MovieFilters
 from app.repositories.movie_repository import MovieRepository
+from app.repositories.movie_search_repository import MovieSearchRepository
+from app.services.listings_service import schedule_snapshots
+from app.core.tracing import traced_class
+from app.utils.facet_index import FacetIndex, iter_bitmap, to_bitmap
+from app.utils.suggest_index import TitleSuggester
 
+logger = logging.getLogger(__name__)
 
+FACET_FIELDS = ["genre", "language", "status"]
+FILTER_FIELDS = FACET_FIELDS + ["age_restriction"]
+RANGE_FIELDS = ["release_date", "rating"]
+
+_catalog_indexes = None
+_catalog_checked_at = 0.0
+_catalog_rebuilding = False
+_catalog_indexes_lock = threading.Lock()
+
+
+class CatalogIndexes:
+    def __init__(self, version: Tuple):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.suggester = TitleSuggester()
+        self.facets = FacetIndex(FILTER_FIELDS, RANGE_FIELDS)
+
+    def load(self, entries, genres: Dict[int, List[str]]):
+        entries = list(entries)
+        self.suggester.add_many((entry.id, entry.title, entry.rating) for entry in entries)
+        self.facets.add_many(
+            (
+                entry.id,
+                {
+                    "genre": genres.get(entry.id, []),
+                    "language": [entry.language] if entry.language else [],
+                    "status": [MovieStatus(entry.status).value],
+                    "age_restriction": [entry.age_restriction] if entry.age_restriction else [],
+                },
+                {"release_date": entry.release_date, "rating": entry.rating}
+            )
+            for entry in entries
+        )
+
+
+def build_catalog_indexes(repository: MovieRepository, version: Tuple) -> CatalogIndexes:
+    indexes = CatalogIndexes(version)
+    indexes.load(repository.get_catalog_entries(), repository.get_catalog_genres())
+    return indexes
+
+
+def _rebuild_catalog_indexes(version: Tuple):
+    global _catalog_indexes, _catalog_rebuilding
+    db = SessionLocal()
+    try:
+        indexes = build_catalog_indexes(MovieRepository(db), version)
+        with _catalog_indexes_lock:
+            _catalog_indexes = indexes
+    except Exception as e:
+        logger.warning(f"Catalog index rebuild failed: {e}")
+    finally:
+        db.close()
+        with _catalog_indexes_lock:
+            _catalog_rebuilding = False
+
+
+def invalidate_catalog_indexes():
+    global _catalog_checked_at
+    _catalog_checked_at = 0.0
+
+
+@traced_class("service")
 class MovieService:
     def __init__(self, db: Session):
         self.repository = MovieRepository(db)
+        self.search_repository = MovieSearchRepository(db)
 
     def create_movie(self, movie_create: MovieCreate) -> Movie:
         movie = Movie(
@@ -25,7 +99,15 @@ class MovieService:
             rating=movie_create.rating,
             status=movie_create.status
         )
-        return self.repository.create(movie)
+        try:
+            created_movie = self.repository.add(movie)
+            self._write_catalog(created_movie)
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        self._on_catalog_change()
+        return created_movie
 
     def get_movie(self, movie_id: int) -> Optional[Movie]:
         return self.repository.get_by_id(movie_id)
@@ -40,10 +122,10 @@ class MovieService:
         return self.repository.get_by_status(status, skip, limit)
 
     def search_movies(self, query: str, skip: int = 0, limit: int = 100) -> List[Movie]:
-        return self.repository.search_by_title(query, skip, limit)
+        return self.search_repository.search(query, skip, limit)
 
-    def search_by_genre(self, genre: str, skip: int = 0, limit: int = 100) -> List[Movie]:
-        return self.repository.search_by_genre(genre, skip, limit)
+    def list_genres(self) -> List[Tuple[str, int]]:
+        return self.repository.list_genres()
 
     def update_movie(self, movie_id: int, movie_update: MovieUpdate) -> Optional[Movie]:
         movie = self.get_movie(movie_id)
@@ -79,8 +161,118 @@ class MovieService:
             update_data["status"] = movie_update.status
 
         if update_data:
-            return self.repository.update(movie_id, update_data)
+            try:
+                for key, value in update_data.items():
+                    setattr(movie, key, value)
+                self._write_catalog(movie)
+                self.repository.commit()
+            except Exception:
+                self.repository.rollback()
+                raise
+            self._on_catalog_change()
         return movie
 
     def delete_movie(self, movie_id: int) -> bool:
-        return self.repository.delete(movie_id)
+        movie = self.get_movie(movie_id)
+        if not movie:
+            return False
+        try:
+            self.repository.remove(movie)
+            self.repository.delete_credits(movie_id)
+            self.search_repository.remove_movie(movie_id)
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        self._on_catalog_change()
+        return True
+
+    def suggest_titles(self, query: str, limit: int = 10) -> List[Tuple[int, str]]:
+        return self._catalog_indexes().suggester.suggest(query, limit)
+
+    def filter_movies(
+        self,
+        filters: MovieFilters,
+        skip: int = 0,
+        limit: int = 20,
+        with_facets: bool = True
+    ) -> Tuple[List[Movie], int, Dict[str, List[Tuple[str, int]]]]:
+        if filters.release_date_from and filters.release_date_to and filters.release_date_from > filters.release_date_to:
+            raise ValueError("release_date_from must not be after release_date_to")
+        if filters.min_rating is not None and filters.max_rating is not None and filters.min_rating > filters.max_rating:
+            raise ValueError("min_rating must not be greater than max_rating")
+
+        movie_facets = self._catalog_indexes().facets
+
+        ranked_ids = None
+        base = movie_facets.all
+        if filters.search:
+            ranked_ids = self.search_repository.search_all_ids(filters.search)
+            base &= to_bitmap(ranked_ids)
+        if filters.cast:
+            base &= to_bitmap(self.repository.get_ids_by_cast_member(filters.cast))
+        if filters.release_date_from or filters.release_date_to:
+            base &= movie_facets.match_range("release_date", filters.release_date_from, filters.release_date_to)
+        if filters.min_rating is not None or filters.max_rating is not None:
+            base &= movie_facets.match_range("rating", filters.min_rating, filters.max_rating)
+
+        selections = {}
+        for field in FILTER_FIELDS:
+            values = getattr(filters, field)
+            if values:
+                selections[field] = movie_facets.match(field, [getattr(value, "value", value) for value in values])
+
+        matched = base
+        for bitmap in selections.values():
+            matched &= bitmap
+
+        facets = {}
+        if with_facets:
+            for field in FACET_FIELDS:
+                facet_base = base
+                for selected_field, bitmap in selections.items():
+                    if selected_field != field:
+                        facet_base &= bitmap
+                facets[field] = movie_facets.count(field, facet_base)
+
+        if ranked_ids is not None:
+            page_ids = [movie_id for movie_id in ranked_ids if matched >> movie_id & 1][skip:skip + limit]
+        else:
+            page_ids = []
+            for position, movie_id in enumerate(iter_bitmap(matched)):
+                if position >= skip + limit:
+                    break
+                if position >= skip:
+                    page_ids.append(movie_id)
+
+        return self.repository.get_by_ids(page_ids), matched.bit_count(), facets
+
+    def _catalog_indexes(self) -> CatalogIndexes:
+        global _catalog_indexes, _catalog_checked_at, _catalog_rebuilding
+        indexes = _catalog_indexes
+        if indexes is not None and time.monotonic() - _catalog_checked_at < settings.MOVIE_CATALOG_CHECK_SECONDS:
+            return indexes
+        with _catalog_indexes_lock:
+            indexes = _catalog_indexes
+            now = time.monotonic()
+            if indexes is not None and now - _catalog_checked_at < settings.MOVIE_CATALOG_CHECK_SECONDS:
+                return indexes
+            version = self.repository.get_catalog_version()
+            if indexes is None:
+                indexes = _catalog_indexes = build_catalog_indexes(self.repository, version)
+            elif ((indexes.version != version or now - indexes.built_at > settings.MOVIE_CATALOG_TTL_SECONDS)
+                  and not _catalog_rebuilding):
+                _catalog_rebuilding = True
+                threading.Thread(
+                    target=_rebuild_catalog_indexes, args=(version,), name="catalog-indexes", daemon=True
+                ).start()
+            _catalog_checked_at = now
+            return indexes
+
+    def _write_catalog(self, movie: Movie):
+        self.repository.replace_credits(movie)
+        self.search_repository.index_movie(movie)
+
+    def _on_catalog_change(self):
+        schedule_snapshots.clear()
+        invalidate_catalog_indexes()
@@ -0,0 +1,161 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional
+import json
+import logging
+import queue
+import threading
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.repositories.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxMessage(NamedTuple):
+    id: int
+    event_type: str
+    aggregate_id: int
+    payload: dict
+    created_at: datetime
+
+
+OutboxHandler = Callable[[List[OutboxMessage]], None]
+
+
+class LocalQueuePublisher:
+    def __init__(self, maxsize: int = 10000):
+        self.queue = queue.Queue(maxsize=maxsize)
+
+    def __call__(self, messages: List[OutboxMessage]):
+        for message in messages:
+            self.queue.put_nowait(message)
+
+
+class OutboxDispatcher:
+    def __init__(self, interval: float = 1.0, batch_size: int = 200, max_attempts: int = 10,
+                 retry_base_seconds: float = 5.0, retention_hours: float = 24):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retention = timedelta(hours=retention_hours)
+        self.handlers: Dict[str, List[OutboxHandler]] = defaultdict(list)
+        self.dispatched = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, event_type: str, handler: OutboxHandler):
+        self.handlers[event_type].append(handler)
+
+    def notify(self):
+        self._wake.set()
+
+    def _deliver(self, event_type: str, messages: List[OutboxMessage]):
+        for handler in self.handlers.get(event_type, []) + self.handlers.get("*", []):
+            handler(messages)
+
+    def dispatch_batch(self, db) -> dict:
+        repository = OutboxRepository(db)
+        now = datetime.utcnow()
+        events = repository.claim_batch(now, self.batch_size, self.max_attempts)
+        if not events:
+            repository.rollback()
+            return {"claimed": 0, "dispatched": 0, "failed": 0}
+
+        groups: Dict[str, List[OutboxMessage]] = defaultdict(list)
+        attempts = {}
+        for event in events:
+            attempts[event.id] = event.attempts
+            groups[event.event_type].append(OutboxMessage(
+                event.id, event.event_type, event.aggregate_id, json.loads(event.payload), event.created_at
+            ))
+
+        dispatched, failures = [], {}
+        for event_type, messages in groups.items():
+            try:
+                self._deliver(event_type, messages)
+                dispatched.extend(message.id for message in messages)
+            except Exception as e:
+                logger.warning(f"Outbox handler for {event_type} failed on {len(messages)} events: {e}")
+                failures.update({message.id: (attempts[message.id], str(e) or type(e).__name__) for message in messages})
+
+        try:
+            repository.mark_dispatched(dispatched, now)
+            repository.mark_failed(failures, now, self.retry_base_seconds)
+            repository.purge_dispatched(now - self.retention)
+            repository.commit()
+        except Exception:
+            repository.rollback()
+            raise
+
+        with self._lock:
+            self.dispatched += len(dispatched)
+            self.failed += len(failures)
+        return {"claimed": len(events), "dispatched": len(dispatched), "failed": len(failures)}
+
+    def run_once(self) -> dict:
+        result = {"batches": 0, "dispatched": 0, "failed": 0}
+        db = SessionLocal()
+        try:
+            while True:
+                batch = self.dispatch_batch(db)
+                if not batch["claimed"]:
+                    break
+                result["batches"] += 1
+                result["dispatched"] += batch["dispatched"]
+                result["failed"] += batch["failed"]
+                if batch["claimed"] < self.batch_size:
+                    break
+        finally:
+            db.close()
+        return result
+
+    def backlog(self, db) -> dict:
+        return {**OutboxRepository(db).get_backlog(self.max_attempts), **self.stats()}
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"Outbox dispatch failed: {e}")
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"dispatched": self.dispatched, "failed": self.failed}
+
+
+outbox_dispatcher = OutboxDispatcher(
+    interval=settings.OUTBOX_DISPATCH_INTERVAL_SECONDS,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retry_base_seconds=settings.OUTBOX_RETRY_BASE_SECONDS,
+    retention_hours=settings.OUTBOX_RETENTION_HOURS,
+)
+
+local_events: Optional[LocalQueuePublisher] = None
+if settings.OUTBOX_LOCAL_QUEUE_SIZE > 0:
+    local_events = LocalQueuePublisher(settings.OUTBOX_LOCAL_QUEUE_SIZE)
+    outbox_dispatcher.register("*", local_events)
@@ -0,0 +1,67 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.core.config import settings
+from app.core.metrics import registry
+from app.repositories.seat_repository import SeatRepository
+from app.repositories.showtime_repository import ShowtimeRepository
+from app.services.promo_code_service import PromoCodeService
+from app.core.tracing import traced_class
+from app.utils.pricing import PriceRules, PriceTable, PriceTableCache
+
+
+price_rules = PriceRules(
+    settings.PRICE_SEAT_MULTIPLIERS,
+    settings.PRICE_WEEKDAY_MULTIPLIERS,
+    settings.PRICE_TIME_OF_DAY_MULTIPLIERS,
+)
+price_tables = PriceTableCache(
+    ttl_seconds=settings.PRICE_TABLE_CACHE_TTL_SECONDS,
+    max_entries=settings.PRICE_TABLE_CACHE_MAX_ENTRIES,
+)
+registry.register_cache("price_tables", price_tables.stats)
+
+
+@traced_class("service")
+class PricingService:
+    def __init__(self, db: Session):
+        self.showtime_repository = ShowtimeRepository(db)
+        self.seat_repository = SeatRepository(db)
+        self.promo_code_service = PromoCodeService(db)
+
+    def get_price_table(self, showtime_id: int) -> PriceTable:
+        table = price_tables.get(showtime_id)
+        if table is not None:
+            return table
+
+        generation = price_tables.generation()
+        showtime = self.showtime_repository.get_by_id(showtime_id)
+        if not showtime or not showtime.is_active:
+            raise ValueError("Showtime not found")
+        table = price_rules.compile(
+            showtime.id, showtime.screen_id, showtime.base_price, showtime.start_time,
+            self.seat_repository.get_pricing_rows(showtime.screen_id)
+        )
+        price_tables.put(table, generation)
+        return table
+
+    def quote(self, showtime_id: int, seat_ids: List[int], promo_code: Optional[str] = None,
+              promo_code_id: Optional[int] = None) -> dict:
+        if not seat_ids:
+            raise ValueError("A booking must include at least one ticket")
+        if len(set(seat_ids)) != len(seat_ids):
+            raise ValueError("Each seat can only be booked once per booking")
+
+        tickets, subtotal = self.get_price_table(showtime_id).quote(seat_ids)
+        promo, discount_amount = None, 0.0
+        if promo_code or promo_code_id:
+            promo, discount_amount = self.promo_code_service.resolve(subtotal, promo_code, promo_code_id)
+
+        return {
+            "showtime_id": showtime_id,
+            "tickets": tickets,
+            "subtotal": subtotal,
+            "discount_amount": discount_amount,
+            "total": round(subtotal - discount_amount, 2),
+            "promo_code_id": promo.id if promo else None,
+            "promo": promo,
+        }
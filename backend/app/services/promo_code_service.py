@@ -0,0 +1,112 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import threading
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models.domain.promo_code import PromoCode, DiscountType
+from app.models.schemas.promo_code_schema import PromoCodeCreate, PromoCodeUpdate
+from app.repositories.promo_code_repository import PromoCodeRepository
+from app.core.tracing import traced_class
+from app.utils.promo_cache import PromoCodeCache, PromoSnapshot, normalize_code
+
+
+promo_codes = PromoCodeCache(ttl_seconds=settings.PROMO_CODE_CACHE_TTL_SECONDS)
+registry.register_cache("promo_codes", promo_codes.stats)
+_promo_codes_lock = threading.Lock()
+
+
+@traced_class("service")
+class PromoCodeService:
+    def __init__(self, db: Session):
+        self.repository = PromoCodeRepository(db)
+
+    def _ensure_cache_loaded(self):
+        if not promo_codes.is_stale():
+            return
+        with _promo_codes_lock:
+            if promo_codes.is_stale():
+                generation = promo_codes.generation()
+                promo_codes.replace(
+                    (
+                        PromoSnapshot(
+                            id=promo.id,
+                            code=promo.code,
+                            discount_type=promo.discount_type.value,
+                            discount_value=promo.discount_value,
+                            min_booking_amount=promo.min_booking_amount,
+                            valid_from=promo.valid_from,
+                            valid_until=promo.valid_until,
+                        )
+                        for promo in self.repository.get_redeemable(datetime.utcnow())
+                    ),
+                    generation,
+                )
+
+    def create_promo_code(self, promo_create: PromoCodeCreate) -> PromoCode:
+        if promo_create.valid_until <= promo_create.valid_from:
+            raise ValueError("valid_until must be after valid_from")
+        if promo_create.discount_type.value == DiscountType.PERCENTAGE.value and promo_create.discount_value > 100:
+            raise ValueError("Percentage discounts cannot exceed 100")
+        code = normalize_code(promo_create.code)
+        if self.repository.get_by_code(code):
+            raise ValueError("Promo code already exists")
+
+        promo = PromoCode(
+            code=code,
+            description=promo_create.description,
+            discount_type=DiscountType(promo_create.discount_type.value),
+            discount_value=promo_create.discount_value,
+            max_usage=promo_create.max_usage,
+            min_booking_amount=promo_create.min_booking_amount,
+            valid_from=promo_create.valid_from,
+            valid_until=promo_create.valid_until
+        )
+        created_promo = self.repository.create(promo)
+        promo_codes.invalidate()
+        return created_promo
+
+    def get_promo_code(self, promo_code_id: int) -> Optional[PromoCode]:
+        return self.repository.get_by_id(promo_code_id)
+
+    def get_all_promo_codes(self, skip: int = 0, limit: int = 100) -> List[PromoCode]:
+        return self.repository.get_all(skip, limit)
+
+    def update_promo_code(self, promo_code_id: int, promo_update: PromoCodeUpdate) -> Optional[PromoCode]:
+        update_data = promo_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_promo_code(promo_code_id)
+        promo = self.repository.update(promo_code_id, update_data)
+        promo_codes.invalidate()
+        return promo
+
+    def delete_promo_code(self, promo_code_id: int) -> bool:
+        deleted = self.repository.delete(promo_code_id)
+        if deleted:
+            promo_codes.invalidate()
+        return deleted
+
+    def resolve(self, amount: float, code: Optional[str] = None,
+                promo_code_id: Optional[int] = None) -> Tuple[PromoSnapshot, float]:
+        self._ensure_cache_loaded()
+        promo = promo_codes.get(code) if code else promo_codes.get_by_id(promo_code_id)
+        if promo is None:
+            raise ValueError("Invalid or expired promo code")
+
+        now = datetime.utcnow()
+        if not promo.valid_from <= now <= promo.valid_until:
+            raise ValueError("Invalid or expired promo code")
+        if amount < promo.min_booking_amount:
+            raise ValueError(f"Promo code requires a minimum booking amount of {promo.min_booking_amount:.2f}")
+        return promo, promo.discount_for(amount)
+
+    def redeem(self, promo: PromoSnapshot):
+        if not self.repository.redeem(promo.id, datetime.utcnow()):
+            promo_codes.discard(promo.id)
+            raise ValueError("Promo code is no longer available")
+
+    def release(self, promo_code_id: int) -> bool:
+        return self.repository.release(promo_code_id)
+
+    def release_many(self, counts: Dict[int, int]) -> bool:
+        return self.repository.release_many(counts)
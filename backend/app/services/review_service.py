@@ -0,0 +1,200 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.models.domain.review import Review, MovieRatingAggregate
+from app.models.schemas.review_schema import ReviewCreate, ReviewUpdate, ReviewResponse
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.review_repository import ReviewRepository
+from app.core.security_detector import SpamDetector
+from app.core.tracing import traced_class
+
+
+def bayesian_rating(review_count: int, rating_sum: float) -> float:
+    return (settings.REVIEW_PRIOR_WEIGHT * settings.REVIEW_PRIOR_MEAN + rating_sum) / (
+        settings.REVIEW_PRIOR_WEIGHT + review_count
+    )
+
+
+@traced_class("service")
+class ReviewService:
+    def __init__(self, db: Session):
+        self.repository = ReviewRepository(db)
+        self.movie_repository = MovieRepository(db)
+
+    def _apply_rating_deltas(self, deltas: Dict[int, Tuple[int, float]]):
+        movie_ids = self.repository.apply_rating_deltas(
+            deltas, settings.REVIEW_PRIOR_MEAN, settings.REVIEW_PRIOR_WEIGHT
+        )
+        self.repository.sync_movie_ratings(movie_ids, settings.REVIEW_MOVIE_RATING_SCALE)
+
+    def _apply_rating_delta(self, movie_id: int, count_delta: int, sum_delta: float):
+        self._apply_rating_deltas({movie_id: (count_delta, sum_delta)})
+
+    @staticmethod
+    def _counts(review: Review) -> bool:
+        return review.is_approved and review.is_active
+
+    def create_review(self, user_id: int, review_create: ReviewCreate) -> Review:
+        movie = self.movie_repository.get_by_id(review_create.movie_id)
+        if not movie or not movie.is_active:
+            raise ValueError("Movie not found")
+        if self.repository.get_by_user_and_movie(user_id, review_create.movie_id):
+            raise ValueError("You have already reviewed this movie")
+
+        review = Review(
+            movie_id=review_create.movie_id,
+            user_id=user_id,
+            rating=review_create.rating,
+            comment=review_create.comment
+        )
+        return self.repository.create(review)
+
+    def get_review(self, review_id: int) -> Optional[Review]:
+        return self.repository.get_by_id(review_id)
+
+    def get_movie_reviews(self, movie_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+        return self.repository.get_by_movie(movie_id, skip, limit)
+
+    def get_user_reviews(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+        return self.repository.get_by_user(user_id, skip, limit)
+
+    def update_review(self, review_id: int, review_update: ReviewUpdate) -> Optional[Review]:
+        update_data = review_update.model_dump(exclude_unset=True)
+        review = self.get_review(review_id)
+        if not review or not update_data:
+            return review
+
+        try:
+            if self._counts(review):
+                self._apply_rating_delta(review.movie_id, -1, -review.rating)
+            for key, value in update_data.items():
+                setattr(review, key, value)
+            review.is_approved = False
+            review.is_active = True
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        return review
+
+    def delete_review(self, review_id: int) -> bool:
+        review = self.get_review(review_id)
+        if not review:
+            return False
+        try:
+            if self._counts(review):
+                self._apply_rating_delta(review.movie_id, -1, -review.rating)
+            return self.repository.delete(review_id)
+        except Exception:
+            self.repository.rollback()
+            raise
+
+    def moderate_review(self, review_id: int, approve: bool) -> Optional[Review]:
+        review = self.get_review(review_id)
+        if not review:
+            return None
+
+        self.bulk_moderate([review_id], approve)
+        return review
+
+    def get_moderation_queue(self, after_id: Optional[int] = None, limit: int = 50) -> dict:
+        reviews = self.repository.get_pending(after_id, limit)
+        items = [
+            {**ReviewResponse.model_validate(review).model_dump(), "flags": SpamDetector.scan_text(review.comment)}
+            for review in reviews
+        ]
+        return {
+            "items": items,
+            "next_cursor": reviews[-1].id if len(reviews) == limit else None,
+        }
+
+    def bulk_moderate(self, review_ids: List[int], approve: bool) -> dict:
+        review_ids = list(dict.fromkeys(review_ids))
+        deltas: Dict[int, Tuple[int, float]] = {}
+        changed_ids = []
+        sign = 1 if approve else -1
+
+        try:
+            for review_id, movie_id, rating, is_approved, is_active in self.repository.get_moderation_rows(review_ids):
+                if is_approved == approve and is_active == approve:
+                    continue
+                changed_ids.append(review_id)
+                if (is_approved and is_active) != approve:
+                    count, total = deltas.get(movie_id, (0, 0.0))
+                    deltas[movie_id] = (count + sign, total + sign * rating)
+
+            updated = self.repository.set_moderation(changed_ids, approve)
+            self._apply_rating_deltas(deltas)
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+
+        return {
+            "requested": len(review_ids),
+            "updated": updated,
+            "movies_affected": len(deltas),
+        }
+
+    @staticmethod
+    def _rating(movie_id: int, aggregate: Optional[MovieRatingAggregate]) -> dict:
+        review_count = aggregate.review_count if aggregate else 0
+        rating_sum = aggregate.rating_sum if aggregate else 0.0
+        return {
+            "movie_id": movie_id,
+            "review_count": review_count,
+            "average_rating": rating_sum / review_count if review_count else None,
+            "bayesian_rating": aggregate.bayesian_rating if aggregate else bayesian_rating(0, 0.0),
+        }
+
+    def get_movie_rating(self, movie_id: int) -> dict:
+        return self._rating(movie_id, self.repository.get_rating_aggregate(movie_id))
+
+    def get_movie_ratings(self, movie_ids: List[int]) -> List[dict]:
+        aggregates = {
+            aggregate.movie_id: aggregate for aggregate in self.repository.get_rating_aggregates(movie_ids)
+        }
+        return [self._rating(movie_id, aggregates.get(movie_id)) for movie_id in movie_ids]
+
+    def recompute_rating_aggregates(self) -> dict:
+        totals = self.repository.get_rating_totals()
+        stored: Dict[int, MovieRatingAggregate] = {
+            aggregate.movie_id: aggregate for aggregate in self.repository.get_rating_aggregates()
+        }
+
+        corrections, updates, inserts = [], [], []
+        for movie_id in sorted(set(totals) | set(stored)):
+            expected_count, expected_sum = totals.get(movie_id, (0, 0.0))
+            expected_bayesian = bayesian_rating(expected_count, expected_sum)
+            aggregate = stored.get(movie_id)
+            row = {
+                "movie_id": movie_id,
+                "review_count": expected_count,
+                "rating_sum": expected_sum,
+                "bayesian_rating": expected_bayesian,
+            }
+            if aggregate is None:
+                inserts.append(row)
+            elif (aggregate.review_count != expected_count
+                  or abs(aggregate.rating_sum - expected_sum) > 1e-9
+                  or abs(aggregate.bayesian_rating - expected_bayesian) > 1e-9):
+                updates.append(row)
+            else:
+                continue
+            corrections.append({
+                "movie_id": movie_id,
+                "stored_count": aggregate.review_count if aggregate else 0,
+                "stored_sum": aggregate.rating_sum if aggregate else 0.0,
+                "expected_count": expected_count,
+                "expected_sum": expected_sum,
+            })
+
+        try:
+            self.repository.save_rating_aggregates(updates, inserts)
+            self.repository.sync_movie_ratings([row["movie_id"] for row in updates + inserts],
+                                               settings.REVIEW_MOVIE_RATING_SCALE)
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        return {"checked": len(set(totals) | set(stored)), "corrected": len(corrections), "corrections": corrections}
@@ -3,8 +3,11 @@ from typing import Optional, List
 from app.models.domain.seat import Seat, SeatStatus, SeatCategory
 from app.models.schemas.seat_schema import SeatCreate, SeatUpdate
 from app.repositories.seat_repository import SeatRepository
+from app.services.pricing_service import price_tables
+from app.core.tracing import traced_class
 
 
+@traced_class("service")
 class SeatService:
     def __init__(self, db: Session):
         self.repository = SeatRepository(db)
@@ -17,7 +20,9 @@ class SeatService:
             category=seat_create.category,
             status=seat_create.status
         )
-        return self.repository.create(seat)
+        created_seat = self.repository.create(seat)
+        price_tables.invalidate_screen(created_seat.screen_id)
+        return created_seat
 
     def get_seat(self, seat_id: int) -> Optional[Seat]:
         return self.repository.get_by_id(seat_id)
@@ -43,11 +48,21 @@ class SeatService:
     def update_seat(self, seat_id: int, seat_update: SeatUpdate) -> Optional[Seat]:
         update_data = seat_update.model_dump(exclude_unset=True)
         if update_data:
-            return self.repository.update(seat_id, update_data)
+            seat = self.repository.update(seat_id, update_data)
+            if seat and "category" in update_data:
+                price_tables.invalidate_screen(seat.screen_id)
+            return seat
         return self.get_seat(seat_id)
 
     def delete_seat(self, seat_id: int) -> bool:
-        return self.repository.delete(seat_id)
+        seat = self.get_seat(seat_id)
+        if not seat:
+            return False
+        screen_id = seat.screen_id
+        deleted = self.repository.delete(seat_id)
+        if deleted:
+            price_tables.invalidate_screen(screen_id)
+        return deleted
 
     def bulk_create_seats(self, screen_id: int, rows: List[str], seats_per_row: int, 
                          categories: dict = None) -> List[Seat]:
@@ -65,5 +80,6 @@ class SeatService:
         
         for seat in seats:
             self.repository.create(seat)
+        price_tables.invalidate_screen(screen_id)
         
         return seats
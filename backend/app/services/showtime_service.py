@@ -1,16 +1,68 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from datetime import datetime
+from typing import Iterator, Optional, List, Tuple
+from datetime import date, datetime, timedelta
+from itertools import islice
+import time
+from app.core.config import settings
 from app.models.domain.showtime import Showtime
-from app.models.schemas.showtime_schema import ShowtimeCreate, ShowtimeUpdate
+from app.models.schemas.showtime_schema import (
+    ShowtimeCreate, ShowtimeUpdate, ShowtimeImportRow, BulkScheduleCreate
+)
+from app.repositories.cinema_repository import ScreenRepository
+from app.repositories.movie_repository import MovieRepository
 from app.repositories.showtime_repository import ShowtimeRepository
+from app.services.listings_service import ListingsService, schedule_snapshots
+from app.services.pricing_service import price_tables
+from app.core.tracing import traced_class
+from app.utils.interval_index import ScheduleIndex
+from app.utils.timezones import MAX_UTC_OFFSET, MIN_UTC_OFFSET, local_now, local_to_utc
 
 
+class ShowtimeConflictError(ValueError):
+    pass
+
+
+class ScheduleImportError(ShowtimeConflictError):
+    def __init__(self, message: str, result: dict):
+        super().__init__(message)
+        self.result = result
+
+
+@traced_class("service")
 class ShowtimeService:
     def __init__(self, db: Session):
         self.repository = ShowtimeRepository(db)
+        self.movie_repository = MovieRepository(db)
+        self.screen_repository = ScreenRepository(db)
+        self.listings_service = ListingsService(db)
+
+    def build_schedule_index(self, screen_ids: List[int], start: datetime, end: datetime) -> ScheduleIndex:
+        index = ScheduleIndex(timedelta(minutes=settings.SHOWTIME_CLEANING_BUFFER_MINUTES))
+        window_start, window_end = start - index.buffer, end + index.buffer
+        for showtime_id, screen_id, showtime_start, showtime_end in self.repository.get_screen_intervals(
+            screen_ids, window_start, window_end
+        ):
+            index.add(screen_id, showtime_id, showtime_start, showtime_end)
+        return index
+
+    def check_conflict(self, index: ScheduleIndex, screen_id: int, start: datetime, end: datetime,
+                       exclude_id: Optional[int] = None):
+        if end <= start:
+            raise ValueError("end_time must be after start_time")
+        conflict = index.find_conflict(screen_id, start, end, exclude_id)
+        if conflict:
+            conflict_start, conflict_end, conflict_id = conflict
+            existing = f"showtime {conflict_id}" if conflict_id > 0 else f"row {-conflict_id} of this import"
+            raise ShowtimeConflictError(
+                f"Screen {screen_id} already has {existing} from {conflict_start.isoformat()} "
+                f"to {conflict_end.isoformat()} (cleaning buffer {settings.SHOWTIME_CLEANING_BUFFER_MINUTES} minutes)"
+            )
 
     def create_showtime(self, showtime_create: ShowtimeCreate) -> Showtime:
+        self.repository.lock_screens([showtime_create.screen_id])
+        index = self.build_schedule_index([showtime_create.screen_id], showtime_create.start_time, showtime_create.end_time)
+        self.check_conflict(index, showtime_create.screen_id, showtime_create.start_time, showtime_create.end_time)
+
         showtime = Showtime(
             movie_id=showtime_create.movie_id,
             screen_id=showtime_create.screen_id,
@@ -20,7 +72,9 @@ class ShowtimeService:
             base_price=showtime_create.base_price,
             available_seats=showtime_create.available_seats
         )
-        return self.repository.create(showtime)
+        created_showtime = self.repository.create(showtime)
+        self.listings_service.refresh_showtime_days(created_showtime.cinema_id, [created_showtime.start_time.date()])
+        return created_showtime
 
     def get_showtime(self, showtime_id: int) -> Optional[Showtime]:
         return self.repository.get_by_id(showtime_id)
@@ -37,25 +91,225 @@ class ShowtimeService:
     def get_showtimes_by_screen(self, screen_id: int, skip: int = 0, limit: int = 100) -> List[Showtime]:
         return self.repository.get_by_screen(screen_id, skip, limit)
 
-    def get_upcoming_showtimes(self, movie_id: int, skip: int = 0, limit: int = 100) -> List[Showtime]:
-        return self.repository.get_upcoming_showtimes(movie_id, skip, limit)
+    def get_upcoming_showtimes(self, movie_id: int, skip: int = 0, limit: int = 100,
+                               days: Optional[int] = None) -> List[Showtime]:
+        horizon = timedelta(days=days or settings.SHOWTIME_UPCOMING_DAYS)
+        now = datetime.utcnow()
+        rows = self.repository.get_upcoming_showtimes(
+            movie_id, now + MIN_UTC_OFFSET, now + MAX_UTC_OFFSET + horizon
+        )
+        upcoming = (
+            showtime for showtime, timezone in rows
+            if local_now(timezone) <= showtime.start_time < local_now(timezone) + horizon
+        )
+        return list(islice(upcoming, skip, skip + limit))
+
+    def get_showtimes_by_date_range(self, start_date: datetime, end_date: datetime,
+                                    movie_id: Optional[int] = None,
+                                    cinema_id: Optional[int] = None) -> List[Showtime]:
+        return self.repository.get_showtimes_by_date_range(start_date, end_date, movie_id, cinema_id)
 
-    def get_showtimes_by_date_range(self, movie_id: int, cinema_id: int, 
-                                    start_date: datetime, end_date: datetime) -> List[Showtime]:
-        return self.repository.get_showtimes_by_date_range(movie_id, cinema_id, start_date, end_date)
+    @staticmethod
+    def showtime_window(start_date: date, end_date: date, city: Optional[str] = None,
+                        cinema_id: Optional[int] = None, movie_id: Optional[int] = None) -> Tuple[datetime, datetime]:
+        if not city and cinema_id is None and movie_id is None:
+            raise ValueError("Provide at least one of city, cinema_id or movie_id")
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        if (end_date - start_date).days + 1 > settings.SHOWTIME_WINDOW_MAX_DAYS:
+            raise ValueError(f"Window cannot exceed {settings.SHOWTIME_WINDOW_MAX_DAYS} days")
+        start = datetime.combine(start_date, datetime.min.time())
+        return start, start + timedelta(days=(end_date - start_date).days + 1)
+
+    def iter_showtime_days(self, start_date: date, end_date: date, city: Optional[str] = None,
+                           cinema_id: Optional[int] = None, movie_id: Optional[int] = None) -> Iterator[dict]:
+        start, end = self.showtime_window(start_date, end_date, city, cinema_id, movie_id)
+        bucket = None
+        for row in self.repository.iter_window(
+            start, end, city, cinema_id, movie_id, settings.SHOWTIME_WINDOW_BATCH_SIZE
+        ):
+            day = row.start_time.date().isoformat()
+            if bucket is None or bucket["date"] != day:
+                if bucket is not None:
+                    yield bucket
+                bucket = {"date": day, "showtimes": []}
+            bucket["showtimes"].append({
+                "id": row.id,
+                "movie_id": row.movie_id,
+                "cinema_id": row.cinema_id,
+                "screen_id": row.screen_id,
+                "start_time": row.start_time.isoformat(),
+                "end_time": row.end_time.isoformat(),
+                "start_time_utc": local_to_utc(row.start_time, row.timezone).isoformat(),
+                "timezone": row.timezone or settings.DEFAULT_TIMEZONE,
+                "base_price": row.base_price,
+                "available_seats": row.available_seats,
+            })
+        if bucket is not None:
+            yield bucket
 
     def update_showtime(self, showtime_id: int, showtime_update: ShowtimeUpdate) -> Optional[Showtime]:
         update_data = showtime_update.model_dump(exclude_unset=True)
-        if update_data:
-            return self.repository.update(showtime_id, update_data)
-        return self.get_showtime(showtime_id)
+        showtime = self.get_showtime(showtime_id)
+        if not showtime or not update_data:
+            return showtime
+
+        previous_day = showtime.start_time.date()
+        if "start_time" in update_data or "end_time" in update_data:
+            start = update_data.get("start_time", showtime.start_time)
+            end = update_data.get("end_time", showtime.end_time)
+            self.repository.lock_screens([showtime.screen_id])
+            index = self.build_schedule_index([showtime.screen_id], start, end)
+            self.check_conflict(index, showtime.screen_id, start, end, exclude_id=showtime_id)
+
+        updated_showtime = self.repository.update(showtime_id, update_data)
+        if update_data.keys() & {"base_price", "start_time"}:
+            price_tables.invalidate(showtime_id)
+        if set(update_data) == {"available_seats"}:
+            self.listings_service.patch_available_seats(showtime_id, updated_showtime.available_seats)
+        else:
+            self.listings_service.refresh_showtime_days(
+                updated_showtime.cinema_id, [previous_day, updated_showtime.start_time.date()]
+            )
+        return updated_showtime
 
     def delete_showtime(self, showtime_id: int) -> bool:
-        return self.repository.delete(showtime_id)
+        showtime = self.get_showtime(showtime_id)
+        if not showtime:
+            return False
+        cinema_id, day = showtime.cinema_id, showtime.start_time.date()
+        deleted = self.repository.delete(showtime_id)
+        if deleted:
+            price_tables.invalidate(showtime_id)
+            self.listings_service.refresh_showtime_days(cinema_id, [day])
+        return deleted
 
     def update_available_seats(self, showtime_id: int, seats_count: int) -> Optional[Showtime]:
         showtime = self.get_showtime(showtime_id)
         if showtime:
             new_count = max(0, showtime.available_seats - seats_count)
-            return self.repository.update(showtime_id, {"available_seats": new_count})
+            updated_showtime = self.repository.update(showtime_id, {"available_seats": new_count})
+            self.listings_service.patch_available_seats(showtime_id, new_count)
+            return updated_showtime
         return None
+
+    def generate_schedule(self, bulk: BulkScheduleCreate) -> List[ShowtimeImportRow]:
+        if bulk.end_date < bulk.start_date:
+            raise ValueError("end_date must not be before start_date")
+        if bulk.weekdays and any(day < 0 or day > 6 for day in bulk.weekdays):
+            raise ValueError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+
+        days = (bulk.end_date - bulk.start_date).days + 1
+        if days * len(bulk.slots) * len(bulk.screen_ids) > settings.SHOWTIME_IMPORT_MAX_ROWS:
+            raise ValueError(f"Schedule would exceed {settings.SHOWTIME_IMPORT_MAX_ROWS} showtimes")
+
+        rows = []
+        for offset in range(days):
+            day = bulk.start_date + timedelta(days=offset)
+            if bulk.weekdays and day.weekday() not in bulk.weekdays:
+                continue
+            for slot in sorted(bulk.slots):
+                for screen_id in bulk.screen_ids:
+                    rows.append(ShowtimeImportRow(
+                        movie_id=bulk.movie_id,
+                        screen_id=screen_id,
+                        start_time=datetime.combine(day, slot),
+                        base_price=bulk.base_price
+                    ))
+        return rows
+
+    def import_showtimes(self, rows: List[ShowtimeImportRow], skip_conflicts: bool = False,
+                         dry_run: bool = False) -> dict:
+        if len(rows) > settings.SHOWTIME_IMPORT_MAX_ROWS:
+            raise ValueError(f"Import exceeds {settings.SHOWTIME_IMPORT_MAX_ROWS} showtimes")
+
+        started = time.perf_counter()
+        result = {"requested": len(rows), "created": 0, "rejected": [], "dry_run": dry_run}
+        if not rows:
+            return self._import_timing(result, started)
+
+        screen_ids = sorted({row.screen_id for row in rows})
+        durations = self.movie_repository.get_durations(sorted({row.movie_id for row in rows}))
+        if not dry_run:
+            self.repository.lock_screens(screen_ids)
+        try:
+            screens = {screen.id: screen for screen in self.screen_repository.get_active_by_ids(screen_ids)}
+
+            window_start = min(row.start_time for row in rows)
+            window_end = max(row.start_time for row in rows) + timedelta(minutes=max(durations.values(), default=0))
+            index = self.build_schedule_index(screen_ids, window_start, window_end)
+
+            accepted = []
+            for number, row in enumerate(rows, start=1):
+                screen = screens.get(row.screen_id)
+                duration = durations.get(row.movie_id)
+                end_time = row.start_time + timedelta(minutes=duration or 0)
+                if duration is None:
+                    reason = f"Movie {row.movie_id} not found or inactive"
+                elif screen is None:
+                    reason = f"Screen {row.screen_id} not found or inactive"
+                else:
+                    try:
+                        self.check_conflict(index, row.screen_id, row.start_time, end_time)
+                        reason = None
+                    except ValueError as e:
+                        reason = str(e)
+
+                if reason:
+                    result["rejected"].append({
+                        "row": number, "screen_id": row.screen_id, "start_time": row.start_time, "reason": reason
+                    })
+                    continue
+
+                index.add(row.screen_id, -number, row.start_time, end_time)
+                accepted.append({
+                    "movie_id": row.movie_id,
+                    "screen_id": row.screen_id,
+                    "cinema_id": screen.cinema_id,
+                    "start_time": row.start_time,
+                    "end_time": end_time,
+                    "base_price": row.base_price,
+                    "available_seats": screen.total_seats,
+                })
+
+            if result["rejected"] and not skip_conflicts:
+                self._import_timing(result, started)
+                raise ScheduleImportError(f"{len(result['rejected'])} of {len(rows)} showtimes rejected", result)
+
+            if not dry_run and accepted:
+                result["created"] = self.repository.bulk_create(accepted, settings.SHOWTIME_IMPORT_BATCH_SIZE)
+                self.repository.commit()
+                schedule_snapshots.clear()
+            elif dry_run:
+                result["created"] = len(accepted)
+        except Exception:
+            self.repository.rollback()
+            raise
+        return self._import_timing(result, started)
+
+    @staticmethod
+    def _import_timing(result: dict, started: float) -> dict:
+        elapsed = time.perf_counter() - started
+        result["elapsed_ms"] = round(elapsed * 1000, 3)
+        result["rows_per_second"] = round(result["created"] / elapsed, 1) if elapsed and result["created"] else 0.0
+        return result
+
+    def reconcile_available_seats(self, since: Optional[datetime] = None) -> dict:
+        since = since or datetime.utcnow() + MIN_UTC_OFFSET
+        drift = self.repository.get_seat_drift(since)
+        corrections = [
+            {"showtime_id": showtime_id, "stored": stored, "expected": max(0, expected)}
+            for showtime_id, stored, expected in drift
+        ]
+        try:
+            self.repository.set_available_seats([
+                {"id": correction["showtime_id"], "available_seats": correction["expected"]}
+                for correction in corrections
+            ])
+            self.repository.commit()
+        except Exception:
+            self.repository.rollback()
+            raise
+        for correction in corrections:
+            self.listings_service.patch_available_seats(correction["showtime_id"], correction["expected"])
+        return {"since": since, "corrected": len(corrections), "corrections": corrections}
@@ -4,8 +4,10 @@ from app.models.domain.user import User, UserRole
 from app.models.schemas.user_schema import UserCreate, UserUpdate
 from app.repositories.user_repository import UserRepository
 from app.core.security import hash_password, verify_password
+from app.core.tracing import traced_class
 
 
+@traced_class("service")
 class UserService:
     def __init__(self, db: Session):
         self.repository = UserRepository(db)
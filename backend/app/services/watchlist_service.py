@@ -0,0 +1,58 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import FrozenSet, List
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models.domain.watchlist import Watchlist
+from app.repositories.movie_repository import MovieRepository
+from app.repositories.watchlist_repository import WatchlistRepository
+from app.core.tracing import traced_class
+from app.utils.membership_cache import MembershipCache
+
+
+watchlist_memberships = MembershipCache(
+    ttl_seconds=settings.WATCHLIST_CACHE_TTL_SECONDS,
+    max_entries=settings.WATCHLIST_CACHE_MAX_USERS,
+)
+registry.register_cache("watchlist_memberships", watchlist_memberships.stats)
+
+
+@traced_class("service")
+class WatchlistService:
+    def __init__(self, db: Session):
+        self.repository = WatchlistRepository(db)
+        self.movie_repository = MovieRepository(db)
+
+    def get_watchlist(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Watchlist]:
+        return self.repository.get_by_user(user_id, skip, limit)
+
+    def get_movie_ids(self, user_id: int) -> FrozenSet[int]:
+        movie_ids = watchlist_memberships.get(user_id)
+        if movie_ids is None:
+            generation = watchlist_memberships.generation()
+            movie_ids = frozenset(self.repository.get_movie_ids(user_id))
+            watchlist_memberships.put(user_id, movie_ids, generation)
+        return movie_ids
+
+    def filter_members(self, user_id: int, movie_ids: List[int]) -> List[int]:
+        members = self.get_movie_ids(user_id)
+        return [movie_id for movie_id in dict.fromkeys(movie_ids) if movie_id in members]
+
+    def add_movie(self, user_id: int, movie_id: int) -> Watchlist:
+        movie = self.movie_repository.get_by_id(movie_id)
+        if not movie or not movie.is_active:
+            raise ValueError("Movie not found")
+
+        try:
+            entry = self.repository.create(Watchlist(user_id=user_id, movie_id=movie_id))
+        except IntegrityError:
+            self.repository.rollback()
+            raise ValueError("Movie is already in your watchlist")
+        watchlist_memberships.add(user_id, movie_id)
+        return entry
+
+    def remove_movie(self, user_id: int, movie_id: int) -> bool:
+        removed = self.repository.remove(user_id, movie_id)
+        if removed:
+            watchlist_memberships.discard(user_id, movie_id)
+        return removed
@@ -0,0 +1,36 @@
+from typing import List, Optional
+import re
+from app.utils.search_index import normalize_text
+
+
+GENRE_SEPARATOR = re.compile(r"[,/|]")
+CAST_SEPARATOR = re.compile(r"[,;|]")
+WHITESPACE = re.compile(r"\s+")
+
+
+def canonical_genre(genre: str) -> str:
+    return WHITESPACE.sub(" ", genre).strip().title()
+
+
+def split_genres(genre: Optional[str]) -> List[str]:
+    genres = []
+    for value in GENRE_SEPARATOR.split(genre or ""):
+        value = canonical_genre(value)
+        if value and value not in genres:
+            genres.append(value)
+    return genres
+
+
+def cast_key(name: str) -> str:
+    return WHITESPACE.sub(" ", normalize_text(name)).strip()
+
+
+def split_cast(cast: Optional[str]) -> List[str]:
+    names = []
+    keys = set()
+    for value in CAST_SEPARATOR.split(cast or ""):
+        name = WHITESPACE.sub(" ", value).strip()
+        if name and cast_key(name) not in keys:
+            keys.add(cast_key(name))
+            names.append(name)
+    return names
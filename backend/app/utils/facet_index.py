@@ -0,0 +1,140 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import threading
+from app.utils.search_index import normalize_text
+
+
+def to_bitmap(ids: Iterable[int]) -> int:
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for doc_id in ids:
+        buffer[doc_id >> 3] |= 1 << (doc_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def iter_bitmap(bitmap: int) -> Iterator[int]:
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+class FacetIndex:
+    def __init__(self, facets: Iterable[str], ranges: Iterable[str]):
+        self.facets = list(facets)
+        self.ranges = list(ranges)
+        self.all = 0
+        self.bitmaps: Dict[str, Dict[str, int]] = {facet: defaultdict(int) for facet in self.facets}
+        self.labels: Dict[str, Dict[str, str]] = {facet: {} for facet in self.facets}
+        self.sorted_values: Dict[str, List[Tuple[Any, int]]] = {field: [] for field in self.ranges}
+        self.documents: Dict[int, Tuple[Dict[str, List[str]], Dict[str, Any]]] = {}
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @staticmethod
+    def _key(value: str) -> str:
+        return normalize_text(str(value)).strip()
+
+    def _prepare(self, values: Dict[str, Iterable[str]], range_values: Dict[str, Any]):
+        keys = {}
+        for facet in self.facets:
+            keys[facet] = []
+            for value in values.get(facet) or ():
+                key = self._key(value)
+                if key and key not in keys[facet]:
+                    keys[facet].append(key)
+                    self.labels[facet].setdefault(key, str(value).strip())
+        return keys, {field: range_values.get(field) for field in self.ranges}
+
+    def add(self, doc_id: int, values: Dict[str, Iterable[str]], range_values: Dict[str, Any]):
+        self.add_many([(doc_id, values, range_values)])
+
+    def add_many(self, documents: Iterable[Tuple[int, Dict[str, Iterable[str]], Dict[str, Any]]]):
+        prepared = [(doc_id, *self._prepare(values, range_values)) for doc_id, values, range_values in documents]
+        doc_ids = []
+        facet_ids: Dict[str, Dict[str, List[int]]] = {facet: defaultdict(list) for facet in self.facets}
+        with self.lock:
+            for doc_id, keys, ranges in prepared:
+                self._remove_unlocked(doc_id)
+                doc_ids.append(doc_id)
+                for facet, facet_keys in keys.items():
+                    for key in facet_keys:
+                        facet_ids[facet][key].append(doc_id)
+                for field, value in ranges.items():
+                    if value is not None:
+                        self.sorted_values[field].append((value, doc_id))
+                self.documents[doc_id] = (keys, ranges)
+            self.all |= to_bitmap(doc_ids)
+            for facet, ids_by_key in facet_ids.items():
+                for key, ids in ids_by_key.items():
+                    self.bitmaps[facet][key] |= to_bitmap(ids)
+            for field in self.ranges:
+                self.sorted_values[field].sort()
+
+    def remove(self, doc_id: int):
+        with self.lock:
+            self._remove_unlocked(doc_id)
+
+    def _remove_unlocked(self, doc_id: int):
+        document = self.documents.pop(doc_id, None)
+        if document is None:
+            return
+        keys, ranges = document
+        mask = ~(1 << doc_id)
+        self.all &= mask
+        for facet, facet_keys in keys.items():
+            bitmaps = self.bitmaps[facet]
+            for key in facet_keys:
+                bitmaps[key] &= mask
+                if not bitmaps[key]:
+                    del bitmaps[key]
+        for field, value in ranges.items():
+            if value is None:
+                continue
+            entries = self.sorted_values[field]
+            index = bisect_left(entries, (value, doc_id))
+            if index < len(entries) and entries[index] == (value, doc_id):
+                del entries[index]
+
+    def clear(self):
+        with self.lock:
+            self.all = 0
+            self.documents.clear()
+            for facet in self.facets:
+                self.bitmaps[facet].clear()
+                self.labels[facet].clear()
+            for field in self.ranges:
+                self.sorted_values[field].clear()
+
+    def match(self, facet: str, values: Iterable[str]) -> int:
+        bitmaps = self.bitmaps[facet]
+        bitmap = 0
+        with self.lock:
+            for value in values:
+                bitmap |= bitmaps.get(self._key(value), 0)
+        return bitmap
+
+    def match_range(self, field: str, low: Optional[Any] = None, high: Optional[Any] = None) -> int:
+        if low is None and high is None:
+            return self.all
+        with self.lock:
+            entries = self.sorted_values[field]
+            start = 0 if low is None else bisect_left(entries, (low, -1))
+            end = len(entries) if high is None else bisect_right(entries, (high, float("inf")))
+            return to_bitmap(doc_id for _, doc_id in entries[start:end])
+
+    def count(self, facet: str, bitmap: int) -> List[Tuple[str, int]]:
+        with self.lock:
+            counts = [
+                (self.labels[facet].get(key, key), (value_bitmap & bitmap).bit_count())
+                for key, value_bitmap in self.bitmaps[facet].items()
+            ]
+        return sorted(
+            [(label, count) for label, count in counts if count],
+            key=lambda item: (-item[1], item[0])
+        )
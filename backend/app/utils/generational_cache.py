@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+
+class GenerationalCache:
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 1024):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.invalidated: Dict[Hashable, int] = {}
+        self.version = 0
+        self.floor = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self.lock:
+            value = self._lookup_unlocked(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def generation(self) -> int:
+        with self.lock:
+            return self.version
+
+    def put(self, key: Hashable, value: Any, generation: int) -> bool:
+        with self.lock:
+            if max(self.floor, self.invalidated.get(key, 0)) > generation:
+                return False
+            self._discard_unlocked(key)
+            self.entries[key] = (time.monotonic(), value)
+            self._stored_unlocked(key, value)
+            while len(self.entries) > self.max_entries:
+                self._discard_unlocked(next(iter(self.entries)))
+            return True
+
+    def invalidate(self, key: Hashable):
+        with self.lock:
+            self._bump_unlocked(key)
+            self._discard_unlocked(key)
+
+    def clear(self):
+        with self.lock:
+            self._fence_unlocked()
+            for key in list(self.entries):
+                self._discard_unlocked(key)
+
+    def _lookup_unlocked(self, key: Hashable) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            self._discard_unlocked(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def _bump_unlocked(self, key: Hashable):
+        self.version += 1
+        self.invalidated[key] = self.version
+        if len(self.invalidated) > self.max_entries:
+            self._fence_unlocked()
+
+    def _fence_unlocked(self):
+        self.version += 1
+        self.floor = self.version
+        self.invalidated.clear()
+
+    def _discard_unlocked(self, key: Hashable):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._evicted_unlocked(key, entry[1])
+
+    def _stored_unlocked(self, key: Hashable, value: Any):
+        pass
+
+    def _evicted_unlocked(self, key: Hashable, value: Any):
+        pass
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.entries),
+                "maxsize": self.max_entries,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
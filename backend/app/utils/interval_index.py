@@ -0,0 +1,73 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+class IntervalIndex:
+    def __init__(self):
+        self.intervals: List[Tuple[datetime, datetime, int]] = []
+        self.starts: Dict[int, datetime] = {}
+        self.max_span = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def add(self, interval_id: int, start: datetime, end: datetime):
+        self.remove(interval_id)
+        insort(self.intervals, (start, end, interval_id))
+        self.starts[interval_id] = start
+        self.max_span = max(self.max_span, end - start)
+
+    def remove(self, interval_id: int):
+        start = self.starts.pop(interval_id, None)
+        if start is None:
+            return
+        index = bisect_left(self.intervals, (start,))
+        while index < len(self.intervals) and self.intervals[index][0] == start:
+            if self.intervals[index][2] == interval_id:
+                del self.intervals[index]
+                if not self.intervals:
+                    self.max_span = timedelta(0)
+                return
+            index += 1
+
+    def find_overlap(self, start: datetime, end: datetime, gap: timedelta = timedelta(0),
+                     exclude_id: Optional[int] = None) -> Optional[Tuple[datetime, datetime, int]]:
+        index = bisect_left(self.intervals, (start,))
+
+        horizon = start - self.max_span - gap
+        before = index - 1
+        while before >= 0 and self.intervals[before][0] > horizon:
+            interval = self.intervals[before]
+            if interval[2] != exclude_id and interval[1] + gap > start:
+                return interval
+            before -= 1
+
+        after = index
+        while after < len(self.intervals) and self.intervals[after][2] == exclude_id:
+            after += 1
+        if after < len(self.intervals) and self.intervals[after][0] < end + gap:
+            return self.intervals[after]
+
+        return None
+
+
+class ScheduleIndex:
+    def __init__(self, buffer: timedelta = timedelta(0)):
+        self.buffer = buffer
+        self.screens: Dict[int, IntervalIndex] = {}
+
+    def add(self, screen_id: int, showtime_id: int, start: datetime, end: datetime):
+        self.screens.setdefault(screen_id, IntervalIndex()).add(showtime_id, start, end)
+
+    def remove(self, screen_id: int, showtime_id: int):
+        screen = self.screens.get(screen_id)
+        if screen is not None:
+            screen.remove(showtime_id)
+
+    def find_conflict(self, screen_id: int, start: datetime, end: datetime,
+                      exclude_id: Optional[int] = None) -> Optional[Tuple[datetime, datetime, int]]:
+        screen = self.screens.get(screen_id)
+        if screen is None:
+            return None
+        return screen.find_overlap(start, end, self.buffer, exclude_id)
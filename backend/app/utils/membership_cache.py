@@ -0,0 +1,26 @@
+from typing import FrozenSet, Iterable, Optional
+from app.utils.generational_cache import GenerationalCache
+
+
+class MembershipCache(GenerationalCache):
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 10000):
+        super().__init__(ttl_seconds, max_entries)
+
+    def get(self, owner_id: int) -> Optional[FrozenSet[int]]:
+        return super().get(owner_id)
+
+    def put(self, owner_id: int, members: Iterable[int], generation: int) -> bool:
+        return super().put(owner_id, frozenset(members), generation)
+
+    def add(self, owner_id: int, member: int):
+        self._patch(owner_id, lambda members: members | {member})
+
+    def discard(self, owner_id: int, member: int):
+        self._patch(owner_id, lambda members: members - {member})
+
+    def _patch(self, owner_id: int, change):
+        with self.lock:
+            self._bump_unlocked(owner_id)
+            entry = self.entries.get(owner_id)
+            if entry is not None:
+                self.entries[owner_id] = (entry[0], change(entry[1]))
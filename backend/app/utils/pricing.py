@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Set, Tuple
+from app.utils.generational_cache import GenerationalCache
+
+
+class PriceRules:
+    def __init__(self, seat_multipliers: Dict[str, float], weekday_multipliers: Dict[int, float],
+                 time_of_day_multipliers: List[Tuple[int, int, float]]):
+        self.seat_multipliers = dict(seat_multipliers)
+        self.weekday_multipliers = dict(weekday_multipliers)
+        self.hour_multipliers = [1.0] * 24
+        for start_hour, end_hour, multiplier in time_of_day_multipliers:
+            for hour in range(max(0, start_hour), min(24, end_hour)):
+                self.hour_multipliers[hour] *= multiplier
+
+    def time_multiplier(self, start_time: datetime) -> float:
+        return self.hour_multipliers[start_time.hour] * self.weekday_multipliers.get(start_time.weekday(), 1.0)
+
+    def compile(self, showtime_id: int, screen_id: int, base_price: float, start_time: datetime,
+                seats: Iterable[Tuple[int, str]]) -> "PriceTable":
+        multiplier = self.time_multiplier(start_time)
+        category_prices = {
+            category: round(base_price * multiplier * seat_multiplier, 2)
+            for category, seat_multiplier in self.seat_multipliers.items()
+        }
+        default_price = round(base_price * multiplier, 2)
+        prices, categories = {}, {}
+        for seat_id, category in seats:
+            prices[seat_id] = category_prices.get(category, default_price)
+            categories[seat_id] = category
+        return PriceTable(showtime_id, screen_id, prices, categories)
+
+
+class PriceTable:
+    __slots__ = ("showtime_id", "screen_id", "prices", "categories")
+
+    def __init__(self, showtime_id: int, screen_id: int, prices: Dict[int, float], categories: Dict[int, str]):
+        self.showtime_id = showtime_id
+        self.screen_id = screen_id
+        self.prices = prices
+        self.categories = categories
+
+    def quote(self, seat_ids: List[int]) -> Tuple[List[dict], float]:
+        lines = []
+        for seat_id in seat_ids:
+            price = self.prices.get(seat_id)
+            if price is None:
+                raise ValueError(f"Seat {seat_id} does not belong to this showtime's screen")
+            lines.append({"seat_id": seat_id, "seat_category": self.categories[seat_id], "price": price})
+        return lines, round(sum(line["price"] for line in lines), 2)
+
+
+class PriceTableCache(GenerationalCache):
+    def __init__(self, ttl_seconds: float = 600, max_entries: int = 2048):
+        super().__init__(ttl_seconds, max_entries)
+        self.screen_showtimes: Dict[int, Set[int]] = {}
+
+    def put(self, table: PriceTable, generation: int) -> bool:
+        return super().put(table.showtime_id, table, generation)
+
+    def invalidate_screen(self, screen_id: int):
+        with self.lock:
+            self._fence_unlocked()
+            for showtime_id in list(self.screen_showtimes.get(screen_id, ())):
+                self._discard_unlocked(showtime_id)
+
+    def _stored_unlocked(self, showtime_id: int, table: PriceTable):
+        self.screen_showtimes.setdefault(table.screen_id, set()).add(showtime_id)
+
+    def _evicted_unlocked(self, showtime_id: int, table: PriceTable):
+        showtimes = self.screen_showtimes.get(table.screen_id)
+        if showtimes is not None:
+            showtimes.discard(showtime_id)
+            if not showtimes:
+                del self.screen_showtimes[table.screen_id]
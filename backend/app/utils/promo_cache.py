@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional
+from app.utils.generational_cache import GenerationalCache
+
+
+def normalize_code(code: str) -> str:
+    return code.strip().upper()
+
+
+class PromoSnapshot(NamedTuple):
+    id: int
+    code: str
+    discount_type: str
+    discount_value: float
+    min_booking_amount: float
+    valid_from: datetime
+    valid_until: datetime
+
+    def discount_for(self, amount: float) -> float:
+        if self.discount_type == "percentage":
+            discount = amount * min(self.discount_value, 100.0) / 100.0
+        else:
+            discount = self.discount_value
+        return round(min(discount, amount), 2)
+
+
+class PromoTable(NamedTuple):
+    codes: Dict[str, PromoSnapshot]
+    by_id: Dict[int, PromoSnapshot]
+
+
+class PromoCodeCache(GenerationalCache):
+    key = "promo_codes"
+
+    def __init__(self, ttl_seconds: float = 60):
+        super().__init__(ttl_seconds, max_entries=1)
+
+    def is_stale(self) -> bool:
+        with self.lock:
+            return self._lookup_unlocked(self.key) is None
+
+    def replace(self, snapshots: Iterable[PromoSnapshot], generation: int) -> bool:
+        snapshots = list(snapshots)
+        table = PromoTable(
+            codes={normalize_code(snapshot.code): snapshot for snapshot in snapshots},
+            by_id={snapshot.id: snapshot for snapshot in snapshots},
+        )
+        return self.put(self.key, table, generation)
+
+    def get(self, code: str) -> Optional[PromoSnapshot]:
+        return self._find(lambda table: table.codes.get(normalize_code(code)))
+
+    def get_by_id(self, promo_code_id: int) -> Optional[PromoSnapshot]:
+        return self._find(lambda table: table.by_id.get(promo_code_id))
+
+    def _find(self, lookup) -> Optional[PromoSnapshot]:
+        with self.lock:
+            table = self._lookup_unlocked(self.key)
+            snapshot = lookup(table) if table is not None else None
+            if snapshot is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return snapshot
+
+    def discard(self, promo_code_id: int):
+        with self.lock:
+            table = self._lookup_unlocked(self.key)
+            snapshot = table.by_id.pop(promo_code_id, None) if table is not None else None
+            if snapshot is not None:
+                table.codes.pop(normalize_code(snapshot.code), None)
+
+    def invalidate(self):
+        super().invalidate(self.key)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self.lock:
+            table = self._lookup_unlocked(self.key)
+            stats["size"] = len(table.codes) if table is not None else 0
+        stats.pop("maxsize")
+        return stats
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+import io
+import threading
+
+
+def render_qr_png(payload: str, scale: int = 8) -> bytes:
+    import segno
+
+    buffer = io.BytesIO()
+    segno.make_qr(payload, error="m").save(buffer, kind="png", scale=scale, border=4)
+    return buffer.getvalue()
+
+
+class QRImageCache:
+    def __init__(self, workers: int = 2, max_entries: int = 4096, scale: int = 8):
+        self.max_entries = max_entries
+        self.scale = scale
+        self.workers = workers
+        self.images: "OrderedDict[str, bytes]" = OrderedDict()
+        self.pending: Dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self.lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ticket-qr")
+        return self._executor
+
+    def get(self, payload: str) -> Optional[bytes]:
+        with self.lock:
+            image = self.images.get(payload)
+            if image is None:
+                self.misses += 1
+                return None
+            self.images.move_to_end(payload)
+            self.hits += 1
+            return image
+
+    def submit(self, payload: str) -> Future:
+        executor = self.executor
+        with self.lock:
+            future = self.pending.get(payload)
+            if future is not None:
+                return future
+            image = self.images.get(payload)
+            if image is not None:
+                future = Future()
+                future.set_result(image)
+                return future
+            future = self.pending[payload] = executor.submit(self._render, payload)
+            return future
+
+    def _render(self, payload: str) -> bytes:
+        try:
+            image = render_qr_png(payload, self.scale)
+            with self.lock:
+                self.renders += 1
+                self.images[payload] = image
+                self.images.move_to_end(payload)
+                while len(self.images) > self.max_entries:
+                    self.images.popitem(last=False)
+            return image
+        finally:
+            with self.lock:
+                self.pending.pop(payload, None)
+
+    def render(self, payload: str, timeout: Optional[float] = None) -> bytes:
+        image = self.get(payload)
+        if image is not None:
+            return image
+        return self.submit(payload).result(timeout)
+
+    def prerender(self, payloads: Iterable[str]):
+        for payload in payloads:
+            self.submit(payload)
+
+    def discard(self, payloads: Iterable[str]):
+        with self.lock:
+            for payload in payloads:
+                self.images.pop(payload, None)
+
+    def clear(self):
+        with self.lock:
+            self.images.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.images),
+                "maxsize": self.max_entries,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "renders": self.renders,
+                "pending": len(self.pending),
+            }
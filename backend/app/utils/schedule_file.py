@@ -0,0 +1,28 @@
+from typing import List
+import csv
+import io
+import json
+from pydantic import ValidationError
+from app.models.schemas.showtime_schema import ShowtimeImportRow
+
+
+def parse_schedule_file(content: str, filename: str = "") -> List[ShowtimeImportRow]:
+    if filename.lower().endswith(".json") or content.lstrip().startswith("["):
+        try:
+            records = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON schedule: {e}")
+        if not isinstance(records, list):
+            raise ValueError("JSON schedule must be a list of rows")
+    else:
+        records = list(csv.DictReader(io.StringIO(content)))
+
+    rows = []
+    for number, record in enumerate(records, start=1):
+        try:
+            rows.append(ShowtimeImportRow.model_validate(record))
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            raise ValueError(f"Row {number}: {field}: {error['msg']}")
+    return rows
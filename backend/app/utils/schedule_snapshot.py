@@ -0,0 +1,84 @@
+from datetime import date
+from typing import Dict, Optional, Set, Tuple
+import gzip
+import hashlib
+import json
+import threading
+from app.utils.generational_cache import GenerationalCache
+
+
+class ScheduleSnapshot:
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.showtimes: Dict[int, dict] = {
+            showtime["id"]: showtime
+            for movie in payload["movies"]
+            for cinema in movie["cinemas"]
+            for showtime in cinema["showtimes"]
+        }
+        self.lock = threading.Lock()
+        self._body = None
+        self._etag = None
+
+    def encoded(self) -> Tuple[bytes, str]:
+        with self.lock:
+            if self._body is None:
+                raw = json.dumps(self.payload, separators=(",", ":")).encode()
+                self._body = gzip.compress(raw, compresslevel=6)
+                self._etag = f'"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+            return self._body, self._etag
+
+    def patch_available_seats(self, showtime_id: int, available_seats: int) -> bool:
+        with self.lock:
+            showtime = self.showtimes.get(showtime_id)
+            if showtime is None:
+                return False
+            if showtime["available_seats"] != available_seats:
+                showtime["available_seats"] = available_seats
+                self._body = None
+                self._etag = None
+            return True
+
+
+class ScheduleSnapshotStore(GenerationalCache):
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 256):
+        super().__init__(ttl_seconds, max_entries)
+        self.showtime_keys: Dict[int, Set[Tuple[str, date]]] = {}
+        self.patches = 0
+
+    def get(self, city: str, day: date) -> Optional[ScheduleSnapshot]:
+        return super().get((city, day))
+
+    def put(self, city: str, day: date, snapshot: ScheduleSnapshot, generation: int) -> bool:
+        return super().put((city, day), snapshot, generation)
+
+    def invalidate(self, city: str, day: date):
+        super().invalidate((city, day))
+
+    def _stored_unlocked(self, key: Tuple[str, date], snapshot: ScheduleSnapshot):
+        for showtime_id in snapshot.showtimes:
+            self.showtime_keys.setdefault(showtime_id, set()).add(key)
+
+    def _evicted_unlocked(self, key: Tuple[str, date], snapshot: ScheduleSnapshot):
+        for showtime_id in snapshot.showtimes:
+            keys = self.showtime_keys.get(showtime_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.showtime_keys[showtime_id]
+
+    def patch_available_seats(self, showtime_id: int, available_seats: int) -> bool:
+        with self.lock:
+            snapshots = [self.entries[key][1] for key in self.showtime_keys.get(showtime_id, ())]
+        patched = False
+        for snapshot in snapshots:
+            patched = snapshot.patch_available_seats(showtime_id, available_seats) or patched
+        if patched:
+            with self.lock:
+                self.patches += 1
+        return patched
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["patches"] = self.patches
+        return stats
@@ -0,0 +1,115 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+import math
+import re
+import threading
+import unicodedata
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+
+class InvertedIndex:
+    def __init__(self, field_weights: Dict[str, float]):
+        self.field_weights = field_weights
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self.documents: Dict[int, List[str]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, doc_id: int, fields: Dict[str, str]):
+        weights: Dict[str, float] = defaultdict(float)
+        for field, text in fields.items():
+            field_weight = self.field_weights.get(field, 1.0)
+            for token in tokenize(text):
+                weights[token] += field_weight
+
+        with self.lock:
+            self._remove_unlocked(doc_id)
+            for token, weight in weights.items():
+                if token not in self.postings:
+                    self._vocabulary_dirty = True
+                self.postings[token][doc_id] = weight
+            self.documents[doc_id] = list(weights)
+
+    def remove(self, doc_id: int):
+        with self.lock:
+            self._remove_unlocked(doc_id)
+
+    def _remove_unlocked(self, doc_id: int):
+        for token in self.documents.pop(doc_id, []):
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[token]
+                self._vocabulary_dirty = True
+
+    def clear(self):
+        with self.lock:
+            self.postings.clear()
+            self.documents.clear()
+            self._vocabulary = []
+            self._vocabulary_dirty = False
+
+    def _expand_prefix(self, prefix: str) -> Iterable[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_dirty = False
+        start = bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            yield token
+
+    def search(self, query: str, prefix_last: bool = True) -> List[Tuple[int, float]]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        with self.lock:
+            total = len(self.documents) or 1
+            scores = None
+            for position, token in enumerate(tokens):
+                if prefix_last and position == len(tokens) - 1:
+                    candidates = list(self._expand_prefix(token))
+                else:
+                    candidates = [token] if token in self.postings else []
+
+                token_scores: Dict[int, float] = {}
+                for candidate in candidates:
+                    postings = self.postings[candidate]
+                    idf = math.log(1 + total / len(postings))
+                    exact_boost = 1.0 if candidate == token else 0.5
+                    for doc_id, weight in postings.items():
+                        score = weight * idf * exact_boost
+                        if score > token_scores.get(doc_id, 0.0):
+                            token_scores[doc_id] = score
+
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {
+                        doc_id: score + token_scores[doc_id]
+                        for doc_id, score in scores.items()
+                        if doc_id in token_scores
+                    }
+                if not scores:
+                    return []
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
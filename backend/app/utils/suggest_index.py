@@ -0,0 +1,121 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+import threading
+from app.utils.search_index import tokenize
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleSuggester:
+    def __init__(self, min_similarity: float = 0.5):
+        self.min_similarity = min_similarity
+        self.titles: Dict[int, Tuple[str, float, str]] = {}
+        self._keys: List[Tuple[str, int]] = []
+        self._doc_keys: Dict[int, List[Tuple[str, int]]] = {}
+        self._trigrams: Dict[str, Set[int]] = defaultdict(set)
+        self._doc_trigrams: Dict[int, Set[str]] = {}
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @staticmethod
+    def _normalize(title: str) -> str:
+        return " ".join(tokenize(title))
+
+    def add(self, movie_id: int, title: str, score: float = 0.0):
+        self.add_many([(movie_id, title, score)])
+
+    def add_many(self, titles: Iterable[Tuple[int, str, float]]):
+        prepared = []
+        for movie_id, title, score in titles:
+            normalized = self._normalize(title)
+            words = normalized.split(" ")
+            keys = [(" ".join(words[i:]), movie_id) for i in range(len(words))]
+            prepared.append((movie_id, title, score, normalized, keys, trigrams(normalized)))
+
+        with self.lock:
+            for movie_id, title, score, normalized, keys, grams in prepared:
+                self._remove_unlocked(movie_id)
+                self.titles[movie_id] = (title, score, normalized)
+                self._keys.extend(keys)
+                self._doc_keys[movie_id] = keys
+                for gram in grams:
+                    self._trigrams[gram].add(movie_id)
+                self._doc_trigrams[movie_id] = grams
+            self._keys.sort()
+
+    def remove(self, movie_id: int):
+        with self.lock:
+            self._remove_unlocked(movie_id)
+
+    def _remove_unlocked(self, movie_id: int):
+        if movie_id not in self.titles:
+            return
+        del self.titles[movie_id]
+        for key in self._doc_keys.pop(movie_id, []):
+            index = bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                del self._keys[index]
+        for gram in self._doc_trigrams.pop(movie_id, set()):
+            ids = self._trigrams.get(gram)
+            if ids is not None:
+                ids.discard(movie_id)
+                if not ids:
+                    del self._trigrams[gram]
+
+    def clear(self):
+        with self.lock:
+            self.titles.clear()
+            self._keys.clear()
+            self._doc_keys.clear()
+            self._trigrams.clear()
+            self._doc_trigrams.clear()
+
+    def _prefix_matches(self, prefix: str, limit: int) -> List[int]:
+        matches: Dict[int, int] = {}
+        start = bisect_left(self._keys, (prefix, -1))
+        for key, movie_id in self._keys[start:]:
+            if not key.startswith(prefix):
+                break
+            position = 0 if key == self.titles[movie_id][2] else 1
+            if movie_id not in matches or position < matches[movie_id]:
+                matches[movie_id] = position
+            if len(matches) >= limit * 4:
+                break
+        return sorted(
+            matches,
+            key=lambda movie_id: (matches[movie_id], -self.titles[movie_id][1], self.titles[movie_id][0])
+        )
+
+    def _fuzzy_matches(self, query: str, exclude: Set[int]) -> List[int]:
+        query_grams = trigrams(query)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for movie_id in self._trigrams.get(gram, ()):
+                if movie_id not in exclude:
+                    shared[movie_id] += 1
+
+        scored = []
+        for movie_id, common in shared.items():
+            coverage = common / len(query_grams)
+            if coverage >= self.min_similarity:
+                jaccard = common / (len(query_grams) + len(self._doc_trigrams[movie_id]) - common)
+                scored.append((coverage, jaccard, movie_id))
+        scored.sort(key=lambda item: (-item[0], -item[1], -self.titles[item[2]][1]))
+        return [movie_id for _, _, movie_id in scored]
+
+    def suggest(self, query: str, limit: int = 10) -> List[Tuple[int, str]]:
+        normalized = self._normalize(query)
+        if not normalized:
+            return []
+
+        with self.lock:
+            ids = self._prefix_matches(normalized, limit)[:limit]
+            if len(ids) < limit and len(normalized) >= 3:
+                ids += self._fuzzy_matches(normalized, set(ids))[:limit - len(ids)]
+            return [(movie_id, self.titles[movie_id][0]) for movie_id in ids]
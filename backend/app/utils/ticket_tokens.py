@@ -0,0 +1,48 @@
+from typing import NamedTuple, Optional
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+
+TOKEN_PREFIX = "CV1"
+SIGNATURE_BYTES = 12
+
+_claims = struct.Struct(">III")
+_token_length = (_claims.size + SIGNATURE_BYTES) * 4 // 3
+
+
+class TicketClaims(NamedTuple):
+    ticket_id: int
+    showtime_id: int
+    seat_id: int
+
+
+def derive_key(secret: str) -> bytes:
+    return hmac.new(secret.encode("utf-8"), b"cineverse-ticket-payload", hashlib.sha256).digest()
+
+
+class TicketSigner:
+    def __init__(self, key: bytes):
+        self.key = key
+
+    def _signature(self, body: bytes) -> bytes:
+        return hmac.new(self.key, body, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+    def sign(self, ticket_id: int, showtime_id: int, seat_id: int) -> str:
+        body = _claims.pack(ticket_id, showtime_id, seat_id)
+        token = base64.urlsafe_b64encode(body + self._signature(body)).decode("ascii")
+        return f"{TOKEN_PREFIX}.{token}"
+
+    def verify(self, payload: str) -> Optional[TicketClaims]:
+        prefix, _, token = payload.partition(".")
+        if prefix != TOKEN_PREFIX or len(token) != _token_length:
+            return None
+        try:
+            raw = base64.b64decode(token, altchars=b"-_", validate=True)
+        except (binascii.Error, ValueError):
+            return None
+        body, signature = raw[:_claims.size], raw[_claims.size:]
+        if not hmac.compare_digest(signature, self._signature(body)):
+            return None
+        return TicketClaims(*_claims.unpack(body))
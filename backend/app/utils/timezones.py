@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+
+
+MIN_UTC_OFFSET = timedelta(hours=-12)
+MAX_UTC_OFFSET = timedelta(hours=14)
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: Optional[str] = None) -> ZoneInfo:
+    return ZoneInfo(name or settings.DEFAULT_TIMEZONE)
+
+
+def local_now(name: Optional[str] = None) -> datetime:
+    return datetime.now(get_zone(name)).replace(tzinfo=None)
+
+
+def local_to_utc(local: datetime, name: Optional[str] = None) -> datetime:
+    return local.replace(tzinfo=get_zone(name)).astimezone(timezone.utc)
@@ -0,0 +1,126 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark_listings.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("FIREBASE_PROJECT_ID", "benchmark")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY_ID", "benchmark")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY", "benchmark")
+os.environ.setdefault("FIREBASE_CLIENT_EMAIL", "benchmark@example.com")
+os.environ.setdefault("FIREBASE_CLIENT_ID", "benchmark")
+
+from app.db.query_counter import count_queries
+from app.db.session import SessionLocal, init_db
+from app.models.domain.cinema import Cinema, Screen
+from app.models.domain.movie import Movie, MovieStatus
+from app.models.domain.showtime import Showtime
+from app.services.cinema_service import CinemaService
+from app.services.listings_service import ListingsService
+from app.services.movie_service import MovieService
+from app.services.showtime_service import ShowtimeService
+
+CITY = "Benchmark City"
+
+
+def seed(db, movies: int, cinemas: int, screens: int, shows_per_screen: int, day: date):
+    if db.query(Cinema).filter(Cinema.city == CITY).first():
+        return
+
+    movie_rows = [
+        Movie(title=f"Benchmark Movie {i}", duration=120, release_date=date(2024, 1, 1),
+              genre="Drama", language="English", status=MovieStatus.NOW_PLAYING)
+        for i in range(movies)
+    ]
+    db.add_all(movie_rows)
+    cinema_rows = [Cinema(name=f"Benchmark Cinema {i}", city=CITY) for i in range(cinemas)]
+    db.add_all(cinema_rows)
+    db.flush()
+
+    showtimes = []
+    for cinema in cinema_rows:
+        for number in range(screens):
+            screen = Screen(cinema_id=cinema.id, screen_number=number + 1, total_seats=120)
+            db.add(screen)
+            db.flush()
+            for slot in range(shows_per_screen):
+                movie = movie_rows[(cinema.id + number + slot) % movies]
+                start = datetime.combine(day, datetime.min.time()) + timedelta(hours=10 + slot * 3)
+                showtimes.append(Showtime(
+                    movie_id=movie.id, screen_id=screen.id, cinema_id=cinema.id,
+                    start_time=start, end_time=start + timedelta(minutes=movie.duration),
+                    base_price=12.5, available_seats=120
+                ))
+    db.add_all(showtimes)
+    db.commit()
+
+
+def fan_out(db, day: date) -> int:
+    movie_service = MovieService(db)
+    showtime_service = ShowtimeService(db)
+    cinema_service = CinemaService(db)
+
+    results = 0
+    for movie in movie_service.get_movies_by_status(MovieStatus.NOW_PLAYING, 0, 100):
+        for showtime in showtime_service.get_showtimes_by_movie(movie.id, 0, 100):
+            if showtime.start_time.date() != day:
+                continue
+            cinema = cinema_service.get_cinema(showtime.cinema_id)
+            if cinema and cinema.city == CITY:
+                results += 1
+    return results
+
+
+def aggregated(db, day: date) -> int:
+    listings = ListingsService(db).get_listings(CITY, day)
+    return sum(
+        len(cinema["showtimes"])
+        for movie in listings["movies"]
+        for cinema in movie["cinemas"]
+    )
+
+
+def measure(name: str, func, day: date, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            with count_queries() as stats:
+                start = time.perf_counter()
+                results = func(db, day)
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            db.close()
+    print(
+        f"{name:<12} showtimes={results:<5} queries={stats.count:<5} "
+        f"median={statistics.median(timings):8.2f} ms  p95={sorted(timings)[int(len(timings) * 0.95) - 1]:8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the listings endpoint query plan against the client fan-out")
+    parser.add_argument("--movies", type=int, default=40)
+    parser.add_argument("--cinemas", type=int, default=10)
+    parser.add_argument("--screens", type=int, default=4)
+    parser.add_argument("--shows-per-screen", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    day = date.today()
+    init_db()
+    db = SessionLocal()
+    try:
+        seed(db, args.movies, args.cinemas, args.screens, args.shows_per_screen, day)
+    finally:
+        db.close()
+
+    measure("fan-out", fan_out, day, args.repeat)
+    measure("listings", aggregated, day, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
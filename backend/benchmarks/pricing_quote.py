@@ -0,0 +1,98 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark_pricing.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("FIREBASE_PROJECT_ID", "benchmark")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY_ID", "benchmark")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY", "benchmark")
+os.environ.setdefault("FIREBASE_CLIENT_EMAIL", "benchmark@example.com")
+os.environ.setdefault("FIREBASE_CLIENT_ID", "benchmark")
+
+from app.db.query_counter import count_queries
+from app.db.session import SessionLocal, init_db
+from app.models.domain.cinema import Cinema, Screen
+from app.models.domain.seat import Seat, SeatCategory
+from app.models.domain.showtime import Showtime
+from app.services.pricing_service import PricingService, price_tables
+
+CITY = "Pricing Benchmark City"
+CATEGORIES = [SeatCategory.STANDARD, SeatCategory.GOLD, SeatCategory.PLATINUM, SeatCategory.VIP]
+
+
+def seed(db, rows: int, seats_per_row: int) -> int:
+    cinema = db.query(Cinema).filter(Cinema.city == CITY).first()
+    if cinema:
+        return db.query(Showtime.id).filter(Showtime.cinema_id == cinema.id).scalar()
+
+    cinema = Cinema(name="Pricing Benchmark Cinema", city=CITY)
+    db.add(cinema)
+    db.flush()
+    screen = Screen(cinema_id=cinema.id, screen_number=1, total_seats=rows * seats_per_row)
+    db.add(screen)
+    db.flush()
+    db.add_all([
+        Seat(screen_id=screen.id, row=chr(ord("A") + row), seat_number=number + 1,
+             category=CATEGORIES[row * len(CATEGORIES) // rows])
+        for row in range(rows)
+        for number in range(seats_per_row)
+    ])
+    start = datetime.combine(datetime.utcnow().date() + timedelta(days=1), datetime.min.time()) + timedelta(hours=20)
+    showtime = Showtime(
+        movie_id=1, screen_id=screen.id, cinema_id=cinema.id, start_time=start,
+        end_time=start + timedelta(hours=2), base_price=12.5, available_seats=rows * seats_per_row
+    )
+    db.add(showtime)
+    db.commit()
+    return showtime.id
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure ticket quotes against the compiled per-showtime price table")
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--seats-per-row", type=int, default=20)
+    parser.add_argument("--tickets", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10000)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        showtime_id = seed(db, args.rows, args.seats_per_row)
+        screen_id = db.query(Showtime.screen_id).filter(Showtime.id == showtime_id).scalar()
+        seat_ids = [
+            seat_id for (seat_id,) in db.query(Seat.id).filter(
+                Seat.screen_id == screen_id
+            ).order_by(Seat.id.desc()).limit(args.tickets)
+        ]
+        price_tables.clear()
+        pricing_service = PricingService(db)
+
+        with count_queries() as stats:
+            start = time.perf_counter()
+            quote = pricing_service.quote(showtime_id, seat_ids)
+            cold = (time.perf_counter() - start) * 1e6
+        print(f"cold   queries={stats.count:<3} {cold:10.1f} us  total={quote['total']:.2f}")
+
+        timings = []
+        with count_queries() as stats:
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                pricing_service.quote(showtime_id, seat_ids)
+                timings.append((time.perf_counter() - start) * 1e6)
+        timings.sort()
+        print(
+            f"warm   queries={stats.count:<3} median={statistics.median(timings):7.1f} us  "
+            f"p99={timings[int(len(timings) * 0.99) - 1]:7.1f} us  ({args.tickets} tickets, {args.repeat} quotes)"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark_scan.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("FIREBASE_PROJECT_ID", "benchmark")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY_ID", "benchmark")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY", "benchmark")
+os.environ.setdefault("FIREBASE_CLIENT_EMAIL", "benchmark@example.com")
+os.environ.setdefault("FIREBASE_CLIENT_ID", "benchmark")
+
+from app.db.query_counter import count_queries
+from app.db.session import SessionLocal, init_db
+from app.models.domain.booking import Booking, BookingStatus, Ticket
+from app.models.domain.showtime import Showtime
+from app.services.booking_service import TicketService, ticket_signer
+
+
+def seed(db, tickets: int):
+    start = datetime.utcnow() + timedelta(hours=1)
+    showtime = Showtime(
+        movie_id=1, screen_id=1, cinema_id=1, start_time=start,
+        end_time=start + timedelta(hours=2), base_price=10.0, available_seats=0
+    )
+    db.add(showtime)
+    db.flush()
+    booking = Booking(
+        user_id=1, showtime_id=showtime.id, total_price=10.0 * tickets, status=BookingStatus.CONFIRMED
+    )
+    db.add(booking)
+    db.flush()
+    rows = [
+        Ticket(booking_id=booking.id, seat_id=seat_id, ticket_category="standard", price=10.0)
+        for seat_id in range(1, tickets + 1)
+    ]
+    db.add_all(rows)
+    db.flush()
+    for ticket in rows:
+        ticket.qr_code = ticket_signer.sign(ticket.id, showtime.id, ticket.seat_id)
+    db.commit()
+    return showtime.id, [ticket.qr_code for ticket in rows]
+
+
+def report(label: str, scans: int, elapsed: float, queries: int, admitted: int):
+    print(
+        f"{label:<8} {scans / elapsed:10.0f} scans/s  {elapsed / scans * 1e6:8.1f} us/scan  "
+        f"queries={queries:<5} admitted={admitted}/{scans}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure gate validation throughput for signed ticket payloads")
+    parser.add_argument("--tickets", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        showtime_id, payloads = seed(db, args.tickets)
+        ticket_service = TicketService(db)
+
+        start = time.perf_counter()
+        for payload in payloads:
+            ticket_signer.verify(payload)
+        elapsed = time.perf_counter() - start
+        print(f"verify   {len(payloads) / elapsed:10.0f} scans/s  {elapsed / len(payloads) * 1e6:8.1f} us/scan  queries=0")
+
+        half = len(payloads) // 2
+        admitted = 0
+        with count_queries() as stats:
+            start = time.perf_counter()
+            for payload in payloads[:half]:
+                admitted += ticket_service.scan_tickets([(payload, None)], showtime_id)["admitted"]
+            elapsed = time.perf_counter() - start
+        report("single", half, elapsed, stats.count, admitted)
+
+        batched = payloads[half:]
+        admitted = 0
+        with count_queries() as stats:
+            start = time.perf_counter()
+            for offset in range(0, len(batched), args.batch_size):
+                chunk = batched[offset:offset + args.batch_size]
+                admitted += ticket_service.scan_tickets([(payload, None) for payload in chunk], showtime_id)["admitted"]
+            elapsed = time.perf_counter() - start
+        report(f"batch{args.batch_size}", len(batched), elapsed, stats.count, admitted)
+
+        with count_queries() as stats:
+            start = time.perf_counter()
+            result = ticket_service.scan_tickets([(payload, None) for payload in payloads[:args.batch_size]], showtime_id)
+            elapsed = time.perf_counter() - start
+        report("replay", args.batch_size, elapsed, stats.count, result["admitted"])
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import argparse
+from app.db.session import SessionLocal, init_db
+from app.services.booking_service import BookingService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cancel pending bookings whose payment never completed")
+    parser.add_argument("--batch-size", type=int, help="Bookings cancelled per transaction")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        result = BookingService(db).expire_pending_bookings(batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(
+        f"Cancelled {result['cancelled']} bookings made before {result['cutoff'].isoformat()} "
+        f"in {result['batches']} batches, released {result['seats_released']} seats "
+        f"across {result['showtimes_affected']} showtimes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import argparse
+from app.db.session import SessionLocal, init_db
+from app.services.review_service import ReviewService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild per-movie rating aggregates from approved reviews")
+    parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        result = ReviewService(db).recompute_rating_aggregates()
+    finally:
+        db.close()
+
+    print(f"Checked {result['checked']} movies, corrected {result['corrected']}")
+    for correction in result["corrections"]:
+        print(
+            f"  movie {correction['movie_id']}: "
+            f"{correction['stored_count']} reviews / {correction['stored_sum']:g} -> "
+            f"{correction['expected_count']} reviews / {correction['expected_sum']:g}"
+        )
+
+
+if __name__ == "__main__":
+    main()
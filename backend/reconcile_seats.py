@@ -0,0 +1,27 @@
+import argparse
+from datetime import datetime
+from app.db.session import SessionLocal, init_db
+from app.services.showtime_service import ShowtimeService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute Showtime.available_seats from booked tickets")
+    parser.add_argument("--since", help="Only showtimes starting at or after this time (ISO format, default now)")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        result = ShowtimeService(db).reconcile_available_seats(
+            datetime.fromisoformat(args.since) if args.since else None
+        )
+    finally:
+        db.close()
+
+    print(f"Corrected {result['corrected']} showtimes starting from {result['since'].isoformat()}")
+    for correction in result["corrections"]:
+        print(f"  showtime {correction['showtime_id']}: {correction['stored']} -> {correction['expected']}")
+
+
+if __name__ == "__main__":
+    main()
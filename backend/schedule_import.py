@@ -0,0 +1,78 @@
+import argparse
+import sys
+from datetime import date, datetime
+from app.db.session import SessionLocal, init_db
+from app.models.schemas.showtime_schema import BulkScheduleCreate
+from app.services.showtime_service import ShowtimeService, ScheduleImportError
+from app.utils.schedule_file import parse_schedule_file
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate or import showtimes in bulk")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="Generate showtimes from slot rules")
+    generate.add_argument("--movie-id", type=int, required=True)
+    generate.add_argument("--screens", required=True, help="Comma-separated screen ids")
+    generate.add_argument("--from", dest="start_date", required=True, help="First day (YYYY-MM-DD)")
+    generate.add_argument("--to", dest="end_date", required=True, help="Last day (YYYY-MM-DD)")
+    generate.add_argument("--slots", required=True, help="Comma-separated start times (HH:MM)")
+    generate.add_argument("--weekdays", help="Comma-separated weekdays, 0=Monday")
+    generate.add_argument("--price", type=float, required=True)
+
+    load = subparsers.add_parser("import", help="Import showtimes from a CSV or JSON file")
+    load.add_argument("file", help="CSV with movie_id,screen_id,start_time,base_price columns or a JSON list")
+
+    for subparser in (generate, load):
+        subparser.add_argument("--skip-conflicts", action="store_true", help="Insert valid rows and report the rest")
+        subparser.add_argument("--dry-run", action="store_true", help="Validate without inserting")
+
+    return parser.parse_args()
+
+
+def print_result(result: dict):
+    print(f"Requested: {result['requested']}")
+    print(f"{'Valid' if result['dry_run'] else 'Created'}: {result['created']}")
+    print(f"Rejected: {len(result['rejected'])}")
+    for rejection in result["rejected"][:20]:
+        print(f"  row {rejection['row']} screen {rejection['screen_id']} at {rejection['start_time']}: {rejection['reason']}")
+    if len(result["rejected"]) > 20:
+        print(f"  ... {len(result['rejected']) - 20} more")
+    print(f"Elapsed: {result['elapsed_ms']:.1f} ms ({result['rows_per_second']:.0f} showtimes/s)")
+
+
+def main():
+    args = parse_args()
+    init_db()
+    db = SessionLocal()
+    try:
+        showtime_service = ShowtimeService(db)
+        if args.command == "generate":
+            rows = showtime_service.generate_schedule(BulkScheduleCreate(
+                movie_id=args.movie_id,
+                screen_ids=[int(value) for value in args.screens.split(",")],
+                start_date=date.fromisoformat(args.start_date),
+                end_date=date.fromisoformat(args.end_date),
+                slots=[datetime.strptime(value.strip(), "%H:%M").time() for value in args.slots.split(",")],
+                weekdays=[int(value) for value in args.weekdays.split(",")] if args.weekdays else None,
+                base_price=args.price
+            ))
+        else:
+            with open(args.file, encoding="utf-8-sig") as f:
+                rows = parse_schedule_file(f.read(), args.file)
+
+        result = showtime_service.import_showtimes(rows, args.skip_conflicts, args.dry_run)
+        print_result(result)
+    except ScheduleImportError as e:
+        print(f"Import aborted: {e}")
+        print_result(e.result)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+import os
+import tempfile
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("FIREBASE_PROJECT_ID", "test")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY_ID", "test")
+os.environ.setdefault("FIREBASE_PRIVATE_KEY", "test")
+os.environ.setdefault("FIREBASE_CLIENT_EMAIL", "test@example.com")
+os.environ.setdefault("FIREBASE_CLIENT_ID", "test")
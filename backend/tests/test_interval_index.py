@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+from app.utils.interval_index import IntervalIndex, ScheduleIndex
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 1, 1, hour, minute)
+
+
+def test_finds_overlap_hidden_behind_nested_predecessor():
+    index = IntervalIndex()
+    index.add(1, at(10), at(14))
+    index.add(2, at(11), at(11, 30))
+
+    assert index.find_overlap(at(13), at(13, 30)) == (at(10), at(14), 1)
+
+
+def test_nested_predecessor_respects_exclude_id():
+    index = IntervalIndex()
+    index.add(1, at(10), at(14))
+    index.add(2, at(11), at(11, 30))
+
+    assert index.find_overlap(at(13), at(13, 30), exclude_id=1) is None
+
+
+def test_gap_extends_predecessor_end():
+    index = IntervalIndex()
+    index.add(1, at(10), at(12))
+
+    assert index.find_overlap(at(12, 10), at(13)) is None
+    assert index.find_overlap(at(12, 10), at(13), gap=timedelta(minutes=15)) == (at(10), at(12), 1)
+
+
+def test_finds_successor_overlap():
+    index = IntervalIndex()
+    index.add(1, at(15), at(17))
+
+    assert index.find_overlap(at(13), at(15)) is None
+    assert index.find_overlap(at(13), at(15, 1)) == (at(15), at(17), 1)
+
+
+def test_removed_interval_no_longer_conflicts():
+    index = IntervalIndex()
+    index.add(1, at(10), at(14))
+    index.add(2, at(11), at(11, 30))
+    index.remove(1)
+
+    assert len(index) == 1
+    assert index.find_overlap(at(13), at(13, 30)) is None
+
+
+def test_schedule_index_applies_buffer_per_screen():
+    schedule = ScheduleIndex(buffer=timedelta(minutes=30))
+    schedule.add(1, 10, at(10), at(12))
+
+    assert schedule.find_conflict(1, at(12, 15), at(14)) == (at(10), at(12), 10)
+    assert schedule.find_conflict(2, at(12, 15), at(14)) is None
+    assert schedule.find_conflict(1, at(12, 30), at(14)) is None
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+import pytest
+from app.db.query_counter import assert_max_queries, assert_num_queries
+from app.db.session import SessionLocal, init_db
+from app.models.domain.cinema import Cinema, Screen
+from app.models.domain.seat import Seat, SeatCategory
+from app.models.domain.showtime import Showtime
+from app.services.pricing_service import PricingService, price_tables
+
+
+@pytest.fixture
+def db():
+    init_db()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def showtime(db):
+    cinema = Cinema(name="Query Budget Cinema", city="Query Budget City")
+    db.add(cinema)
+    db.flush()
+    screen = Screen(cinema_id=cinema.id, screen_number=1, total_seats=4)
+    db.add(screen)
+    db.flush()
+    seats = [
+        Seat(screen_id=screen.id, row="A", seat_number=number, category=category)
+        for number, category in enumerate([SeatCategory.STANDARD, SeatCategory.STANDARD,
+                                           SeatCategory.GOLD, SeatCategory.VIP], start=1)
+    ]
+    db.add_all(seats)
+    start = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+    showtime = Showtime(
+        movie_id=1, screen_id=screen.id, cinema_id=cinema.id, start_time=start,
+        end_time=start + timedelta(hours=2), base_price=10.0, available_seats=len(seats)
+    )
+    db.add(showtime)
+    db.commit()
+    price_tables.clear()
+    return showtime.id, [seat.id for seat in seats]
+
+
+def test_cold_quote_compiles_price_table_in_bounded_queries(db, showtime):
+    showtime_id, seat_ids = showtime
+
+    with assert_max_queries(2):
+        quote = PricingService(db).quote(showtime_id, seat_ids)
+
+    assert len(quote["tickets"]) == len(seat_ids)
+
+
+def test_warm_quote_runs_no_queries(db, showtime):
+    showtime_id, seat_ids = showtime
+    pricing_service = PricingService(db)
+    cold = pricing_service.quote(showtime_id, seat_ids)
+
+    with assert_num_queries(0):
+        warm = pricing_service.quote(showtime_id, seat_ids)
+
+    assert warm["total"] == cold["total"]
+
+
+def test_assert_num_queries_reports_unexpected_statements(db, showtime):
+    showtime_id, seat_ids = showtime
+
+    with pytest.raises(AssertionError, match="Expected 0 queries, got"):
+        with assert_num_queries(0):
+            PricingService(db).quote(showtime_id, seat_ids)